@@ -0,0 +1,86 @@
+"""
+Benchmarks for the time taken to import matplotview, compatible with asv
+(airspeed velocity), and runnable as a standalone script::
+
+    python -m benchmarks.import_time
+
+Every import is timed in a fresh interpreter. matplotview depends on
+`matplotlib.axes`, which dominates the total import time, so the time to
+import matplotview after matplotlib has already been imported is reported
+separately, as that's the part this library controls. Run with bytecode
+caching enabled (without PYTHONDONTWRITEBYTECODE), or the times include
+compiling the sources.
+"""
+import statistics
+import subprocess
+import sys
+
+REPEATS = 10
+
+_TIME_IMPORT = """
+import time
+import matplotlib.axes
+start = time.perf_counter()
+import matplotview
+print(time.perf_counter() - start)
+"""
+
+
+def timeraw_import_matplotview():
+    return "import matplotview"
+
+
+def timeraw_import_matplotlib_axes():
+    return "import matplotlib.axes"
+
+
+def track_import_matplotview_own():
+    return measure_own()
+
+
+track_import_matplotview_own.unit = "seconds"
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True
+    ).stdout
+
+
+def measure_total(code: str, repeats: int = REPEATS) -> float:
+    """
+    Measure the median time to run a snippet of code in a fresh interpreter,
+    in seconds, including starting the interpreter.
+    """
+    timer = "import time; start = time.perf_counter(); {}; " \
+        "print(time.perf_counter() - start)"
+    return statistics.median(
+        float(_run(timer.format(code))) for __ in range(repeats)
+    )
+
+
+def measure_own(repeats: int = REPEATS) -> float:
+    """
+    Measure the median time to import matplotview once matplotlib has been
+    imported, in seconds.
+    """
+    return statistics.median(
+        float(_run(_TIME_IMPORT)) for __ in range(repeats)
+    )
+
+
+def main():
+    # Run once first, so bytecode caches are written...
+    _run("import matplotview")
+
+    axes = measure_total("import matplotlib.axes")
+    total = measure_total("import matplotview")
+    own = measure_own()
+    print(f"{'import matplotlib.axes':<32}{axes * 1000:>10.1f} ms")
+    print(f"{'import matplotview':<32}{total * 1000:>10.1f} ms")
+    print(f"{'  after matplotlib.axes':<32}{own * 1000:>10.1f} ms")
+
+
+if (__name__ == "__main__"):
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmarks for appending live data to a line displayed by views, compatible
+with asv (airspeed velocity), and runnable as a standalone script::
+
+    python -m benchmarks.streaming
+
+A source axes holds a line of the most recent samples, and an inset zoom
+shows the last part of it. Each frame appends a chunk of samples and redraws
+the figure, either with a `StreamingLine2D` ("streaming") or by calling
+`Line2D.set_data` with the new window ("set_data", the baseline). Both
+linear and log scaled source axes are measured, as the non-affine transform
+of the log scale is what streaming avoids recomputing.
+"""
+import time
+
+import numpy as np
+from matplotlib.lines import Line2D
+
+from matplotview import inset_zoom_axes, StreamingLine2D
+from benchmarks.view_rendering import _new_figure, draw_figure
+
+ARTISTS = ["streaming", "set_data"]
+SCALES = ["linear", "log"]
+CHUNK_SIZES = [10, 1000]
+CAPACITY = 200_000
+
+
+class _LiveLine:
+    """
+    A figure showing a window of the most recent samples of a signal, which
+    is advanced by one chunk on each call to `step`.
+    """
+    def __init__(self, artist: str, scale: str, chunk_size: int):
+        self.artist = artist
+        self.chunk_size = chunk_size
+        self.t = 0
+
+        self.fig = _new_figure()
+        self.ax = self.fig.subplots()
+        self.ax.set_yscale(scale)
+        if (artist == "streaming"):
+            self.line = self.ax.add_line(StreamingLine2D(CAPACITY))
+        else:
+            self.x = np.empty(0)
+            self.y = np.empty(0)
+            self.line = self.ax.add_line(Line2D(self.x, self.y))
+
+        self.inset = inset_zoom_axes(self.ax, [0.6, 0.6, 0.35, 0.35])
+        self.inset.set_yscale(scale)
+        self.ax.set_ylim(1, 3)
+        self.inset.set_ylim(1, 3)
+
+        # Fill the buffer, so every frame also drops samples.
+        for __ in range(CAPACITY // 10_000):
+            self._append(10_000)
+        self._update_limits()
+        draw_figure(self.fig)
+
+    def _append(self, n: int):
+        x = np.arange(self.t, self.t + n, dtype=float)
+        y = 2 + np.sin(x / 1000)
+        self.t += n
+
+        if (self.artist == "streaming"):
+            self.line.append(x, y)
+        else:
+            self.x = np.concatenate([self.x, x])[-CAPACITY:]
+            self.y = np.concatenate([self.y, y])[-CAPACITY:]
+            self.line.set_data(self.x, self.y)
+
+    def _update_limits(self):
+        self.ax.set_xlim(self.t - CAPACITY, self.t)
+        self.inset.set_xlim(self.t - CAPACITY // 50, self.t)
+
+    def step(self):
+        self._append(self.chunk_size)
+        self._update_limits()
+        draw_figure(self.fig)
+
+
+class StreamingAppend:
+    """
+    Time appending one chunk of samples and redrawing the figure.
+    """
+    params = [ARTISTS, SCALES, CHUNK_SIZES]
+    param_names = ["artist", "scale", "chunk_size"]
+
+    def setup(self, *params):
+        self.live = _LiveLine(*params)
+
+    def time_append_and_draw(self, *params):
+        self.live.step()
+
+    def track_samples_per_second(self, *params):
+        return measure(*params, live=self.live)
+
+    track_samples_per_second.unit = "samples/s"
+
+
+def measure(
+    artist: str,
+    scale: str,
+    chunk_size: int,
+    frames: int = 20,
+    live: _LiveLine = None
+) -> float:
+    """
+    Measure the append throughput of a configuration, in samples appended
+    and drawn per second.
+    """
+    if (live is None):
+        live = _LiveLine(artist, scale, chunk_size)
+
+    start = time.perf_counter()
+    for __ in range(frames):
+        live.step()
+    return frames * chunk_size / (time.perf_counter() - start)
+
+
+def main():
+    header = (
+        f"{'scale':<8}{'chunk':>8}"
+        + "".join(f"{artist + ' (samples/s)':>26}" for artist in ARTISTS)
+        + f"{'speedup':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for scale in SCALES:
+        for chunk_size in CHUNK_SIZES:
+            results = [
+                measure(artist, scale, chunk_size) for artist in ARTISTS
+            ]
+            print(
+                f"{scale:<8}{chunk_size:>8}"
+                + "".join(f"{r:>26.0f}" for r in results)
+                + f"{results[0] / results[1]:>10.2f}"
+            )
+
+
+if (__name__ == "__main__"):
+    main()
@@ -0,0 +1,490 @@
+"""
+Benchmarks for drawing views, compatible with asv (airspeed velocity), and
+runnable as a standalone script::
+
+    python -m benchmarks.view_rendering
+
+Every scenario is built in two modes, "view", where the data is plotted once
+and displayed a second time through matplotview, and "twice", the baseline,
+where the data is simply plotted again in the second axes. For each scenario
+the wall time of a figure draw, the peak memory during the draw and the
+number of primitives submitted to the backend renderer are reported.
+"""
+import time
+import tracemalloc
+from collections import Counter
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.image import _interpd_
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D
+import mpl_toolkits.mplot3d  # noqa: F401, registers the 3d projection.
+
+from matplotview import view, view_many, inset_zoom_axes
+
+MODES = ["view", "twice"]
+INTERPOLATIONS = list(_interpd_)
+
+# Draw methods of the backend renderer that are counted as primitives.
+DRAW_METHODS = (
+    "draw_path",
+    "draw_markers",
+    "draw_path_collection",
+    "draw_quad_mesh",
+    "draw_gouraud_triangle",
+    "draw_gouraud_triangles",
+    "draw_image",
+    "draw_text",
+    "draw_tex"
+)
+
+
+def _new_figure(**kwargs) -> Figure:
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def draw_figure(fig: Figure):
+    """
+    Draw a figure with its canvas, as is done when saving or showing it.
+    """
+    fig.canvas.draw()
+
+
+def count_primitives(fig: Figure) -> Counter:
+    """
+    Draw a figure, counting the calls made to each draw method of the backend
+    renderer.
+
+    Parameters
+    ----------
+    fig: Figure
+        The figure to draw, must have an Agg canvas.
+
+    Returns
+    -------
+    Counter
+        A mapping of draw method names to the number of times they were
+        called.
+    """
+    counts = Counter()
+    renderer = fig.canvas.get_renderer()
+    originals = {}
+
+    def counter(name, func):
+        def counted(*args, **kwargs):
+            counts[name] += 1
+            return func(*args, **kwargs)
+        return counted
+
+    for name in DRAW_METHODS:
+        if (hasattr(renderer, name)):
+            originals[name] = renderer.__dict__.get(name, None)
+            setattr(renderer, name, counter(name, getattr(renderer, name)))
+
+    try:
+        fig.draw(renderer)
+    finally:
+        for name, func in originals.items():
+            if (func is None):
+                delattr(renderer, name)
+            else:
+                setattr(renderer, name, func)
+
+    return counts
+
+
+def build_lines(mode: str) -> Figure:
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 100, 100_000)
+
+    fig = _new_figure()
+    ax1, ax2 = fig.subplots(1, 2)
+    for i in range(5):
+        y = np.cumsum(rng.normal(size=x.size)) + i * 50
+        ax1.plot(x, y)
+        if (mode == "twice"):
+            ax2.plot(x, y)
+
+    if (mode == "view"):
+        view(ax2, ax1)
+    ax2.set_xlim(40, 60)
+    ax2.set_ylim(ax1.get_ylim())
+    return fig
+
+
+def build_scatter(mode: str, scale_lines: bool = True) -> Figure:
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=(2, 10_000))
+    colors = rng.random(10_000)
+
+    fig = _new_figure()
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.scatter(x, y, c=colors)
+    if (mode == "view"):
+        view(ax2, ax1, scale_lines=scale_lines)
+    else:
+        ax2.scatter(x, y, c=colors)
+    ax2.set_xlim(-0.5, 0.5)
+    ax2.set_ylim(-0.5, 0.5)
+    return fig
+
+
+def build_image(mode: str, interpolation: str = "nearest") -> Figure:
+    rng = np.random.default_rng(0)
+    im_data = rng.random((1000, 1000))
+
+    fig = _new_figure()
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.imshow(im_data, origin="lower", interpolation=interpolation)
+    if (mode == "view"):
+        view(ax2, ax1, image_interpolation=interpolation)
+    else:
+        ax2.imshow(im_data, origin="lower", interpolation=interpolation)
+    ax2.set_xlim(450, 550)
+    ax2.set_ylim(450, 550)
+    return fig
+
+
+def build_pcolormesh(mode: str) -> Figure:
+    rng = np.random.default_rng(0)
+    data = rng.random((300, 300))
+
+    fig = _new_figure()
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.pcolormesh(data)
+    if (mode == "view"):
+        view(ax2, ax1)
+    else:
+        ax2.pcolormesh(data)
+    ax2.set_xlim(100, 130)
+    ax2.set_ylim(100, 130)
+    return fig
+
+
+def build_polygons(mode: str) -> Figure:
+    # A choropleth-like collection of 20k polygons, few within the view.
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 140, size=(20_000, 1, 2))
+    polys = centers + rng.uniform(-0.5, 0.5, size=(20_000, 6, 2))
+    values = rng.random(20_000)
+
+    fig = _new_figure()
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.add_collection(PolyCollection(polys, array=values))
+    ax1.set_xlim(0, 140)
+    ax1.set_ylim(0, 140)
+    if (mode == "view"):
+        view(ax2, ax1)
+    else:
+        ax2.add_collection(PolyCollection(polys, array=values))
+    ax2.set_xlim(10, 15)
+    ax2.set_ylim(10, 15)
+    return fig
+
+
+def build_gouraud(mode: str) -> Figure:
+    # About 500k triangles, most outside the zoomed in view.
+    x, y = np.meshgrid(np.linspace(0, 10, 500), np.linspace(0, 10, 500))
+    x, y = x.ravel(), y.ravel()
+    z = np.sin(x) * np.cos(y)
+
+    fig = _new_figure()
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.tripcolor(x, y, z, shading="gouraud")
+    if (mode == "view"):
+        view(ax2, ax1)
+    else:
+        ax2.tripcolor(x, y, z, shading="gouraud")
+    ax2.set_xlim(4, 5)
+    ax2.set_ylim(4, 5)
+    return fig
+
+
+def build_3d(mode: str) -> Figure:
+    x = y = np.linspace(-5, 5, 60)
+    x, y = np.meshgrid(x, y)
+    z = np.sin(np.sqrt(x ** 2 + y ** 2))
+
+    fig = _new_figure()
+    ax1, ax2 = fig.subplots(1, 2, subplot_kw=dict(projection="3d"))
+    ax1.plot_surface(x, y, z, cmap="plasma")
+    if (mode == "view"):
+        view(ax2, ax1)
+    else:
+        ax2.plot_surface(x, y, z, cmap="plasma")
+    ax2.view_init(elev=80)
+    ax2.set_xlim(-10, 10)
+    ax2.set_ylim(-10, 10)
+    ax2.set_zlim(-2, 2)
+    return fig
+
+
+def build_polar(mode: str) -> Figure:
+    r = np.linspace(0, 2, 100_000)
+    theta = 40 * np.pi * r
+
+    fig = _new_figure()
+    ax1, ax2 = fig.subplots(1, 2, subplot_kw=dict(projection="polar"))
+    ax1.plot(theta, r)
+    ax1.set_rmax(2)
+    if (mode == "view"):
+        view(ax2, ax1, scale_lines=False)
+    else:
+        ax2.plot(theta, r)
+    ax2.set_rmax(1)
+    return fig
+
+
+def build_geographic(mode: str) -> Figure:
+    # Random walks standing in for coastlines...
+    rng = np.random.default_rng(0)
+    starts = rng.uniform((-3, -1.4), (3, 1.4), size=(300, 1, 2))
+    coasts = starts + np.cumsum(rng.normal(0, 0.005, (300, 200, 2)), axis=1)
+    coasts[..., 0] = np.clip(coasts[..., 0], -np.pi, np.pi)
+    coasts[..., 1] = np.clip(coasts[..., 1], -np.pi / 2, np.pi / 2)
+
+    fig = _new_figure()
+    ax1 = fig.add_subplot(1, 2, 1, projection="hammer")
+    ax2 = fig.add_subplot(1, 2, 2, projection="lambert")
+    for coast in coasts:
+        ax1.plot(coast[:, 0], coast[:, 1], "k", lw=0.5)
+        if (mode == "twice"):
+            ax2.plot(coast[:, 0], coast[:, 1], "k", lw=0.5)
+
+    if (mode == "view"):
+        view(ax2, ax1)
+    return fig
+
+
+SIERPINSKI_LOCATIONS = [
+    [0, 0, 0.5, 0.5],
+    [0.5, 0, 0.5, 0.5],
+    [0.25, 0.5, 0.5, 0.5]
+]
+
+
+def build_sierpinski(mode: str, depth: int = 5) -> Figure:
+    outer = Path.unit_regular_polygon(3)
+    inner = Affine2D().scale(-0.5).transform_path(outer)
+    b = outer.get_extents()
+
+    fig = _new_figure()
+    ax = fig.subplots()
+    ax.set_aspect(1)
+    ax.set_xlim(b.x0, b.x1)
+    ax.set_ylim(b.y0, b.y1)
+
+    def add_triangles(trans):
+        ax.add_patch(PathPatch(trans.transform_path(outer), fc="black",
+                               ec=[0] * 4))
+        ax.add_patch(PathPatch(trans.transform_path(inner), fc="white",
+                               ec=[0] * 4))
+
+    if (mode == "view"):
+        add_triangles(Affine2D())
+        for loc in SIERPINSKI_LOCATIONS:
+            inax = inset_zoom_axes(ax, loc, render_depth=depth)
+            inax.set_xlim(b.x0, b.x1)
+            inax.set_ylim(b.y0, b.y1)
+            inax.axis("off")
+            inax.patch.set_visible(False)
+        return fig
+
+    # Baseline, every level of the recursion is plotted explicitly.
+    def to_location(loc):
+        x, y, w, h = loc
+        return (
+            Affine2D().translate(-b.x0, -b.y0).scale(w, h)
+            .translate(x * b.width + b.x0, y * b.height + b.y0)
+        )
+
+    level = [Affine2D()]
+    for __ in range(depth + 1):
+        for trans in level:
+            add_triangles(trans)
+        level = [
+            trans + to_location(loc)
+            for trans in level for loc in SIERPINSKI_LOCATIONS
+        ]
+    return fig
+
+
+def build_many_views(
+    mode: str, bulk: bool = False, n_views: int = 16
+) -> Figure:
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0, 10, size=(2, 20_000))
+
+    fig = _new_figure(figsize=(10, 6))
+    src_ax = fig.add_subplot(1, 2, 1)
+    src_ax.scatter(x, y, s=2)
+
+    side = int(np.ceil(np.sqrt(n_views)))
+    grid = fig.add_gridspec(side, 2 * side)
+    axs = [
+        fig.add_subplot(grid[i // side, side + i % side])
+        for i in range(n_views)
+    ]
+    if (mode == "view" and bulk):
+        view_many(axs, src_ax, scale_lines=False)
+    for i, ax in enumerate(axs):
+        if (mode == "view" and not bulk):
+            view(ax, src_ax, scale_lines=False)
+        elif (mode != "view"):
+            ax.scatter(x, y, s=2)
+        cx, cy = (i % side) * 10 / side, (i // side) * 10 / side
+        ax.set_xlim(cx, cx + 10 / side)
+        ax.set_ylim(cy, cy + 10 / side)
+        ax.set_xticks([])
+        ax.set_yticks([])
+    return fig
+
+
+class _ViewRenderingBenchmark:
+    """
+    Base benchmark, times full figure draws of a figure built by the
+    builder function. The first parameter is always the mode.
+    """
+    params = [MODES]
+    param_names = ["mode"]
+    builder = None
+
+    def setup(self, *params):
+        self.fig = type(self).builder(*params)
+        # Draw once, so the timings cover redraws, and not one time setup
+        # like text layout.
+        draw_figure(self.fig)
+
+    def time_draw(self, *params):
+        draw_figure(self.fig)
+
+    def peakmem_draw(self, *params):
+        draw_figure(self.fig)
+
+    def track_primitives(self, *params):
+        return sum(count_primitives(self.fig).values())
+
+    track_primitives.unit = "primitives"
+
+
+class Lines(_ViewRenderingBenchmark):
+    builder = staticmethod(build_lines)
+
+
+class Scatter(_ViewRenderingBenchmark):
+    params = [MODES, [True, False]]
+    param_names = ["mode", "scale_lines"]
+    builder = staticmethod(build_scatter)
+
+
+class Images(_ViewRenderingBenchmark):
+    params = [MODES, INTERPOLATIONS]
+    param_names = ["mode", "interpolation"]
+    builder = staticmethod(build_image)
+
+
+class PColorMesh(_ViewRenderingBenchmark):
+    builder = staticmethod(build_pcolormesh)
+
+
+class Polygons(_ViewRenderingBenchmark):
+    builder = staticmethod(build_polygons)
+
+
+class Gouraud(_ViewRenderingBenchmark):
+    builder = staticmethod(build_gouraud)
+
+
+class Surface3D(_ViewRenderingBenchmark):
+    builder = staticmethod(build_3d)
+
+
+class Polar(_ViewRenderingBenchmark):
+    builder = staticmethod(build_polar)
+
+
+class Geographic(_ViewRenderingBenchmark):
+    builder = staticmethod(build_geographic)
+
+
+class Sierpinski(_ViewRenderingBenchmark):
+    builder = staticmethod(build_sierpinski)
+
+
+class ManyViews(_ViewRenderingBenchmark):
+    params = [MODES, [False, True]]
+    param_names = ["mode", "bulk"]
+    builder = staticmethod(build_many_views)
+
+
+SCENARIOS: Dict[str, Tuple[Callable[..., Figure], list]] = {
+    "lines": (build_lines, [()]),
+    "scatter": (build_scatter, [(True,), (False,)]),
+    "image": (build_image, [(interp,) for interp in INTERPOLATIONS]),
+    "pcolormesh": (build_pcolormesh, [()]),
+    "polygons": (build_polygons, [()]),
+    "gouraud": (build_gouraud, [()]),
+    "3d": (build_3d, [()]),
+    "polar": (build_polar, [()]),
+    "geographic": (build_geographic, [()]),
+    "sierpinski": (build_sierpinski, [()]),
+    "many_views": (build_many_views, [(False,), (True,)])
+}
+
+
+def measure(builder: Callable[..., Figure], *params, repeat: int = 5):
+    """
+    Measure a single scenario, returning the best wall time in seconds, the
+    peak traced memory in bytes, and the number of primitives drawn.
+    """
+    fig = builder(*params)
+    draw_figure(fig)
+
+    best = np.inf
+    for __ in range(repeat):
+        start = time.perf_counter()
+        draw_figure(fig)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        draw_figure(fig)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    primitives = sum(count_primitives(fig).values())
+    return best, peak, primitives
+
+
+def main():
+    header = (
+        f"{'scenario':<30}{'mode':<8}{'time (ms)':>12}{'ratio':>8}"
+        f"{'peak (MiB)':>12}{'primitives':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for name, (builder, param_list) in SCENARIOS.items():
+        for params in param_list:
+            label = name + "".join(f"[{p}]" for p in params)
+            results = {
+                mode: measure(builder, mode, *params) for mode in MODES
+            }
+            for mode, (wall, peak, prims) in results.items():
+                ratio = wall / results["twice"][0]
+                print(
+                    f"{label:<30}{mode:<8}{wall * 1000:>12.2f}{ratio:>8.2f}"
+                    f"{peak / 2 ** 20:>12.2f}{prims:>12}"
+                )
+
+
+if (__name__ == "__main__"):
+    main()
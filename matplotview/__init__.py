@@ -1,16 +1,39 @@
-from typing import Optional, Iterable, Type, Union
+from typing import Callable, Optional, Iterable, List, Type, Union
 from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 from matplotlib.transforms import Transform
 from matplotview._view_axes import (
     view_wrapper,
     ViewSpecification,
-    DEFAULT_RENDER_DEPTH
+    DEFAULT_RENDER_DEPTH,
+    _CullingGroup
+)
+from matplotview._render_stats import RenderStats  # noqa: F401
+from matplotview._tracing import trace_views, ViewTracer  # noqa: F401
+from matplotview._streaming import StreamingLine2D
+from matplotview._data_provider import (
+    ViewDataProvider,
+    MultiResolutionLineProvider,
+    DataProviderLine2D,
+    MultiResolutionImageProvider,
+    DataProviderImage
 )
 from matplotview._docs import dynamic_doc_string, get_interpolation_list_str
 
 
-__all__ = ["view", "stop_viewing", "inset_zoom_axes"]
+__all__ = [
+    "view",
+    "view_many",
+    "stop_viewing",
+    "inset_zoom_axes",
+    "trace_views",
+    "StreamingLine2D",
+    "ViewDataProvider",
+    "MultiResolutionLineProvider",
+    "DataProviderLine2D",
+    "MultiResolutionImageProvider",
+    "DataProviderImage"
+]
 
 
 @dynamic_doc_string(
@@ -22,7 +45,9 @@ def view(
     axes_to_view: Axes,
     image_interpolation: str = "nearest",
     render_depth: Optional[int] = None,
-    filter_set: Optional[Iterable[Union[Type[Artist], Artist]]] = None,
+    filter_set: Optional[
+        Iterable[Union[Type[Artist], Artist, Callable[[Artist], bool]]]
+    ] = None,
     scale_lines: bool = True
 ) -> Axes:
     """
@@ -52,10 +77,12 @@ def view(
         of {render_depth}, unless the axes passed is already a view axes, in
         which case the render depth the view already has will be used.
 
-    filter_set: Iterable[Union[Type[Artist], Artist]] or None
+    filter_set: Iterable[Union[Type[Artist], Artist, Callable]] or None
         An optional filter set, which can be used to select what artists
-        are drawn by the view. Any artists or artist types in the set are not
-        drawn.
+        are drawn by the view. Any artists in the set, instances of artist
+        types in the set (including subclasses), and artists for which a
+        predicate (a callable accepting an artist) in the set returns True
+        are not drawn.
 
     scale_lines: bool, defaults to {scale_lines}
         Specifies if lines should be drawn thicker based on scaling in the
@@ -82,6 +109,81 @@ def view(
     return view_obj
 
 
+@dynamic_doc_string(
+    render_depth=DEFAULT_RENDER_DEPTH,
+    interp_list=get_interpolation_list_str()
+)
+def view_many(
+    axes_list: Iterable[Axes],
+    axes_to_view: Axes,
+    image_interpolation: str = "nearest",
+    render_depth: Optional[int] = None,
+    filter_set: Optional[
+        Iterable[Union[Type[Artist], Artist, Callable[[Artist], bool]]]
+    ] = None,
+    scale_lines: bool = True
+) -> List[Axes]:
+    """
+    Convert several axes into views of the same axes at once, such as a
+    grid of zoom panels. Views created together share a single culling pass
+    over the artists of the viewed axes each draw: the extent of every
+    artist is computed once, and each view only draws the artists within
+    its limits. Otherwise equivalent to calling `view` for every axes.
+
+    Parameters
+    ----------
+    axes_list: Iterable[Axes]
+        The axes to turn into views of another axes, such as a list of
+        subplots or inset axes.
+
+    axes_to_view: Axes
+        The axes to display the contents of in every view, the 'viewed'
+        axes.
+
+    image_interpolation: string, default of '{image_interpolation}'
+        The image interpolation method to use when displaying scaled images
+        from the axes being viewed. Defaults to '{image_interpolation}'.
+        Supported options are {interp_list}.
+
+    render_depth: optional int, positive, defaults to None
+        The number of recursive draws allowed for each view. If None, uses
+        the default render depth of {render_depth}, unless an axes passed is
+        already a view axes, in which case its render depth is kept.
+
+    filter_set: Iterable[Union[Type[Artist], Artist, Callable]] or None
+        An optional filter set, which can be used to select what artists
+        are drawn by the views. See `view`.
+
+    scale_lines: bool, defaults to {scale_lines}
+        Specifies if lines should be drawn thicker based on scaling in the
+        views.
+
+    Returns
+    -------
+    list of axes
+        The modified `~.axes.Axes` instances, which are now views, in the
+        order passed. The modification occurs in-place.
+
+    See Also
+    --------
+    matplotview.view: For creating a single view.
+    """
+    # Each view gets its own copy of the filter set...
+    if (filter_set is not None):
+        filter_set = list(filter_set)
+
+    group = _CullingGroup(axes_to_view)
+    views = []
+    for axes in axes_list:
+        view_obj = view(
+            axes, axes_to_view, image_interpolation,
+            render_depth, filter_set, scale_lines
+        )
+        view_obj._set_culling_group(axes_to_view, group)
+        views.append(view_obj)
+    return views
+
+
 def stop_viewing(view: Axes, axes_of_viewing: Axes) -> Axes:
     """
     Terminate the viewing of a specified axes.
@@ -124,7 +226,9 @@ def inset_zoom_axes(
     *,
     image_interpolation: str = "nearest",
     render_depth: Optional[int] = None,
-    filter_set: Optional[Iterable[Union[Type[Artist], Artist]]] = None,
+    filter_set: Optional[
+        Iterable[Union[Type[Artist], Artist, Callable[[Artist], bool]]]
+    ] = None,
     scale_lines: bool = True,
     transform: Transform = None,
     zorder: int = 5,
@@ -163,10 +267,12 @@ def inset_zoom_axes(
         of {render_depth}, unless the axes passed is already a view axes,
         in which case the render depth the view already has will be used.
 
-    filter_set: Iterable[Union[Type[Artist], Artist]] or None
+    filter_set: Iterable[Union[Type[Artist], Artist, Callable]] or None
         An optional filter set, which can be used to select what artists
-        are drawn by the view. Any artists or artist types in the set are not
-        drawn.
+        are drawn by the view. Any artists in the set, instances of artist
+        types in the set (including subclasses), and artists for which a
+        predicate (a callable accepting an artist) in the set returns True
+        are not drawn.
 
     scale_lines: bool, defaults to {scale_lines}
         Specifies if lines should be drawn thicker based on scaling in the
@@ -0,0 +1,143 @@
+from typing import Optional, Sequence
+
+import numpy as np
+from matplotlib.path import Path
+from matplotlib.transforms import Bbox, Transform
+
+# Collections drawing fewer items than this are drawn without culling, as
+# culling costs more than it saves.
+MIN_CULLED_ITEMS = 8
+
+
+def _get_path_extents(paths: Sequence[Path]) -> np.ndarray:
+    """
+    PRIVATE: Get the extents (x0, y0, x1, y1) of the vertices of each path,
+    including control points, so each contains its path. Empty paths have
+    NaN extents.
+    """
+    lengths = np.array([len(p.vertices) for p in paths])
+    extents = np.full((len(paths), 4), np.nan)
+    filled = np.flatnonzero(lengths > 0)
+    if (len(filled) == 0):
+        return extents
+
+    vertices = np.concatenate([paths[i].vertices for i in filled])
+    starts = np.concatenate([[0], np.cumsum(lengths[filled])[:-1]])
+    # fmin/fmax skip the NaN vertices of path breaks...
+    extents[filled, :2] = np.fmin.reduceat(vertices, starts)
+    extents[filled, 2:] = np.fmax.reduceat(vertices, starts)
+    return extents
+
+
+def _get_visible_items(
+    view_box: Bbox,
+    transfer_transform: Transform,
+    master_transform: Transform,
+    paths: Sequence[Path],
+    all_transforms: np.ndarray,
+    offsets: np.ndarray,
+    offset_trans: Transform,
+    transfer_paths: bool = True
+) -> Optional[np.ndarray]:
+    """
+    PRIVATE: Get the indices of the items of a path collection (as drawn by
+    RendererBase.draw_path_collection, cycling each sequence) whose extents
+    intersect the view box once transformed into the view. If paths aren't
+    transferred, only the offsets are moved into the view, and paths keep
+    their size (like unscaled markers). Returns None if the collection
+    can't be culled, as the transforms are non-affine.
+    """
+    if (len(paths) == 0 or not master_transform.is_affine):
+        return None
+    # Offsets go through non-affine transforms exactly, paths don't.
+    if (transfer_paths and not transfer_transform.is_affine):
+        return None
+
+    items = np.arange(_get_item_count(paths, all_transforms, offsets))
+    path_ids = items % max(len(paths), len(all_transforms))
+    n_transforms = len(all_transforms)
+    n_offsets = len(offsets)
+
+    # The corners of the extents of the path of each item...
+    extents = _get_path_extents(paths)[path_ids % len(paths)]
+    corners = np.stack([
+        extents[:, [0, 1]], extents[:, [2, 1]],
+        extents[:, [0, 3]], extents[:, [2, 3]]
+    ], axis=1)
+    corners = np.concatenate([corners, np.ones(corners.shape[:2] + (1,))], -1)
+
+    # transformed by the item's transform, then the master transform,
+    matrices = np.broadcast_to(
+        master_transform.get_matrix(), (len(items), 3, 3)
+    )
+    if (n_transforms):
+        matrices = matrices @ np.asarray(all_transforms)[
+            path_ids % n_transforms
+        ]
+    points = np.einsum("nij,nkj->nki", matrices, corners)[..., :2]
+
+    # then offset, in the display space of the viewed axes, and moved into
+    # the view.
+    if (n_offsets):
+        offsets = offset_trans.transform(np.asarray(offsets, dtype=float))
+        if (not transfer_paths):
+            offsets = transfer_transform.transform(offsets)
+        points = points + offsets[items % n_offsets, None, :]
+
+    if (transfer_paths):
+        points = transfer_transform.transform(
+            points.reshape(-1, 2)
+        ).reshape(-1, 4, 2)
+    with np.errstate(invalid="ignore"):
+        lo = points.min(axis=1)
+        hi = points.max(axis=1)
+        visible = np.all(
+            (lo <= view_box.max) & (hi >= view_box.min), axis=-1
+        )
+    return np.flatnonzero(visible)
+
+
+def _get_item_count(
+    paths: Sequence[Path],
+    all_transforms: np.ndarray,
+    offsets: np.ndarray
+) -> int:
+    """
+    PRIVATE: Get the number of items a path collection draws, paths are
+    first combined with transforms, and then with offsets.
+    """
+    return max(len(paths), len(all_transforms), len(offsets))
+
+
+def _take_items(sequence: Sequence, indices: np.ndarray) -> Sequence:
+    """
+    PRIVATE: Take the values of a cycled per item sequence of a path
+    collection for the passed items, empty sequences stay empty.
+    """
+    if (len(sequence) == 0):
+        return sequence
+    indices = indices % len(sequence)
+    if (isinstance(sequence, np.ndarray)):
+        return sequence[indices]
+    return [sequence[i] for i in indices]
+
+
+def _take_collection_items(
+    indices: np.ndarray,
+    paths: Sequence[Path],
+    all_transforms: np.ndarray,
+    offsets: np.ndarray,
+    *properties: Sequence
+) -> tuple:
+    """
+    PRIVATE: Take the passed items of a path collection, returning its
+    paths, transforms, offsets and other per item properties (colors, line
+    widths...), so each item is drawn as it would have been.
+    """
+    path_ids = indices % max(len(paths), len(all_transforms))
+    return (
+        _take_items(paths, path_ids),
+        _take_items(np.asarray(all_transforms), path_ids),
+        _take_items(offsets, indices),
+        *(_take_items(p, indices) for p in properties)
+    )
@@ -0,0 +1,719 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import RendererBase
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
+from matplotlib.transforms import Bbox, Transform, TransformedBbox, \
+    TransformedPatchPath
+
+from matplotview._transform_renderer import _TransformRenderer
+
+Limits = Tuple[float, float]
+Extent = Tuple[float, float, float, float]
+
+# Guards the caches of recent requests of data provider artists.
+_requests_lock = threading.Lock()
+
+
+class ViewDataProvider:
+    """
+    Supplies the data of an artist at the resolution it's displayed at,
+    so that axes and views only load the data they need. Axes showing an
+    overview can be given pre-aggregated data, and axes zoomed in on a
+    detail only the data in their limits. Subclass this and implement
+    `get_data`, and optionally `get_data_bounds`.
+    """
+    def get_data(
+        self,
+        x_lim: Limits,
+        y_lim: Limits,
+        pixel_size: Tuple[float, float]
+    ) -> tuple:
+        """
+        Get the data to display in a region.
+
+        Parameters
+        ----------
+        x_lim: tuple of 2 floats
+            The x limits of the axes the data is being displayed in.
+
+        y_lim: tuple of 2 floats
+            The y limits of the axes the data is being displayed in.
+
+        pixel_size: tuple of 2 floats
+            The width and height of the axes in display pixels.
+
+        Returns
+        -------
+        tuple
+            The data to display, in the format of the artist using the
+            provider. For `DataProviderLine2D` this is the x and y data, and
+            data just outside the limits should be included so lines continue
+            off the edges of the axes. For `DataProviderImage` it's the image
+            array and its extent, see `MultiResolutionImageProvider`.
+        """
+        raise NotImplementedError()
+
+    def get_data_bounds(self) -> Optional[Tuple[Limits, Limits]]:
+        """
+        Get the bounds of all the data, as ((xmin, xmax), (ymin, ymax)).
+        This is used to autoscale, and to skip drawing the data in views
+        which don't overlap with it. Returns None if unknown.
+        """
+        return None
+
+
+class MultiResolutionLineProvider(ViewDataProvider):
+    """
+    A data provider for lines with increasing x data, holding several levels
+    of resolution. Each level after the full resolution data keeps the
+    minimum and maximum sample of each bin of the previous level, so peaks
+    stay visible at every level. Requests are served from the coarsest level
+    with at least two samples per pixel in the requested x range, sliced to
+    that range.
+
+    The data can be stored in memory mapped arrays (see `numpy.memmap`), in
+    which case only the parts of the full resolution data which are
+    displayed are ever read.
+    """
+    def __init__(self, levels: Sequence[Tuple[np.ndarray, np.ndarray]]):
+        """
+        Construct a new provider from precomputed resolution levels, see
+        `from_data` to compute the levels.
+
+        Parameters
+        ----------
+        levels: sequence of tuples of 2 array-likes
+            The x and y data of each level, starting at full resolution and
+            decreasing. The x data of each level must be increasing.
+        """
+        if (len(levels) == 0):
+            raise ValueError("At least one resolution level is required.")
+        self._levels = [(x, y) for x, y in levels]
+        self._bounds = None
+
+    @classmethod
+    def from_data(
+        cls,
+        x: np.ndarray,
+        y: np.ndarray,
+        factor: int = 8,
+        min_size: int = 2048,
+        chunk_size: int = 2 ** 22
+    ) -> "MultiResolutionLineProvider":
+        """
+        Construct a new provider, computing the resolution levels of the
+        data. The data is processed in chunks, so it can be memory mapped.
+
+        Parameters
+        ----------
+        x: np.ndarray
+            The x data, which must be increasing.
+
+        y: np.ndarray
+            The y data.
+
+        factor: int, defaults to 8
+            The number of samples of a level which are reduced to a minimum
+            and maximum sample in the next level.
+
+        min_size: int, defaults to 2048
+            Levels stop being added once a level has fewer samples than this.
+
+        chunk_size: int, defaults to 2 ** 22
+            The number of samples processed at a time.
+
+        Returns
+        -------
+        MultiResolutionLineProvider
+            The new provider.
+        """
+        # Bins are reduced to 2 samples, so must be larger to shrink levels.
+        if (factor < 3):
+            raise ValueError(f"Invalid factor: {factor}, must be >= 3.")
+
+        levels = [(x, y)]
+        # Chunks must hold complete bins...
+        chunk_size = max(factor, chunk_size - chunk_size % factor)
+        while (len(levels[-1][0]) >= max(min_size, factor)):
+            prev_x, prev_y = levels[-1]
+            chunks = [
+                _min_max_reduce(
+                    np.asarray(prev_x[i:i + chunk_size]),
+                    np.asarray(prev_y[i:i + chunk_size]),
+                    factor
+                )
+                for i in range(0, len(prev_x), chunk_size)
+            ]
+            levels.append((
+                np.concatenate([c[0] for c in chunks]),
+                np.concatenate([c[1] for c in chunks])
+            ))
+
+        return cls(levels)
+
+    @property
+    def levels(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        The x and y data of each level, starting at full resolution.
+        """
+        return self._levels
+
+    def get_data_bounds(self) -> Optional[Tuple[Limits, Limits]]:
+        if (self._bounds is None):
+            # The coarsest level keeps the extremes of the data...
+            x, y = self._levels[-1]
+            if (len(x) == 0):
+                return None
+            self._bounds = (
+                (float(np.nanmin(x)), float(np.nanmax(x))),
+                (float(np.nanmin(y)), float(np.nanmax(y)))
+            )
+        return self._bounds
+
+    def get_data(
+        self,
+        x_lim: Limits,
+        y_lim: Limits,
+        pixel_size: Tuple[float, float]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        x_min, x_max = sorted(x_lim)
+        needed = 2 * max(pixel_size[0], 1)
+
+        for x, y in reversed(self._levels):
+            start = max(np.searchsorted(x, x_min, "left") - 1, 0)
+            end = np.searchsorted(x, x_max, "right") + 1
+            if (end - start >= needed):
+                break
+
+        return np.asarray(x[start:end]), np.asarray(y[start:end])
+
+
+def _min_max_reduce(
+    x: np.ndarray,
+    y: np.ndarray,
+    factor: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    PRIVATE: Reduce each bin of factor samples to its minimum and maximum
+    sample, in the order they appear in the bin.
+    """
+    n_bins = -(-len(x) // factor)
+    pad = n_bins * factor - len(x)
+    # Pad the last bin by repeating its last sample...
+    x = np.concatenate([x, np.repeat(x[-1:], pad)]).reshape(n_bins, factor)
+    y = np.concatenate([y, np.repeat(y[-1:], pad)]).reshape(n_bins, factor)
+
+    # Ignore NaNs, unless a bin is entirely NaN...
+    nans = np.isnan(y)
+    idx = np.sort(np.stack([
+        np.where(nans, np.inf, y).argmin(axis=1),
+        np.where(nans, -np.inf, y).argmax(axis=1)
+    ], axis=1), axis=1)
+
+    rows = np.arange(n_bins)[:, None]
+    return x[rows, idx].ravel(), y[rows, idx].ravel()
+
+
+def _get_request_data(artist, key: tuple):
+    """
+    PRIVATE: Get the data of a data provider artist for a request, reusing
+    the artist's cache of recent requests. The caches are locked as views
+    may be drawn from several threads at once, but the provider is called
+    outside the lock, so a slow provider doesn't block other draws.
+    """
+    with _requests_lock:
+        data = artist._requests.get(key, None)
+        if (data is not None):
+            artist._requests.move_to_end(key)
+            return data
+
+    data = artist._provider.get_data(*key)
+    with _requests_lock:
+        artist._requests[key] = data
+        if (len(artist._requests) > artist.MAX_CACHED_REQUESTS):
+            artist._requests.popitem(last=False)
+    return data
+
+
+def _get_request_axes(artist: Line2D, renderer: RendererBase) -> Axes:
+    """
+    PRIVATE: Get the axes an artist is being displayed in, which is the
+    view drawing it when drawn by a view requesting provider data.
+    """
+    if (
+        isinstance(renderer, _TransformRenderer)
+        and renderer.use_data_providers
+    ):
+        return renderer.bounding_axes
+    return artist.axes
+
+
+class DataProviderLine2D(Line2D):
+    """
+    A line which gets its data from a `ViewDataProvider` every time it's
+    drawn, for the limits and size of the axes it is drawn in. When drawn
+    by a view, the data is requested for the limits and size of the view,
+    unless disabled through `ViewSpecification.use_data_providers`.
+    """
+    MAX_CACHED_REQUESTS = 8
+
+    def __init__(self, provider: ViewDataProvider, **kwargs):
+        """
+        Construct a new data provider line.
+
+        Parameters
+        ----------
+        provider: ViewDataProvider
+            The provider of the line's data.
+
+        **kwargs
+            Other keyword arguments are passed to
+            `~matplotlib.lines.Line2D`.
+        """
+        self._provider = provider
+        self._requests = OrderedDict()
+        super().__init__([], [], **kwargs)
+        self._load_overview()
+
+    def get_provider(self) -> ViewDataProvider:
+        """
+        Get the provider of the line's data.
+        """
+        return self._provider
+
+    def set_provider(self, provider: ViewDataProvider):
+        """
+        Set the provider of the line's data.
+        """
+        self._provider = provider
+        with _requests_lock:
+            self._requests.clear()
+        self._load_overview()
+        self.stale = True
+
+    def _load_overview(self):
+        # Gives the line data to autoscale with before it's first drawn.
+        bounds = self._provider.get_data_bounds()
+        if (bounds is not None):
+            self.set_data(*self._provider.get_data(*bounds, (1000, 1000)))
+
+    def _request_data(self, axes: Optional[Axes]):
+        if (axes is None):
+            return
+
+        box = axes.get_window_extent()
+        key = (
+            tuple(axes.get_xlim()), tuple(axes.get_ylim()),
+            (round(box.width), round(box.height))
+        )
+        data = _get_request_data(self, key)
+
+        # Set directly instead of through set_data, as changing data for
+        # each draw shouldn't mark the line as stale.
+        if (self._xorig is not data[0] or self._yorig is not data[1]):
+            self._xorig, self._yorig = data
+            self._invalidx = self._invalidy = True
+
+    def draw(self, renderer: RendererBase):
+        if (self.get_visible()):
+            self._request_data(_get_request_axes(self, renderer))
+        super().draw(renderer)
+
+    def get_window_extent(self, renderer: Optional[RendererBase] = None):
+        bounds = self._provider.get_data_bounds()
+        if (bounds is None):
+            # Unknown extents, never skip drawing the line...
+            return Bbox([[-np.inf, -np.inf], [np.inf, np.inf]])
+
+        (x0, x1), (y0, y1) = bounds
+        bbox = Bbox.null()
+        bbox.update_from_data_xy(self.get_transform().transform(
+            [[x0, y0], [x0, y1], [x1, y0], [x1, y1]]
+        ), ignore=True)
+        if (self._marker):
+            ms = (self._markersize / 72.0 * self.figure.dpi) * 0.5
+            bbox = bbox.padded(ms)
+        return bbox
+
+
+class MultiResolutionImageProvider(ViewDataProvider):
+    """
+    A data provider for images, holding several levels of resolution. Each
+    level after the full resolution image is downsampled from the previous
+    level, averaging blocks of pixels. Requests are served from the coarsest
+    level with at least one image pixel per display pixel, and only the part
+    of the level covering the requested limits is read.
+
+    The levels can be memory mapped arrays (see `numpy.memmap`), in which
+    case only the displayed parts of them are ever read from disk, and
+    memory use stays proportional to the size of the displaying axes instead
+    of the size of the image.
+
+    Row 0 of the image is placed at y0 of the extent and column 0 at x0. To
+    display an image top down, like `~matplotlib.axes.Axes.imshow` does by
+    default, invert the y axis of the axes it's displayed in.
+    """
+    def __init__(self, levels: Sequence[np.ndarray], extent: Extent = None):
+        """
+        Construct a new provider from precomputed resolution levels, see
+        `from_data` to compute the levels.
+
+        Parameters
+        ----------
+        levels: sequence of np.ndarray
+            The image at each level, of shape (rows, columns) or (rows,
+            columns, channels), starting at full resolution and decreasing.
+            Every level covers the full extent.
+
+        extent: tuple of 4 floats, optional
+            The extent of the image, as (x0, x1, y0, y1). Defaults to the
+            pixel coordinates of the full resolution image, (0, columns, 0,
+            rows).
+        """
+        if (len(levels) == 0):
+            raise ValueError("At least one resolution level is required.")
+        self._levels = list(levels)
+        if (extent is None):
+            rows, cols = self._levels[0].shape[:2]
+            extent = (0, cols, 0, rows)
+        self._extent = tuple(float(v) for v in extent)
+
+    @classmethod
+    def from_data(
+        cls,
+        data: np.ndarray,
+        extent: Extent = None,
+        factor: int = 2,
+        min_size: int = 1024,
+        chunk_size: int = 2 ** 24,
+        allocate: Callable[[tuple, np.dtype], np.ndarray] = np.empty
+    ) -> "MultiResolutionImageProvider":
+        """
+        Construct a new provider, computing the resolution levels of the
+        image. The image is processed in chunks of rows, so it can be memory
+        mapped.
+
+        Parameters
+        ----------
+        data: np.ndarray
+            The full resolution image.
+
+        extent: tuple of 4 floats, optional
+            The extent of the image, see `__init__`.
+
+        factor: int, defaults to 2
+            The width and height of the blocks of pixels of a level which are
+            averaged into a pixel of the next level.
+
+        min_size: int, defaults to 1024
+            Levels stop being added once both the width and height of a
+            level are at most this size.
+
+        chunk_size: int, defaults to 2 ** 24
+            The approximate number of pixels processed at a time.
+
+        allocate: callable, defaults to np.empty
+            Called with the shape and dtype of each level after the first
+            to create the array to store it in. Pass a function creating a
+            memory mapped array to keep the levels out of memory.
+
+        Returns
+        -------
+        MultiResolutionImageProvider
+            The new provider.
+        """
+        if (factor < 2):
+            raise ValueError(f"Invalid factor: {factor}, must be >= 2.")
+
+        levels = [data]
+        while (max(levels[-1].shape[:2]) > max(min_size, 1)):
+            prev = levels[-1]
+            rows, cols = prev.shape[:2]
+            level = allocate(
+                (-(-rows // factor), -(-cols // factor)) + prev.shape[2:],
+                prev.dtype
+            )
+            # Chunks must hold complete blocks...
+            step = max(factor, chunk_size // cols - (chunk_size // cols) % factor)
+            for start in range(0, rows, step):
+                block = _block_mean(np.asarray(prev[start:start + step]), factor)
+                level[start // factor:start // factor + len(block)] = block
+            levels.append(level)
+
+        return cls(levels, extent)
+
+    @property
+    def levels(self) -> List[np.ndarray]:
+        """
+        The image at each level, starting at full resolution.
+        """
+        return self._levels
+
+    @property
+    def extent(self) -> Extent:
+        """
+        The extent of the image, as (x0, x1, y0, y1).
+        """
+        return self._extent
+
+    def get_data_bounds(self) -> Optional[Tuple[Limits, Limits]]:
+        x0, x1, y0, y1 = self._extent
+        return (min(x0, x1), max(x0, x1)), (min(y0, y1), max(y0, y1))
+
+    def get_data(
+        self,
+        x_lim: Limits,
+        y_lim: Limits,
+        pixel_size: Tuple[float, float]
+    ) -> Tuple[np.ndarray, Extent]:
+        """
+        Get the part of the image to display in a region.
+
+        Parameters
+        ----------
+        x_lim: tuple of 2 floats
+            The x limits of the axes the image is being displayed in.
+
+        y_lim: tuple of 2 floats
+            The y limits of the axes the image is being displayed in.
+
+        pixel_size: tuple of 2 floats
+            The width and height of the axes in display pixels.
+
+        Returns
+        -------
+        tuple of np.ndarray and tuple of 4 floats
+            The part of the image covering the limits, with a margin of a
+            pixel, and its extent as (x0, x1, y0, y1). The image is empty if
+            it doesn't overlap with the limits.
+        """
+        x0, x1, y0, y1 = self._extent
+        x_span = abs(x_lim[1] - x_lim[0])
+        y_span = abs(y_lim[1] - y_lim[0])
+
+        for level in reversed(self._levels):
+            rows, cols = level.shape[:2]
+            if (
+                x_span * cols / abs(x1 - x0) >= pixel_size[0]
+                and y_span * rows / abs(y1 - y0) >= pixel_size[1]
+            ):
+                break
+
+        rows, cols = level.shape[:2]
+        c0, c1 = _get_index_range(x_lim, x0, x1, cols)
+        r0, r1 = _get_index_range(y_lim, y0, y1, rows)
+        extent = (
+            x0 + (x1 - x0) * c0 / cols, x0 + (x1 - x0) * c1 / cols,
+            y0 + (y1 - y0) * r0 / rows, y0 + (y1 - y0) * r1 / rows
+        )
+        return np.asarray(level[r0:r1, c0:c1]), extent
+
+
+def _block_mean(image: np.ndarray, factor: int) -> np.ndarray:
+    """
+    PRIVATE: Average each block of factor by factor pixels of an image,
+    padding the last blocks by repeating the edge pixels.
+    """
+    rows, cols = image.shape[:2]
+    pad = [(0, -rows % factor), (0, -cols % factor)]
+    image = np.pad(image, pad + [(0, 0)] * (image.ndim - 2), mode="edge")
+
+    blocks = image.reshape(
+        image.shape[0] // factor, factor, image.shape[1] // factor, factor,
+        *image.shape[2:]
+    )
+    mean = blocks.mean(axis=(1, 3))
+    if (np.issubdtype(image.dtype, np.integer)):
+        mean = np.rint(mean)
+    return mean.astype(image.dtype)
+
+
+def _get_index_range(lim: Limits, e0: float, e1: float, n: int):
+    """
+    PRIVATE: Get the range of pixels along an axis of an image covering a
+    range of limits, with a margin of a pixel.
+    """
+    pos = (np.asarray(lim, dtype=float) - e0) / (e1 - e0) * n
+    lo = int(np.clip(np.floor(pos.min()) - 1, 0, n))
+    hi = int(np.clip(np.ceil(pos.max()) + 1, lo, n))
+    return lo, hi
+
+
+class DataProviderImage(AxesImage):
+    """
+    An image which gets its data from a `ViewDataProvider` returning images
+    and their extents, like `MultiResolutionImageProvider`, every time it's
+    drawn, for the limits and size of the axes it's drawn in.
+
+    When drawn by a view, the image is requested for the limits and size of
+    the view, and rendered directly at the resolution of the view instead
+    of being resampled from the viewed axes, unless disabled through
+    `ViewSpecification.use_data_providers`.
+    """
+    MAX_CACHED_REQUESTS = 8
+
+    def __init__(self, ax: Axes, provider: ViewDataProvider, **kwargs):
+        """
+        Construct a new data provider image.
+
+        Parameters
+        ----------
+        ax: Axes
+            The axes the image will be added to, with
+            `~matplotlib.axes.Axes.add_image`.
+
+        provider: ViewDataProvider
+            The provider of the image's data.
+
+        **kwargs
+            Other keyword arguments are passed to
+            `~matplotlib.image.AxesImage`. The origin can't be set, the
+            orientation of the image is set by the provider's extent.
+        """
+        if ("origin" in kwargs):
+            raise TypeError(
+                "The origin of a DataProviderImage is set by the extent of "
+                "its provider."
+            )
+        self._provider = provider
+        self._requests = OrderedDict()
+        self._request_key = None
+        self._view_transform = None
+        super().__init__(ax, origin="lower", **kwargs)
+        # Clip to the axes like images created by imshow...
+        if (self.get_clip_path() is None):
+            self.set_clip_path(ax.patch)
+        self._load_overview()
+
+    def get_provider(self) -> ViewDataProvider:
+        """
+        Get the provider of the image's data.
+        """
+        return self._provider
+
+    def set_provider(self, provider: ViewDataProvider):
+        """
+        Set the provider of the image's data.
+        """
+        self._provider = provider
+        with _requests_lock:
+            self._requests.clear()
+        self._request_key = None
+        self._load_overview()
+        self.stale = True
+
+    def _load_overview(self):
+        # Gives the image an extent to autoscale with, and data to scale
+        # the colormap with, before it's first drawn.
+        bounds = self._provider.get_data_bounds()
+        if (bounds is not None):
+            image, extent = self._provider.get_data(*bounds, (1, 1))
+            self.set_data(image)
+            self.set_extent(extent)
+            self.autoscale_None()
+
+    def _request_data(self, axes: Axes) -> bool:
+        """
+        Load the data for drawing in an axes, returning False if there is
+        none to draw.
+        """
+        box = axes.get_window_extent()
+        key = (
+            tuple(axes.get_xlim()), tuple(axes.get_ylim()),
+            (round(box.width), round(box.height))
+        )
+        data = _get_request_data(self, key)
+
+        image, extent = data
+        if (image.size == 0):
+            return False
+
+        if (key != self._request_key):
+            # Changing data for each draw shouldn't mark the image stale...
+            callback = self.stale_callback
+            self.stale_callback = None
+            try:
+                self.set_data(image)
+            finally:
+                self.stale_callback = callback
+            self._extent = extent
+            self._request_key = key
+        return True
+
+    def get_transform(self) -> Transform:
+        if (self._view_transform is not None):
+            return self._view_transform
+        return super().get_transform()
+
+    def _draw_in_view(self, renderer: _TransformRenderer):
+        # Render the image straight to the display space of the view...
+        base_renderer = renderer.base_renderer
+        view_axes = renderer.bounding_axes
+        clip_box = renderer._get_axes_display_box()
+
+        self._view_transform = renderer._get_transfer_transform(
+            super().get_transform()
+        )
+        try:
+            x0, x1, y0, y1 = self.get_extent()
+            bbox = Bbox([[x0, y0], [x1, y1]])
+            image, left, bottom, __ = self._make_image(
+                self._A, bbox, TransformedBbox(bbox, self.get_transform()),
+                clip_box, base_renderer.get_image_magnification()
+            )
+        finally:
+            self._view_transform = None
+
+        if (image is None):
+            return
+
+        stats = renderer.stats
+        if (stats is not None):
+            stats.images_resampled += 1
+            stats.pixels_produced += image.shape[0] * image.shape[1]
+
+        gc = base_renderer.new_gc()
+        gc.set_clip_rectangle(clip_box)
+        if (not isinstance(view_axes.patch, Rectangle)):
+            gc.set_clip_path(TransformedPatchPath(view_axes.patch))
+        gc.set_alpha(self._get_scalar_alpha())
+        gc.set_url(self.get_url())
+        gc.set_gid(self.get_gid())
+        base_renderer.draw_image(gc, left, bottom, image)
+        gc.restore()
+
+    def draw(self, renderer: RendererBase):
+        if (not self.get_visible()):
+            super().draw(renderer)
+            return
+
+        axes = _get_request_axes(self, renderer)
+        if (axes is None or not self._request_data(axes)):
+            self.stale = False
+            return
+
+        if (axes is not self.axes):
+            self._draw_in_view(renderer)
+            self.stale = False
+            return
+
+        super().draw(renderer)
+
+    def get_window_extent(self, renderer: Optional[RendererBase] = None):
+        # The extent of the whole image, not of the part last requested.
+        bounds = self._provider.get_data_bounds()
+        if (bounds is None):
+            return Bbox([[-np.inf, -np.inf], [np.inf, np.inf]])
+
+        (x0, x1), (y0, y1) = bounds
+        bbox = Bbox.null()
+        bbox.update_from_data_xy(self.get_transform().transform(
+            [[x0, y0], [x0, y1], [x1, y0], [x1, y1]]
+        ), ignore=True)
+        return bbox
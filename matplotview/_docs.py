@@ -1,8 +1,15 @@
+import functools
 import inspect
 
+from matplotlib.artist import Artist
+
 
 def dynamic_doc_string(**kwargs):
     def convert(func):
+        # Docstrings are stripped when running with -OO...
+        if (func.__doc__ is None):
+            return func
+
         default_vals = {
             k: v.default for k, v in inspect.signature(func).parameters.items()
             if (v.default is not inspect.Parameter.empty)
@@ -15,9 +22,22 @@ def dynamic_doc_string(**kwargs):
     return convert
 
 
+@functools.lru_cache(maxsize=None)
 def get_interpolation_list_str():
     from matplotlib.image import _interpd_
     return ", ".join([
         f"'{k}'" if (i != len(_interpd_) - 1) else f"or '{k}'"
         for i, k in enumerate(_interpd_)
     ])
+
+
+class _InternalArtist(Artist):
+    """
+    PRIVATE: Base class of artists only used internally. Matplotlib builds
+    the signature and docstring of `set` for every Artist subclass which
+    doesn't define it, listing all its properties, which takes milliseconds
+    per class at import time. Internal artists are never documented, so they
+    define it to skip that.
+    """
+    def set(self, **kwargs):
+        return Artist.set(self, **kwargs)
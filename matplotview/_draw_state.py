@@ -0,0 +1,81 @@
+import contextlib
+import contextvars
+from typing import Any, Iterator, Optional
+
+from matplotlib.backend_bases import RendererBase
+
+
+class _DrawState:
+    """
+    PRIVATE: The state of the view draws in progress within a context (a
+    thread, or an asyncio task), the renderer each view is drawing with and
+    the recursion depth of each figure. Immutable, entering a draw creates
+    a new state, so contexts copied mid-draw never see each other's draws.
+    """
+    __slots__ = ("_renderers", "_depths")
+
+    def __init__(self, renderers: dict = None, depths: dict = None):
+        self._renderers = {} if (renderers is None) else renderers
+        self._depths = {} if (depths is None) else depths
+
+    def get_renderer(self, view_axes: Any) -> Optional[RendererBase]:
+        return self._renderers.get(id(view_axes), None)
+
+    def get_depth(self, figure: Any) -> int:
+        return self._depths.get(id(figure), 0)
+
+    def enter(
+        self,
+        view_axes: Any,
+        renderer: Optional[RendererBase],
+        nested: bool = True
+    ) -> "_DrawState":
+        figure = view_axes.figure
+        renderers = dict(self._renderers)
+        renderers[id(view_axes)] = renderer
+        depths = dict(self._depths)
+        if (nested):
+            depths[id(figure)] = self.get_depth(figure) + 1
+        return _DrawState(renderers, depths)
+
+
+_draw_state = contextvars.ContextVar(
+    "matplotview_draw_state", default=_DrawState()
+)
+
+
+def _get_draw_renderer(view_axes: Any) -> Optional[RendererBase]:
+    """
+    PRIVATE: Get the renderer a view is drawing with in the current context,
+    or None if the view isn't being drawn.
+    """
+    return _draw_state.get().get_renderer(view_axes)
+
+
+def _get_render_depth(figure: Any) -> int:
+    """
+    PRIVATE: Get the number of nested view draws in progress for a figure in
+    the current context. The depth is tracked per figure, so the number of
+    recursive draws is even in the case of multiple views drawing each other.
+    """
+    return _draw_state.get().get_depth(figure)
+
+
+@contextlib.contextmanager
+def _drawing_view(
+    view_axes: Any,
+    renderer: Optional[RendererBase],
+    nested: bool = True
+) -> Iterator[None]:
+    """
+    PRIVATE: Mark a view as drawing with a renderer (None to draw without
+    viewed content) in the current context, for the duration of the block.
+    Only nested draws add to the recursion depth of the figure.
+    """
+    token = _draw_state.set(
+        _draw_state.get().enter(view_axes, renderer, nested)
+    )
+    try:
+        yield
+    finally:
+        _draw_state.reset(token)
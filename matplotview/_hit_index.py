@@ -0,0 +1,152 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.collections import Collection
+from matplotlib.lines import Line2D
+from matplotlib.transforms import Bbox, Transform
+
+# Average number of points in each cell of a point grid.
+_POINTS_PER_CELL = 4
+
+
+class _PointGrid:
+    """
+    PRIVATE: A uniform grid over a set of 2D points, with the points sorted
+    by cell, so the points within a box are found by looking at the cells
+    it overlaps. Each row of cells is a contiguous range of sorted points.
+    """
+    def __init__(self, points: np.ndarray):
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        indices = np.flatnonzero(np.isfinite(points).all(axis=1))
+        points = points[indices]
+
+        size = len(points)
+        self._side = max(1, int(np.sqrt(size / _POINTS_PER_CELL)))
+        if (size > 0):
+            self._origin = points.min(axis=0)
+            span = points.max(axis=0) - self._origin
+        else:
+            self._origin = np.zeros(2)
+            span = np.zeros(2)
+        # Points all on a line (or a single point) get cells of size 1.
+        self._cell_size = np.where(span > 0, span / self._side, 1)
+
+        cells = self._get_cells(points)
+        cell_ids = cells[:, 1] * self._side + cells[:, 0]
+        order = np.argsort(cell_ids, kind="stable")
+        self._starts = np.searchsorted(
+            cell_ids[order], np.arange(self._side * self._side + 1)
+        )
+        self._indices = indices[order]
+        self._points = points[order]
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _get_cells(self, points: np.ndarray) -> np.ndarray:
+        cells = np.floor((points - self._origin) / self._cell_size)
+        return np.clip(cells, 0, self._side - 1).astype(np.intp)
+
+    def query(self, bbox: Bbox) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the indices of the points within a box, and the points.
+        """
+        empty = np.empty(0, dtype=np.intp)
+        if (
+            len(self._points) == 0
+            or not np.all(np.isfinite(bbox.get_points()))
+        ):
+            return empty, np.empty((0, 2))
+
+        lo = (bbox.min - self._origin) / self._cell_size
+        hi = (bbox.max - self._origin) / self._cell_size
+        # The box misses the grid entirely...
+        if (np.any(hi < 0) or np.any(lo >= self._side)):
+            return empty, np.empty((0, 2))
+        (c0, r0), (c1, r1) = self._get_cells(
+            np.array([bbox.min, bbox.max])
+        )
+
+        rows = np.arange(r0, r1 + 1) * self._side
+        ranges = [
+            np.arange(s, e) for s, e in zip(
+                self._starts[rows + c0], self._starts[rows + c1 + 1]
+            )
+        ]
+        candidates = np.concatenate(ranges) if (ranges) else empty
+        points = self._points[candidates]
+
+        inside = (
+            (points[:, 0] >= bbox.xmin) & (points[:, 0] <= bbox.xmax)
+            & (points[:, 1] >= bbox.ymin) & (points[:, 1] <= bbox.ymax)
+        )
+        return self._indices[candidates[inside]], points[inside]
+
+
+def _get_hit_points(
+    artist: Artist,
+    axes: Axes
+) -> Optional[Tuple[np.ndarray, Transform]]:
+    """
+    PRIVATE: Get the points of an artist which can be hit, line vertices
+    and collection offsets, with the transform from them into the data
+    coordinates of their axes. Returns None if the artist has no points,
+    or they aren't placed in data coordinates.
+    """
+    if (isinstance(artist, Line2D)):
+        points, transform = artist.get_xydata(), artist.get_transform()
+    elif (isinstance(artist, Collection)):
+        points = artist.get_offsets()
+        transform = artist.get_offset_transform()
+    else:
+        return None
+
+    if (len(points) == 0 or not transform.contains_branch(axes.transData)):
+        return None
+    to_data = transform - axes.transData
+    return (points, to_data) if (to_data.is_affine) else None
+
+
+class _HitIndexCache:
+    """
+    PRIVATE: The point grids of the artists a view hit tests, each grid is
+    kept until its artist's points (or their placement) are replaced.
+    In place changes to the points of an artist aren't detected.
+    """
+    def __init__(self):
+        self._grids: Dict[Artist, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._grids)
+
+    def clear(self):
+        self._grids.clear()
+
+    def prune(self, artists: Iterable[Artist]):
+        """
+        Drop the grids of artists which aren't passed.
+        """
+        keep = set(artists)
+        self._grids = {a: g for a, g in self._grids.items() if (a in keep)}
+
+    def get(self, artist: Artist, axes: Axes) -> Optional[_PointGrid]:
+        hit_points = _get_hit_points(artist, axes)
+        if (hit_points is None):
+            return None
+
+        points, to_data = hit_points
+        matrix = to_data.get_matrix()
+        cached = self._grids.get(artist, None)
+        if (
+            cached is not None and cached[0] is points
+            and np.array_equal(cached[1], matrix)
+        ):
+            return cached[2]
+
+        # Masked points can't be hit...
+        data = np.ma.asarray(points, dtype=float).filled(np.nan)
+        grid = _PointGrid(to_data.transform(data))
+        self._grids[artist] = (points, matrix.copy(), grid)
+        return grid
@@ -0,0 +1,240 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+import numpy as np
+from matplotlib.transforms import Bbox, Transform
+
+# Spacing in output pixels of the points of a warp mesh which are
+# transformed exactly, pixels in between are interpolated.
+_MESH_STEP = 8
+# The largest error in image pixels allowed for interpolated points.
+_MESH_TOLERANCE = 0.1
+
+
+def _get_warped_bbox(bbox: Bbox, transform: Transform) -> Bbox:
+    """
+    PRIVATE: Get the bounding box of a box after a non-affine transform,
+    which can't be found from only the corners (a polar transform can turn
+    the edges of the box into a full circle). Points along the edges are
+    transformed instead, non-finite points are ignored.
+    """
+    t = np.linspace(0, 1, 4 * _MESH_STEP + 1)
+    (x0, y0), (x1, y1) = bbox.get_points()
+    xs, ys = x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+    edges = np.concatenate([
+        np.column_stack([xs, np.full_like(xs, y0)]),
+        np.column_stack([xs, np.full_like(xs, y1)]),
+        np.column_stack([np.full_like(ys, x0), ys]),
+        np.column_stack([np.full_like(ys, x1), ys])
+    ])
+    with np.errstate(all="ignore"):
+        points = transform.transform(edges)
+    points = points[np.isfinite(points).all(axis=1)]
+
+    out = Bbox.null()
+    if (len(points) > 0):
+        out.update_from_data_xy(points, ignore=True)
+    return out
+
+
+def _get_mesh_nodes(size: int, step: int) -> np.ndarray:
+    """
+    PRIVATE: Get the pixel positions along an axis of the output image at
+    which the exact transform is evaluated, always including both ends.
+    """
+    return np.unique(np.append(np.arange(0, size, step), size - 1))
+
+
+def _get_lerp_weights(
+    nodes: np.ndarray,
+    size: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    PRIVATE: Get the indices of the nodes before and after every pixel
+    along an axis, and the weight of the node after.
+    """
+    pos = np.arange(size)
+    lo = np.clip(np.searchsorted(nodes, pos, "right") - 1, 0, len(nodes) - 1)
+    hi = np.minimum(lo + 1, len(nodes) - 1)
+    span = nodes[hi] - nodes[lo]
+    weight = np.divide(
+        pos - nodes[lo], span, out=np.zeros(size), where=(span != 0)
+    )
+    return lo, hi, weight
+
+
+def _interpolate_mesh(
+    grid: np.ndarray,
+    nodes_x: np.ndarray,
+    nodes_y: np.ndarray,
+    width: int,
+    height: int
+) -> np.ndarray:
+    """
+    PRIVATE: Bilinearly interpolate the transformed points of the nodes to
+    every pixel of the output image.
+    """
+    lo, hi, weight = _get_lerp_weights(nodes_x, width)
+    weight = weight[None, :, None]
+    rows = grid[:, lo] * (1 - weight) + grid[:, hi] * weight
+
+    lo, hi, weight = _get_lerp_weights(nodes_y, height)
+    weight = weight[:, None, None]
+    return rows[lo] * (1 - weight) + rows[hi] * weight
+
+
+def _refine_mesh(
+    mesh: np.ndarray,
+    grid: np.ndarray,
+    nodes_x: np.ndarray,
+    nodes_y: np.ndarray,
+    inverse: Transform
+):
+    """
+    PRIVATE: Transform the pixels of the cells of the coarse grid which
+    can't be interpolated exactly, in place. These are found by transforming
+    the center of every cell, and are cells near singularities or
+    discontinuities (such as the angle wrapping around in polar axes).
+    """
+    if (len(nodes_x) < 2 or len(nodes_y) < 2):
+        return
+
+    centers = np.stack(np.meshgrid(
+        (nodes_x[:-1] + nodes_x[1:]) / 2, (nodes_y[:-1] + nodes_y[1:]) / 2
+    ), axis=-1)
+    exact = inverse.transform(centers.reshape(-1, 2)).reshape(centers.shape)
+    estimate = (
+        grid[:-1, :-1] + grid[:-1, 1:] + grid[1:, :-1] + grid[1:, 1:]
+    ) / 4
+
+    # Cells which are invalid as a whole are left alone, a NaN on only one
+    # side (such as a singularity at the center of a cell) is an error...
+    exact_nan = np.isnan(exact).any(axis=-1)
+    estimate_nan = np.isnan(estimate).any(axis=-1)
+    with np.errstate(invalid="ignore"):
+        error = np.abs(exact - estimate).max(axis=-1)
+    rows, cols = np.nonzero(
+        (exact_nan != estimate_nan)
+        | (~exact_nan & ~estimate_nan & (error > _MESH_TOLERANCE))
+    )
+    if (len(rows) == 0):
+        return
+
+    blocks = [
+        np.mgrid[nodes_y[r]:nodes_y[r + 1] + 1, nodes_x[c]:nodes_x[c + 1] + 1]
+        .reshape(2, -1)
+        for r, c in zip(rows, cols)
+    ]
+    ys, xs = np.concatenate(blocks, axis=1)
+    mesh[ys, xs] = inverse.transform(np.column_stack([xs, ys]).astype(float))
+
+
+class _MeshLookupTransform(Transform):
+    """
+    PRIVATE: The inverse of a `_MeshWarpTransform`, returns the precomputed
+    mesh when asked to transform the pixel grid of the output image, and
+    transforms exactly otherwise.
+    """
+    input_dims = 2
+    output_dims = 2
+    is_affine = False
+
+    def __init__(self, exact_inverse: Transform, mesh: np.ndarray):
+        super().__init__()
+        self._exact_inverse = exact_inverse
+        self._mesh = mesh
+
+    def transform_non_affine(self, values: np.ndarray) -> np.ndarray:
+        if (np.shape(values) == self._mesh.shape):
+            return self._mesh
+        return self._exact_inverse.transform(values)
+
+
+class _MeshWarpTransform(Transform):
+    """
+    PRIVATE: Wraps a non-affine transform from an image to the output image,
+    for passing to the image resampler. The resampler transforms every pixel
+    of the output image with the inverse of the transform, which this
+    replaces with a mesh interpolated from a coarse grid of exactly
+    transformed points.
+    """
+    input_dims = 2
+    output_dims = 2
+    is_affine = False
+
+    def __init__(self, transform: Transform, mesh: np.ndarray):
+        super().__init__()
+        self._transform = transform
+        self._mesh = mesh
+
+    def transform_non_affine(self, values: np.ndarray) -> np.ndarray:
+        return self._transform.transform(values)
+
+    def inverted(self) -> Transform:
+        return _MeshLookupTransform(self._transform.inverted(), self._mesh)
+
+
+class _WarpMeshCache:
+    """
+    PRIVATE: Caches the warp meshes of the images a view draws through a
+    non-affine transform. A cached mesh is reused as long as the coarse grid
+    of exactly transformed points it was interpolated from stays the same,
+    so changes to either axes are always picked up. Locked, as views may be
+    drawn from several threads at once.
+    """
+    MAX_MESHES = 4
+
+    def __init__(self):
+        self._meshes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._meshes)
+
+    def clear(self):
+        with self._lock:
+            self._meshes.clear()
+
+    def get_transform(
+        self,
+        key: Hashable,
+        transform: Transform,
+        width: int,
+        height: int
+    ) -> Transform:
+        """
+        Get the transform to resample an image with, given the non-affine
+        transform from the image to an output image of the passed size.
+        Meshes are cached under the passed key, identifying the image.
+        """
+        nodes_x = _get_mesh_nodes(width, _MESH_STEP)
+        nodes_y = _get_mesh_nodes(height, _MESH_STEP)
+        points = np.stack(np.meshgrid(nodes_x, nodes_y), axis=-1)
+        inverse = transform.inverted()
+        with np.errstate(all="ignore"):
+            grid = inverse.transform(
+                points.reshape(-1, 2).astype(float)
+            ).reshape(points.shape)
+
+        key = (key, width, height)
+        with self._lock:
+            cached = self._meshes.get(key, None)
+            if (
+                cached is not None
+                and np.array_equal(cached[0], grid, equal_nan=True)
+            ):
+                self._meshes.move_to_end(key)
+                return _MeshWarpTransform(transform, cached[1])
+
+        mesh = _interpolate_mesh(grid, nodes_x, nodes_y, width, height)
+        with np.errstate(all="ignore"):
+            _refine_mesh(mesh, grid, nodes_x, nodes_y, inverse)
+        # In the row major order the image resampler requests points in.
+        mesh = mesh.reshape(-1, 2)
+        with self._lock:
+            self._meshes[key] = (grid, mesh)
+            if (len(self._meshes) > self.MAX_MESHES):
+                self._meshes.popitem(last=False)
+
+        return _MeshWarpTransform(transform, mesh)
@@ -0,0 +1,91 @@
+import threading
+import weakref
+from typing import Optional, Sequence
+
+import numpy as np
+from matplotlib.lines import Line2D
+
+# Lines with fewer points than this are drawn whole, as finding the visible
+# slice costs more than it saves.
+MIN_SLICED_POINTS = 1000
+
+# Whether the x data of each line is sorted, with the data it was checked
+# on, so it is only checked again once the data changes.
+_sorted_lines = weakref.WeakKeyDictionary()
+# Guards the above, as views may be drawn from several threads at once.
+_sorted_lines_lock = threading.Lock()
+
+
+def _get_sorted_xy(line: Line2D) -> Optional[np.ndarray]:
+    """
+    PRIVATE: Get the points of a line if its x data is sorted (increasing,
+    without NaNs) and long enough to be sliced, otherwise None.
+    """
+    xy = line.get_xydata()
+    with _sorted_lines_lock:
+        cached = _sorted_lines.get(line, None)
+    if (cached is not None and cached[0] is xy):
+        return xy if (cached[1]) else None
+
+    x = xy[:, 0]
+    is_sorted = bool(
+        len(x) >= MIN_SLICED_POINTS and np.all(x[1:] >= x[:-1])
+    )
+    with _sorted_lines_lock:
+        _sorted_lines[line] = (xy, is_sorted)
+    return xy if (is_sorted) else None
+
+
+def _get_visible_slice(
+    line: Line2D,
+    x_lim: Sequence[float]
+) -> Optional[slice]:
+    """
+    PRIVATE: Get the slice of the points of a line with sorted x data
+    within the passed x limits (in the data coordinates of the line's
+    axes), plus one neighbor on each side, so segments leaving the limits
+    are still drawn. Returns None if the line can't be sliced, as it's
+    unsorted, subclassed (3D lines, data providers) or not placed in data
+    coordinates.
+    """
+    if (
+        type(line) is not Line2D
+        or line.axes is None
+        or line.get_markevery() is not None
+        or line.get_transform() != line.axes.transData
+    ):
+        return None
+
+    xy = _get_sorted_xy(line)
+    if (xy is None):
+        return None
+
+    x0, x1 = sorted(x_lim)
+    start = np.searchsorted(xy[:, 0], x0, "left")
+    stop = np.searchsorted(xy[:, 0], x1, "right")
+    return slice(max(start - 1, 0), min(stop + 1, len(xy)))
+
+
+def _slice_line(line: Line2D, visible: slice):
+    """
+    PRIVATE: Replace the points of a (copy of a) line with a slice of them.
+    Set directly, as the setters mark the line as stale.
+    """
+    xy = line.get_xydata()
+    if (visible != slice(0, len(xy))):
+        line._xorig = xy[visible, 0]
+        line._yorig = xy[visible, 1]
+        line.recache(always=True)
+
+
+def _disable_subslice(line: Line2D):
+    """
+    PRIVATE: Disable the subslicing of a (copy of a) line, which slices its
+    points to the x limits of its axes, not the view drawing it. Recaches
+    the line first if needed, as recaching enables it again, and drops the
+    transformed path shared with the original, which is then subsliced.
+    """
+    line.get_xydata()
+    if (line._subslice):
+        line._subslice = False
+        line._transformed_path = None
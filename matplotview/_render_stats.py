@@ -0,0 +1,113 @@
+import functools
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+@dataclass
+class RenderStats:
+    """
+    Rendering statistics, recorded by a view for each axes it views. Views
+    only record statistics once enabled, see `View.set_record_render_stats`.
+
+    Attributes
+    ----------
+    view_draws: int
+        The number of times the view drew the contents of the viewed axes.
+
+    artists_considered: int
+        The number of artists of the viewed axes which passed the view's
+        filter set, and were considered for drawing.
+
+    artists_culled: int
+        The number of considered artists which were skipped because they
+        were entirely outside of the view.
+
+    artists_drawn: int
+        The number of considered artists which were drawn.
+
+    primitives: Counter
+        The number of calls made to each draw method of the view renderer.
+
+    vertices_transformed: int
+        The number of path vertices, offsets and triangle points transformed
+        into the view.
+
+    vertices_sliced: int
+        The number of points of lines with sorted x data skipped because
+        they were outside of the x limits of the view.
+
+    paths_culled: int
+        The number of paths of path collections (such as contour and
+        polygon collections) skipped because they were entirely outside of
+        the view.
+
+    images_resampled: int
+        The number of images resampled into the view.
+
+    pixels_produced: int
+        The number of pixels in all resampled images.
+
+    tiles_rendered: int
+        The number of tiles rendered, when the view is assembled from tiles
+        (see `ViewSpecification.tile_size`).
+
+    tiles_reused: int
+        The number of tiles drawn from the tile cache instead of rendered.
+
+    draw_time: Counter
+        Time spent in each draw method in seconds. Nested draw method calls
+        (such as the fallback marker drawing) are included in the time of
+        the outermost call.
+    """
+    view_draws: int = 0
+    artists_considered: int = 0
+    artists_culled: int = 0
+    artists_drawn: int = 0
+    primitives: Counter = field(default_factory=Counter)
+    vertices_transformed: int = 0
+    vertices_sliced: int = 0
+    paths_culled: int = 0
+    images_resampled: int = 0
+    pixels_produced: int = 0
+    tiles_rendered: int = 0
+    tiles_reused: int = 0
+    draw_time: Counter = field(default_factory=Counter)
+
+    @property
+    def total_draw_time(self) -> float:
+        """
+        The total time spent in the draw methods of the view renderer.
+        """
+        return sum(self.draw_time.values())
+
+
+def record_draw_stats(func: Callable) -> Callable:
+    """
+    PRIVATE: Decorator for draw methods of the view renderer, counts calls
+    and measures time spent in the method if the renderer has statistics
+    enabled. If not, the only overhead is a single attribute check.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        stats = self.stats
+        if (stats is None):
+            return func(self, *args, **kwargs)
+
+        stats.primitives[name] += 1
+        # Nested calls are timed by the outermost call only...
+        if (self._timing_draw):
+            return func(self, *args, **kwargs)
+
+        self._timing_draw = True
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            stats.draw_time[name] += time.perf_counter() - start
+            self._timing_draw = False
+
+    return wrapper
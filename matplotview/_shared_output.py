@@ -0,0 +1,204 @@
+import itertools
+import threading
+from typing import Callable, Hashable, List, Optional, Tuple
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import RendererBase
+from matplotlib.projections.polar import PolarAxes
+from matplotlib.transforms import Affine2D, Bbox, TransformedPath
+
+from matplotview._docs import _InternalArtist
+from matplotview._transform_renderer import _TransformRenderer
+
+# Guards creating frame caches, as figures may be drawn from several threads
+# at once.
+_frame_cache_lock = threading.Lock()
+# Content versions, unique across all axes.
+_content_versions = itertools.count()
+
+
+def _get_frame_cache(figure) -> dict:
+    """
+    PRIVATE: Get the cache of view output shared within the current draw of
+    a figure, which is emptied every time a draw of the figure completes.
+    """
+    with _frame_cache_lock:
+        cache = getattr(figure, "_matplotview_frame_cache", None)
+        if (cache is None):
+            cache = {}
+            figure._matplotview_frame_cache = cache
+            figure.canvas.mpl_connect(
+                "draw_event", lambda event: cache.clear()
+            )
+        return cache
+
+
+class _StaleCounter:
+    """
+    PRIVATE: Wraps the stale callback of an axes, giving the axes a new
+    content version every time it's marked as stale, which happens every
+    time one of its artists (or child axes) changes.
+    """
+    def __init__(self, callback: Optional[Callable]):
+        self.callback = callback
+        self.version = next(_content_versions)
+
+    def __call__(self, artist: Artist, value: bool):
+        self.version = next(_content_versions)
+        if (self.callback is not None):
+            self.callback(artist, value)
+
+
+def _get_content_version(axes: Axes) -> int:
+    """
+    PRIVATE: Get the content version of an axes, which changes every time
+    one of its artists changes. Versions are only tracked from the first
+    call on, and restart with a new version if matplotlib replaces the stale
+    callback of the axes (when it's added to another parent).
+    """
+    # Settle pending autoscaling first, as it marks the axes as stale.
+    axes.viewLim
+    callback = axes.stale_callback
+    if (not isinstance(callback, _StaleCounter)):
+        callback = _StaleCounter(callback)
+        axes.stale_callback = callback
+    return callback.version
+
+
+def _get_output_key(
+    view_axes: Axes,
+    viewed_axes: Axes,
+    spec_key: Hashable,
+    renderer: RendererBase
+) -> Hashable:
+    """
+    PRIVATE: Get the key identifying what a view draws of a viewed axes.
+    Views with equal keys draw identical pixels, only offset by a whole
+    number of pixels. Includes the content version of the viewed axes, as
+    views may be drawn (blitted) again without drawing the figure, which is
+    when the shared output is cleared.
+    """
+    bbox = view_axes.get_window_extent()
+    # Polar axes place data by more than their limits.
+    polar_key = None
+    if (isinstance(view_axes, PolarAxes)):
+        polar_key = (
+            view_axes.get_theta_offset(), view_axes.get_theta_direction(),
+            view_axes.get_rorigin()
+        )
+    return (
+        id(renderer), id(viewed_axes), _get_content_version(viewed_axes),
+        spec_key, type(view_axes), polar_key,
+        view_axes.get_xscale(), view_axes.get_yscale(),
+        tuple(view_axes.get_xlim()), tuple(view_axes.get_ylim()),
+        # Sub-pixel offsets change anti-aliasing...
+        round(bbox.width, 3), round(bbox.height, 3),
+        round(bbox.x0 % 1, 3), round(bbox.y0 % 1, 3)
+    )
+
+
+class _RegionRenderer(_TransformRenderer):
+    """
+    PRIVATE: A transform renderer drawing into a buffer which only covers a
+    region of the canvas, the output is moved by the region's origin.
+    """
+    def __init__(
+        self,
+        origin: Tuple[int, int],
+        base_renderer: RendererBase,
+        mock_transform,
+        transform,
+        *args,
+        **kwargs
+    ):
+        self._offset = Affine2D().translate(-origin[0], -origin[1])
+        super().__init__(
+            base_renderer, mock_transform, transform + self._offset,
+            *args, **kwargs
+        )
+
+    def _get_axes_display_box(self) -> Bbox:
+        return super()._get_axes_display_box().transformed(self._offset)
+
+    def _get_axes_clip_path(self) -> TransformedPath:
+        patch = self.bounding_axes.patch
+        return TransformedPath(
+            patch.get_path(), patch.get_transform() + self._offset
+        )
+
+
+class _SharedOutputArtist(_InternalArtist):
+    """
+    PRIVATE: Draws the artists a view borrows from a viewed axes into an
+    offscreen buffer covering the view, and draws its pixels. Other views
+    drawing the same content in the same figure draw reuse those pixels,
+    instead of drawing the viewed axes again.
+    """
+    def __init__(
+        self,
+        view_axes: Axes,
+        key: Hashable,
+        make_bound_artists: Callable[
+            [RendererBase, Tuple[int, int]], List[Artist]
+        ],
+        zorder: float
+    ):
+        super().__init__()
+        self._view_axes = view_axes
+        self._key = key
+        self._make_bound_artists = make_bound_artists
+        self.set_zorder(zorder)
+
+    def _get_pixel_box(self):
+        bbox = self._view_axes.get_window_extent()
+        x0, y0 = int(np.floor(bbox.x0)), int(np.floor(bbox.y0))
+        x1, y1 = int(np.ceil(bbox.x1)), int(np.ceil(bbox.y1))
+        return x0, y0, x1, y1
+
+    def _render(self, renderer: RendererBase) -> np.ndarray:
+        from matplotlib.backends.backend_agg import RendererAgg
+        x0, y0, x1, y1 = self._get_pixel_box()
+        offscreen = RendererAgg(x1 - x0, y1 - y0, renderer.dpi)
+
+        artists = sorted(
+            self._make_bound_artists(offscreen, (x0, y0)),
+            key=lambda a: a.get_zorder()
+        )
+        for artist in artists:
+            artist.draw(offscreen)
+
+        # Buffer rows go top to bottom, images are drawn bottom to top.
+        return np.asarray(offscreen.buffer_rgba())[::-1].copy()
+
+    def draw(self, renderer: RendererBase):
+        cache = _get_frame_cache(self._view_axes.figure)
+        pixels = cache.get(self._key, None)
+        if (pixels is None):
+            pixels = self._render(renderer)
+            cache[self._key] = pixels
+
+        x0, y0, __, __ = self._get_pixel_box()
+        gc = renderer.new_gc()
+        gc.set_clip_rectangle(self._view_axes.get_window_extent())
+        renderer.draw_image(gc, x0, y0, pixels)
+        gc.restore()
+
+
+def _can_share_output(renderer: RendererBase, view_axes: Axes) -> bool:
+    """
+    PRIVATE: Check if the output of a view can be shared when drawing with
+    a renderer. Only raster output is shared, as sharing replaces vector
+    content with an image, and only for views fully inside the canvas, as
+    the pixels outside of it are lost.
+    """
+    from matplotlib.backends.backend_agg import RendererAgg
+    if (not isinstance(renderer, RendererAgg)):
+        return False
+    width, height = renderer.get_canvas_width_height()
+    bbox = view_axes.get_window_extent()
+    return (
+        bbox.x0 >= 0 and bbox.y0 >= 0
+        and bbox.x1 <= width and bbox.y1 <= height
+    )
@@ -0,0 +1,353 @@
+import threading
+import weakref
+from typing import Callable
+
+import numpy as np
+from matplotlib.lines import Line2D
+from matplotlib.path import Path
+from matplotlib.transforms import Bbox, Transform, TransformedPath
+
+
+class _RingBuffer:
+    """
+    PRIVATE: A fixed capacity buffer of 2D points, which overwrites the
+    oldest points once full. Every point is stored twice, so the contents
+    are always available as one contiguous array without copying.
+    """
+    def __init__(self, capacity: int):
+        capacity = int(capacity)
+        if (capacity < 1):
+            raise ValueError(f"Invalid capacity: {capacity}, must be >= 1.")
+        self._capacity = capacity
+        self._data = np.full((2 * capacity, 2), np.nan)
+        self._total = 0
+        self._count = 0
+        self._generation = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """
+        The number of points appended since the buffer was last cleared.
+        """
+        return self._total
+
+    @property
+    def generation(self) -> int:
+        """
+        Incremented every time the buffer is cleared.
+        """
+        return self._generation
+
+    def clear(self):
+        self._total = 0
+        self._count = 0
+        self._generation += 1
+
+    def append(self, points: np.ndarray):
+        n = len(points)
+        # Only the last capacity points can be kept...
+        points = points[-self._capacity:]
+        first = self._total + n - len(points)
+        idx = (first + np.arange(len(points))) % self._capacity
+        self._data[idx] = points
+        self._data[idx + self._capacity] = points
+        self._total += n
+        self._count = min(self._count + n, self._capacity)
+
+    def view(self) -> np.ndarray:
+        """
+        The points in the buffer, oldest first. This is a view of the buffer
+        which is only valid until more points are appended.
+        """
+        start = (self._total - self._count) % self._capacity
+        return self._data[start:start + self._count]
+
+
+class _StreamingPath(Path):
+    """
+    PRIVATE: A path holding the samples of a ring buffer (or a transformed
+    copy of them), recording which samples it holds so transforms of it can
+    be updated incrementally. Only valid until more samples are appended.
+    """
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        stream: _RingBuffer,
+        stream_end: int,
+        stream_generation: int,
+        _interpolation_steps: int = 1
+    ):
+        super().__init__(vertices, _interpolation_steps=_interpolation_steps)
+        self.stream = stream
+        self.stream_end = stream_end
+        self.stream_generation = stream_generation
+
+    @classmethod
+    def from_buffer(cls, buffer: _RingBuffer, **kwargs) -> "_StreamingPath":
+        return cls(
+            buffer.view(), buffer, buffer.total, buffer.generation, **kwargs
+        )
+
+    def with_vertices(self, vertices: np.ndarray) -> "_StreamingPath":
+        """
+        Get a streaming path holding the same samples as this one, with
+        different (transformed) vertices.
+        """
+        return type(self)(
+            vertices, self.stream, self.stream_end, self.stream_generation,
+            self._interpolation_steps
+        )
+
+
+class _StreamTransformCache:
+    """
+    PRIVATE: Caches the transformed samples of streaming paths, so that only
+    samples appended since the last call are transformed. The owner must
+    clear the cache when the transform changes. Locked, as views may be
+    drawn from several threads at once.
+    """
+    def __init__(self):
+        self._entries = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def transform(
+        self,
+        path: _StreamingPath,
+        transform_func: Callable[[np.ndarray], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Transform the vertices of a streaming path, reusing the results of
+        previous calls for samples that were already transformed.
+
+        Parameters
+        ----------
+        path: _StreamingPath
+            The path to transform.
+
+        transform_func: Callable[[np.ndarray], np.ndarray]
+            Transforms an (N, 2) array of points.
+
+        Returns
+        -------
+        np.ndarray
+            The transformed vertices, copied out of the cache, as other
+            threads may append to it.
+        """
+        with self._lock:
+            return self._transform(path, transform_func).copy()
+
+    def _transform(
+        self,
+        path: _StreamingPath,
+        transform_func: Callable[[np.ndarray], np.ndarray]
+    ) -> np.ndarray:
+        vertices = path.vertices
+        entry = self._entries.get(path.stream, None)
+
+        if (entry is not None and entry[0] == path.stream_generation):
+            generation, end, buffer = entry
+            new = path.stream_end - end
+            if (0 <= new <= len(vertices)):
+                if (new > 0):
+                    buffer.append(transform_func(vertices[-new:]))
+                result = buffer.view()
+                if (len(result) == len(vertices)):
+                    entry[1] = path.stream_end
+                    return result
+
+        # Nothing usable cached, transform every sample.
+        buffer = _RingBuffer(path.stream.capacity)
+        buffer.append(transform_func(vertices))
+        self._entries[path.stream] = [
+            path.stream_generation, path.stream_end, buffer
+        ]
+        return buffer.view()
+
+
+class _StreamingTransformedPath(TransformedPath):
+    """
+    PRIVATE: A transformed path which applies the non-affine part of its
+    transform to streaming paths incrementally.
+    """
+    def __init__(
+        self, path: Path, transform: Transform, cache: _StreamTransformCache
+    ):
+        super().__init__(path, transform)
+        self._stream_cache = cache
+
+    def _invalidate_internal(self, level, invalidating_node):
+        if (level != self._INVALID_AFFINE_ONLY):
+            self._stream_cache.clear()
+        super()._invalidate_internal(level, invalidating_node)
+
+    def _revalidate(self):
+        path = self._path
+        if (
+            self._transform.is_affine
+            or not isinstance(path, _StreamingPath)
+            or path._interpolation_steps != 1
+        ):
+            return super()._revalidate()
+
+        if (
+            self._invalid == self._INVALID_FULL
+            or self._transformed_path is None
+        ):
+            vertices = self._stream_cache.transform(
+                path, self._transform.transform_non_affine
+            )
+            self._transformed_path = path.with_vertices(vertices)
+            self._transformed_points = self._transformed_path
+        self._invalid = 0
+
+
+class StreamingLine2D(Line2D):
+    """
+    A line backed by a fixed capacity ring buffer, for plotting live data.
+    Once the buffer is full, appending samples drops the oldest ones.
+
+    Appending doesn't copy the existing samples, and the non-affine part of
+    the line's transform (and of the transform of any view displaying the
+    line) is only applied to the newly appended samples, with previously
+    transformed samples reused. Samples must be numeric, unit conversion is
+    not supported.
+    """
+    def __init__(self, capacity: int, xdata=(), ydata=(), **kwargs):
+        """
+        Construct a new streaming line.
+
+        Parameters
+        ----------
+        capacity: int
+            The maximum number of samples the line holds.
+
+        xdata, ydata: array-like, optional
+            The initial samples of the line.
+
+        **kwargs
+            Other keyword arguments are passed to
+            `~matplotlib.lines.Line2D`.
+        """
+        self._buffer = _RingBuffer(capacity)
+        self._stream_cache = _StreamTransformCache()
+        super().__init__(xdata, ydata, **kwargs)
+
+    def get_capacity(self) -> int:
+        """
+        Get the maximum number of samples the line holds.
+        """
+        return self._buffer.capacity
+
+    def get_sample_count(self) -> int:
+        """
+        Get the number of samples appended since the data was last set,
+        including samples which have since been dropped.
+        """
+        return self._buffer.total
+
+    def append(self, x, y):
+        """
+        Append samples to the end of the line, dropping the oldest samples if
+        the line is over capacity.
+
+        Parameters
+        ----------
+        x, y: float or array-like
+            The samples to append.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        self._buffer.append(np.column_stack(np.broadcast_arrays(x, y)))
+        self._invalidx = True
+        self.stale = True
+
+    def set_data(self, *args):
+        """
+        Replace the samples of the line.
+
+        Parameters
+        ----------
+        *args: (2, N) array or two 1D arrays
+        """
+        if (len(args) == 1):
+            (x, y), = args
+        else:
+            x, y = args
+
+        self._buffer.clear()
+        self.append(x, y)
+
+    def set_xdata(self, x):
+        self.set_data(x, self.get_ydata())
+
+    def set_ydata(self, y):
+        self.set_data(self.get_xdata(), y)
+
+    def set_transform(self, t: Transform):
+        self._stream_cache.clear()
+        super().set_transform(t)
+
+    def recache(self, always: bool = False):
+        xy = self._buffer.view()
+        self._xy = xy
+        self._xorig, self._yorig = self._x, self._y = xy.T
+        self._subslice = False
+
+        interpolation_steps = 1
+        if (self._path is not None):
+            interpolation_steps = self._path._interpolation_steps
+
+        if (self._drawstyle in (None, "default")):
+            self._path = _StreamingPath.from_buffer(
+                self._buffer, _interpolation_steps=interpolation_steps
+            )
+        else:
+            # Step lines add vertices, so can't be updated incrementally.
+            steps = self._get_drawstyle_steps(xy)
+            self._path = Path(
+                steps, _interpolation_steps=interpolation_steps
+            )
+
+        self._transformed_path = None
+        self._invalidx = False
+        self._invalidy = False
+
+    def _get_drawstyle_steps(self, xy: np.ndarray) -> np.ndarray:
+        from matplotlib.cbook import STEP_LOOKUP_MAP
+        return np.asarray(STEP_LOOKUP_MAP[self._drawstyle](*xy.T)).T
+
+    def _transform_path(self, subslice=None):
+        self._transformed_path = _StreamingTransformedPath(
+            self._path, self.get_transform(), self._stream_cache
+        )
+
+    def get_window_extent(self, renderer=None):
+        if (self._invalidx or self._invalidy):
+            self.recache()
+        # Reuse the incrementally transformed samples, only the corners of
+        # their bounds need the affine part of the transform.
+        tpath, affine = (
+            self._get_transformed_path().get_transformed_points_and_affine()
+        )
+        bounds = Bbox.null()
+        bounds.update_from_data_xy(tpath.vertices, ignore=True)
+        bbox = Bbox([[0, 0], [0, 0]])
+        if (np.all(np.isfinite(bounds.get_points()))):
+            (x0, y0), (x1, y1) = bounds.get_points()
+            bbox.update_from_data_xy(
+                affine.transform([[x0, y0], [x0, y1], [x1, y0], [x1, y1]]),
+                ignore=True
+            )
+
+        if (self._marker):
+            ms = (self._markersize / 72.0 * self.figure.dpi) * 0.5
+            bbox = bbox.padded(ms)
+        return bbox
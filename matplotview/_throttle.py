@@ -0,0 +1,92 @@
+import time
+from typing import Hashable, Optional
+
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import RendererBase
+from matplotlib.patches import Rectangle
+
+
+def _has_opaque_background(view: Axes) -> bool:
+    """
+    PRIVATE: Check if a view draws an opaque rectangular background over its
+    whole window extent.
+    """
+    patch = view.patch
+    return (
+        view.axison and view.get_frame_on() and patch.get_visible()
+        and isinstance(patch, Rectangle) and patch.get_facecolor()[3] == 1
+    )
+
+
+class _CachedViewOutput:
+    """
+    PRIVATE: Holds the last full rendering of a view's interior, which is
+    shown instead of redrawing the viewed axes while view updates are
+    throttled, and schedules an update for once the interval has passed.
+    """
+    def __init__(self):
+        self._key = None
+        self._region = None
+        self._time = -float("inf")
+        self._timer = None
+
+    @staticmethod
+    def get_key(view: Axes, renderer: RendererBase) -> Optional[Hashable]:
+        """
+        Get the key the output of a view is cached under, or None if the
+        output can't be cached with this renderer, or the view doesn't
+        cover its whole window extent with an opaque background (the cached
+        output would hide changes to content beneath the view).
+        """
+        canvas = view.figure.canvas
+        if (
+            not hasattr(renderer, "copy_from_bbox")
+            or getattr(canvas, "_is_saving", False)
+            or not _has_opaque_background(view)
+        ):
+            return None
+        return (
+            id(renderer), renderer.get_canvas_width_height(),
+            tuple(view.get_window_extent().bounds),
+            tuple(view.get_xlim()), tuple(view.get_ylim())
+        )
+
+    def clear(self):
+        self._key = None
+        self._region = None
+
+    def is_current(self, key: Hashable, interval: float) -> bool:
+        """
+        Check if the cached output can be shown for the passed key, which
+        is the case if it was rendered less than interval seconds ago.
+        """
+        return (
+            self._region is not None and key == self._key
+            and time.perf_counter() - self._time < interval
+        )
+
+    def store(self, key: Hashable, view: Axes, renderer: RendererBase):
+        self._key = key
+        self._region = renderer.copy_from_bbox(view.get_window_extent())
+        self._time = time.perf_counter()
+
+    def restore(self, view: Axes, renderer: RendererBase, interval: float):
+        """
+        Draw the cached output, and schedule a redraw of the figure for when
+        the interval is up, so the view catches up once changes stop.
+        """
+        renderer.restore_region(self._region)
+        if (self._timer is not None):
+            return
+
+        canvas = view.figure.canvas
+        remaining = interval - (time.perf_counter() - self._time)
+        timer = canvas.new_timer(interval=max(int(remaining * 1000) + 1, 1))
+        timer.single_shot = True
+        timer.add_callback(self._on_timer, canvas)
+        self._timer = timer
+        timer.start()
+
+    def _on_timer(self, canvas):
+        self._timer = None
+        canvas.draw_idle()
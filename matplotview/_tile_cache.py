@@ -0,0 +1,216 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import RendererBase
+from matplotlib.patches import Rectangle
+from matplotlib.transforms import Affine2D, Bbox
+
+from matplotview._docs import _InternalArtist
+from matplotview._transform_renderer import _TransformRenderer
+
+
+class _TileRenderer(_TransformRenderer):
+    """
+    PRIVATE: A transform renderer drawing into a single tile, which clips to
+    the tile instead of the window of the view.
+    """
+    def __init__(self, tile_size: int, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tile_box = Bbox.from_bounds(0, 0, tile_size, tile_size)
+
+    def _get_axes_display_box(self) -> Bbox:
+        return self._tile_box
+
+
+class _TileCache:
+    """
+    PRIVATE: A least recently used cache of the tiles a view has rendered of
+    a viewed axes, holding at most a set number of bytes of pixels. Locked,
+    as views may be drawn from several threads at once.
+    """
+    def __init__(self):
+        self._tiles = OrderedDict()
+        self._nbytes = 0
+        self._content = None
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def clear(self):
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        self._tiles.clear()
+        self._nbytes = 0
+
+    def validate(self, content: tuple):
+        """
+        Clear the cache if the viewed content changed, content being objects
+        which are replaced when the viewed artists change.
+        """
+        with self._lock:
+            if (
+                self._content is None or len(content) != len(self._content)
+                or any(a is not b for a, b in zip(content, self._content))
+            ):
+                self._clear()
+                self._content = content
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        with self._lock:
+            tile = self._tiles.get(key, None)
+            if (tile is not None):
+                self._tiles.move_to_end(key)
+            return tile
+
+    def put(self, key: Hashable, tile: np.ndarray, max_bytes: int):
+        with self._lock:
+            old = self._tiles.pop(key, None)
+            if (old is not None):
+                self._nbytes -= old.nbytes
+            self._tiles[key] = tile
+            self._nbytes += tile.nbytes
+            # Evict the least recently used tiles, but always keep the
+            # newest.
+            while (self._nbytes > max_bytes and len(self._tiles) > 1):
+                __, evicted = self._tiles.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+
+def _can_tile(renderer: RendererBase, view_axes: Axes) -> bool:
+    """
+    PRIVATE: Check if a view can be assembled from tiles. Tiles are only
+    rendered with Agg, for rectangular 2D views with affine data transforms
+    (where panning only translates the content).
+    """
+    from matplotlib.backends.backend_agg import RendererAgg
+    return (
+        isinstance(renderer, RendererAgg)
+        and view_axes.name != "3d"
+        and isinstance(view_axes.patch, Rectangle)
+        and view_axes.transData.is_affine
+    )
+
+
+def _get_zoom_key(view_axes: Axes, viewed_axes: Axes) -> tuple:
+    """
+    PRIVATE: Get a key which stays the same while a view is panned, but
+    changes when it's zoomed, or the viewed axes is zoomed or panned (which
+    changes scaled line widths and markers). Rounded, as panning changes
+    the span of the limits by floating point error.
+    """
+    scale = view_axes.transData.get_matrix()[:2, :2]
+    viewed = viewed_axes.transData.get_affine().get_matrix()[:2]
+    return (
+        tuple(float(f"{v:.9g}") for v in scale.ravel()),
+        tuple(float(f"{v:.9g}") for v in viewed.ravel()),
+        viewed_axes.get_xscale(), viewed_axes.get_yscale()
+    )
+
+
+class _TiledViewArtist(_InternalArtist):
+    """
+    PRIVATE: Draws the artists a view borrows from a viewed axes by
+    assembling the view from fixed size tiles, which are rendered on demand
+    and cached. While panning at the same zoom level, only tiles which
+    weren't visible before are rendered.
+
+    Tiles are positioned on whole pixels, so content may be shifted by up
+    to half a pixel compared to drawing the view directly.
+    """
+    def __init__(
+        self,
+        view_axes: Axes,
+        viewed_axes: Axes,
+        cache: _TileCache,
+        key: Hashable,
+        tile_size: int,
+        max_bytes: int,
+        make_tile_artists: Callable[
+            [RendererBase, Affine2D, tuple, tuple], List[Artist]
+        ],
+        zorder: float,
+        stats=None
+    ):
+        super().__init__()
+        self._view_axes = view_axes
+        self._viewed_axes = viewed_axes
+        self._cache = cache
+        self._key = key
+        self._tile_size = tile_size
+        self._max_bytes = max_bytes
+        self._make_tile_artists = make_tile_artists
+        self._stats = stats
+        self.set_zorder(zorder)
+
+    def _render_tile(
+        self, renderer: RendererBase, offset: np.ndarray, i: int, j: int
+    ) -> np.ndarray:
+        from matplotlib.backends.backend_agg import RendererAgg
+        size = self._tile_size
+        offscreen = RendererAgg(size, size, renderer.dpi)
+        # From view data coordinates to pixels within this tile...
+        tile_transform = Affine2D(
+            self._view_axes.transData.get_matrix().copy()
+        ).translate(-offset[0] - i * size, -offset[1] - j * size)
+
+        # The data limits of the tile, used to cull artists.
+        (x0, y0), (x1, y1) = tile_transform.inverted().transform(
+            [[0, 0], [size, size]]
+        )
+
+        artists = sorted(
+            self._make_tile_artists(
+                offscreen, tile_transform, (x0, x1), (y0, y1)
+            ),
+            key=lambda a: a.get_zorder()
+        )
+        for artist in artists:
+            artist.draw(offscreen)
+
+        # Buffer rows go top to bottom, images are drawn bottom to top.
+        return np.asarray(offscreen.buffer_rgba())[::-1].copy()
+
+    def draw(self, renderer: RendererBase):
+        size = self._tile_size
+        offset = self._view_axes.transData.get_matrix()[:2, 2]
+        bbox = self._view_axes.get_window_extent()
+
+        # The tiles covering the view, in the coordinates of the tile grid,
+        # which moves with the content.
+        i0 = int(np.floor((bbox.x0 - offset[0]) / size))
+        i1 = int(np.ceil((bbox.x1 - offset[0]) / size))
+        j0 = int(np.floor((bbox.y0 - offset[1]) / size))
+        j1 = int(np.ceil((bbox.y1 - offset[1]) / size))
+        x_origin, y_origin = np.round(offset).astype(int)
+
+        gc = renderer.new_gc()
+        gc.set_clip_rectangle(bbox)
+
+        for i in range(i0, i1):
+            for j in range(j0, j1):
+                key = (self._key, size, renderer.dpi, i, j)
+                tile = self._cache.get(key)
+                if (tile is None):
+                    tile = self._render_tile(renderer, offset, i, j)
+                    self._cache.put(key, tile, self._max_bytes)
+                    if (self._stats is not None):
+                        self._stats.tiles_rendered += 1
+                elif (self._stats is not None):
+                    self._stats.tiles_reused += 1
+
+                renderer.draw_image(
+                    gc, x_origin + i * size, y_origin + j * size, tile
+                )
+
+        gc.restore()
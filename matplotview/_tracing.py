@@ -0,0 +1,142 @@
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from matplotlib.axes import Axes
+
+# The tracer of the current context (thread or asyncio task), so traces on
+# different threads never record each other's draws.
+_active_tracer = contextvars.ContextVar(
+    "matplotview_active_tracer", default=None
+)
+
+
+def _axes_name(axes: Optional[Axes]) -> str:
+    """
+    PRIVATE: Get a readable name for an axes, used to label trace events.
+    """
+    if (axes is None):
+        return "None"
+    label = axes.get_label()
+    if (label and not label.startswith("<")):
+        return label
+    return f"{type(axes).__name__} at {id(axes):#x}"
+
+
+class ViewTracer:
+    """
+    Collects begin/end events of view draws, which can be saved in the
+    Chrome trace event format and inspected in a trace viewer such as
+    Perfetto or chrome://tracing. Use `trace_views` to enable tracing.
+    """
+    def __init__(self):
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """
+        The trace events recorded so far.
+        """
+        return self._events
+
+    def _add_event(self, phase: str, name: str, category: str, args: dict):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": phase,
+            "ts": time.perf_counter_ns() / 1000,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+            "args": args
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def begin(self, name: str, category: str, **args):
+        """
+        Record the beginning of a traced draw.
+
+        Parameters
+        ----------
+        name: str
+            The name of the event.
+
+        category: str
+            The category of the event, "view" or "artist".
+
+        **args
+            Additional information to store with the event.
+        """
+        self._add_event("B", name, category, args)
+
+    def end(self, name: str, category: str, **args):
+        """
+        Record the end of a traced draw, see `begin`.
+        """
+        self._add_event("E", name, category, args)
+
+    def save(self, file: Union[str, os.PathLike]):
+        """
+        Write the recorded events to a Chrome trace JSON file.
+
+        Parameters
+        ----------
+        file: str or PathLike
+            The path of the JSON file to write.
+        """
+        with open(file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traceEvents": self._events, "displayTimeUnit": "ms"}, f
+            )
+
+
+def get_active_tracer() -> Optional[ViewTracer]:
+    """
+    PRIVATE: Get the view tracer active in the current context, or None if
+    not tracing.
+    """
+    return _active_tracer.get()
+
+
+@contextlib.contextmanager
+def trace_views(
+    file: Optional[Union[str, os.PathLike]] = None
+) -> Iterator[ViewTracer]:
+    """
+    Trace all view draws within this context, recording when each view
+    draws and when each artist it borrows from a viewed axes is drawn.
+    Only draws in the current thread (or asyncio task) are traced.
+
+    Parameters
+    ----------
+    file: optional str or PathLike
+        A file to write the trace to in Chrome trace JSON format when the
+        context exits. The trace can be opened with Perfetto
+        (https://ui.perfetto.dev) or chrome://tracing.
+
+    Yields
+    ------
+    ViewTracer
+        The tracer recording the events.
+
+    Examples
+    --------
+    ::
+
+        with trace_views("frame.json"):
+            fig.savefig("frame.png")
+    """
+    tracer = ViewTracer()
+    token = _active_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _active_tracer.reset(token)
+        if (file is not None):
+            tracer.save(file)
@@ -1,16 +1,27 @@
-from typing import Tuple, Union
+import threading
+import weakref
+from typing import Optional, Tuple, Union
 from matplotlib.axes import Axes
 from matplotlib.backend_bases import RendererBase, GraphicsContextBase
 from matplotlib.font_manager import FontProperties
 from matplotlib.patches import Rectangle
 from matplotlib.texmanager import TexManager
 from matplotlib.transforms import Bbox, IdentityTransform, Affine2D, \
-    TransformedPatchPath, Transform
+    TransformedPatchPath, TransformedPath, Transform
 from matplotlib.path import Path
 import matplotlib._image as _image
 import numpy as np
 from matplotlib.image import _interpd_
 from matplotview._docs import dynamic_doc_string, get_interpolation_list_str
+from matplotview._render_stats import RenderStats, record_draw_stats
+from matplotview._streaming import _StreamingPath, _StreamTransformCache
+from matplotview._image_warp import _WarpMeshCache, _get_warped_bbox
+from matplotview._collection_culling import (
+    MIN_CULLED_ITEMS,
+    _get_item_count,
+    _get_visible_items,
+    _take_collection_items
+)
 
 ColorTup = Union[
     None,
@@ -19,6 +30,117 @@ ColorTup = Union[
 ]
 
 
+class _ViewTransferTransform(Transform):
+    """
+    A transform from the scaled coordinate space of the viewed axes (data
+    coordinates after the non-affine part of its transData has been applied,
+    which is what most artists pass to the renderer) to display coordinates
+    of the view axes.
+
+    The non-affine part of this transform (undoing the viewed axes
+    non-affine stage, and then applying the view's) is cached per path, and
+    only recomputed when the non-affine part of either axes transform is
+    invalidated. Panning or zooming either axes only changes the affine part.
+    For streaming paths, only newly appended samples are transformed. It
+    also holds the warp meshes of images drawn through the transform.
+    """
+    input_dims = 2
+    output_dims = 2
+    is_affine = False
+    pass_through = True
+
+    def __init__(self, mock_transform: Transform, transform: Transform):
+        """
+        Construct a new transfer transform.
+
+        Parameters
+        ----------
+        mock_transform: `~matplotlib.transforms.Transform`
+            The data transform of the viewed axes.
+
+        transform: `~matplotlib.transforms.Transform`
+            The data transform of the view axes.
+        """
+        super().__init__()
+        self._mock_trans = mock_transform
+        self._core_trans = transform
+        self.set_children(mock_transform, transform)
+        self._path_cache = weakref.WeakKeyDictionary()
+        self._path_cache_lock = threading.Lock()
+        self._stream_cache = _StreamTransformCache()
+        self._warp_cache = _WarpMeshCache()
+
+    def _invalidate_internal(self, level, invalidating_node):
+        # Only throw out cached vertices if the non-affine part changed.
+        if (level != self._INVALID_AFFINE_ONLY):
+            with self._path_cache_lock:
+                self._path_cache.clear()
+            self._stream_cache.clear()
+        super()._invalidate_internal(level, invalidating_node)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Weak key dictionaries and locks can't be pickled, drop the cache.
+        del state["_path_cache"]
+        del state["_path_cache_lock"]
+        del state["_stream_cache"]
+        del state["_warp_cache"]
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._path_cache = weakref.WeakKeyDictionary()
+        self._path_cache_lock = threading.Lock()
+        self._stream_cache = _StreamTransformCache()
+        self._warp_cache = _WarpMeshCache()
+
+    def transform_non_affine(self, values: np.ndarray) -> np.ndarray:
+        # Go back to data space of the viewed axes, then apply the non-affine
+        # part of the view transform.
+        values = self._mock_trans.inverted().transform(
+            self._mock_trans.get_affine().transform(values)
+        )
+        return self._core_trans.transform_non_affine(values)
+
+    def get_affine(self) -> Transform:
+        return self._core_trans.get_affine()
+
+    def transform_path_vertices(self, path: Path) -> np.ndarray:
+        """
+        Transform the vertices of a path to display coordinates, reusing the
+        results of the non-affine stage from previous calls with the same
+        path. Like `~matplotlib.transforms.TransformedPath`, paths are
+        assumed to be immutable.
+
+        Parameters
+        ----------
+        path: `~matplotlib.path.Path`
+            The path to transform, in the scaled space of the viewed axes.
+
+        Returns
+        -------
+        np.ndarray
+            The vertices of the path in display coordinates.
+        """
+        if (isinstance(path, _StreamingPath)):
+            with np.errstate(all="ignore"):
+                vertices = self._stream_cache.transform(
+                    path, self.transform_non_affine
+                )
+            return self.get_affine().transform(vertices)
+
+        # Views may be drawn from several threads at once, but the transform
+        # is done outside the lock, at worst it's done twice.
+        with self._path_cache_lock:
+            vertices = self._path_cache.get(path, None)
+        if (vertices is None):
+            with np.errstate(all="ignore"):
+                vertices = self.transform_non_affine(path.vertices)
+            with self._path_cache_lock:
+                self._path_cache[path] = vertices
+        return self.get_affine().transform(vertices)
+
+
 class _TransformRenderer(RendererBase):
     """
     A matplotlib renderer which performs transforms to change the final
@@ -34,7 +156,10 @@ class _TransformRenderer(RendererBase):
         transform: Transform,
         bounding_axes: Axes,
         image_interpolation: str = "nearest",
-        scale_linewidths: bool = True
+        scale_linewidths: bool = True,
+        transfer_transform: Optional[_ViewTransferTransform] = None,
+        stats: Optional[RenderStats] = None,
+        use_data_providers: bool = True
     ):
         """
         Constructs a new TransformRender.
@@ -70,6 +195,18 @@ class _TransformRenderer(RendererBase):
             Specifies if line widths should be scaled, in addition to the
             paths themselves.
 
+        transfer_transform: optional `._ViewTransferTransform`
+            A transfer transform between the mock_transform and transform,
+            which caches non-affine results between draws. Views pass a
+            persistent instance, if not provided a new one is created.
+
+        stats: optional `.RenderStats`
+            If provided, rendering statistics are recorded into this object.
+
+        use_data_providers: bool, default is {use_data_providers}
+            Specifies if artists backed by a data provider should request
+            data for the bounding axes, instead of the axes they belong to.
+
         Returns
         -------
         `~._zoom_axes._TransformRenderer`
@@ -81,6 +218,14 @@ class _TransformRenderer(RendererBase):
         self.__core_trans = transform
         self.__bounding_axes = bounding_axes
         self.__scale_widths = scale_linewidths
+        if (transfer_transform is None):
+            transfer_transform = _ViewTransferTransform(
+                mock_transform, transform
+            )
+        self.__transfer_trans = transfer_transform
+        self.__stats = stats
+        self.__use_data_providers = use_data_providers
+        self._timing_draw = False
 
         try:
             self.__img_inter = _interpd_[image_interpolation.lower()]
@@ -93,26 +238,48 @@ class _TransformRenderer(RendererBase):
     def bounding_axes(self) -> Axes:
         return self.__bounding_axes
 
-    def _scale_gc(self, gc: GraphicsContextBase) -> GraphicsContextBase:
+    @property
+    def base_renderer(self) -> RendererBase:
+        return self.__renderer
+
+    @property
+    def stats(self) -> Optional[RenderStats]:
+        return self.__stats
+
+    @property
+    def use_data_providers(self) -> bool:
+        return self.__use_data_providers
+
+    def _get_width_scale(self) -> Optional[float]:
+        """
+        Private method, get the factor line widths are scaled by when drawn
+        into the view with scaled lines, or None if they can't be scaled.
+        """
         with np.errstate(all='ignore'):
             transfer_transform = self._get_transfer_transform(
                 IdentityTransform()
             )
-            new_gc = self.__renderer.new_gc()
-            new_gc.copy_properties(gc)
-
             unit_box = Bbox.from_bounds(0, 0, 1, 1)
             unit_box = transfer_transform.transform_bbox(unit_box)
             mult_factor = np.sqrt(unit_box.width * unit_box.height)
 
-            if (mult_factor == 0 or (not np.isfinite(mult_factor))):
-                return new_gc
+        if (mult_factor == 0 or (not np.isfinite(mult_factor))):
+            return None
+        return mult_factor
 
-            new_gc.set_linewidth(gc.get_linewidth() * mult_factor)
-            new_gc._hatch_linewidth = gc.get_hatch_linewidth() * mult_factor
+    def _scale_gc(self, gc: GraphicsContextBase) -> GraphicsContextBase:
+        new_gc = self.__renderer.new_gc()
+        new_gc.copy_properties(gc)
 
+        mult_factor = self._get_width_scale()
+        if (mult_factor is None):
             return new_gc
 
+        new_gc.set_linewidth(gc.get_linewidth() * mult_factor)
+        new_gc._hatch_linewidth = gc.get_hatch_linewidth() * mult_factor
+
+        return new_gc
+
     def _get_axes_display_box(self) -> Bbox:
         """
         Private method, get the bounding box of the child axes in display
@@ -120,6 +287,13 @@ class _TransformRenderer(RendererBase):
         """
         return self.__bounding_axes.get_window_extent()
 
+    def _get_axes_clip_path(self) -> TransformedPath:
+        """
+        Private method, get the path of the child axes patch in display
+        coordinates, used to clip to non-rectangular axes.
+        """
+        return TransformedPatchPath(self.__bounding_axes.patch)
+
     def _get_transfer_transform(self, orig_transform: Transform) -> Transform:
         """
         Private method, returns the transform which translates and scales
@@ -139,6 +313,22 @@ class _TransformRenderer(RendererBase):
             display coordinates if the data was originally plotted on the
             child axes instead of the parent axes.
         """
+        # If the original transform goes through the parent data transform,
+        # we can skip it and go straight from data space to the child axes.
+        if (orig_transform.contains_branch(self.__mock_trans)):
+            return (orig_transform - self.__mock_trans) + self.__core_trans
+
+        # Most artists apply the non-affine part of the transform themselves
+        # and pass the affine part of the parent data transform, use the
+        # cached transfer transform for those.
+        if (
+            orig_transform.is_affine and np.array_equal(
+                orig_transform.get_matrix(),
+                self.__mock_trans.get_affine().get_matrix()
+            )
+        ):
+            return self.__transfer_trans
+
         # We apply the original transform to go to display coordinates, then
         # apply the parent data transform inverted to go to the parent axes
         # coordinate space (data space), then apply the child axes data
@@ -148,6 +338,23 @@ class _TransformRenderer(RendererBase):
             orig_transform + self.__mock_trans.inverted() + self.__core_trans
         )
 
+    def _transform_path(self, path: Path, orig_transform: Transform) -> Path:
+        """
+        Private method, transform a path to display coordinates as if it was
+        plotted on the child axes, reusing cached non-affine results where
+        possible.
+        """
+        transfer_transform = self._get_transfer_transform(orig_transform)
+        if (self.__stats is not None):
+            self.__stats.vertices_transformed += len(path.vertices)
+
+        if (transfer_transform is self.__transfer_trans):
+            vertices = transfer_transform.transform_path_vertices(path)
+        else:
+            vertices = transfer_transform.transform(path.vertices)
+
+        return Path._fast_from_codes_and_verts(vertices, path.codes, path)
+
     # We copy all of the properties of the renderer we are mocking, so that
     # artists plot themselves as if they were placed on the original renderer.
     @property
@@ -201,6 +408,7 @@ class _TransformRenderer(RendererBase):
         return self.__renderer.new_gc()
 
     # Actual drawing methods below:
+    @record_draw_stats
     def draw_path(
         self,
         gc: GraphicsContextBase,
@@ -210,24 +418,22 @@ class _TransformRenderer(RendererBase):
     ):
         # Convert the path to display coordinates, but if it was originally
         # drawn on the child axes.
-        path = path.deepcopy()
-        path.vertices = self._get_transfer_transform(transform).transform(
-            path.vertices
-        )
+        path = self._transform_path(path, transform)
         bbox = self._get_axes_display_box()
 
-        # We check if the path intersects the axes box at all, if not don't
-        # waste time drawing it.
-        if (not path.intersects_bbox(bbox, True)):
-            return
-
         if (self.__scale_widths):
             gc = self._scale_gc(gc)
 
+        # We check if the path (with its stroke) intersects the axes box at
+        # all, if not don't waste time drawing it.
+        stroke_pad = 0.5 * self.points_to_pixels(gc.get_linewidth())
+        if (not path.intersects_bbox(bbox.padded(stroke_pad), True)):
+            return
+
         # Change the clip to the sub-axes box
         gc.set_clip_rectangle(bbox)
         if (not isinstance(self.__bounding_axes.patch, Rectangle)):
-            gc.set_clip_path(TransformedPatchPath(self.__bounding_axes.patch))
+            gc.set_clip_path(self._get_axes_clip_path())
 
         rgbFace = tuple(rgbFace) if (rgbFace is not None) else None
 
@@ -251,6 +457,7 @@ class _TransformRenderer(RendererBase):
         # checked above... (Above case causes error)
         super()._draw_text_as_path(gc, x, y, s, prop, angle, ismath)
 
+    @record_draw_stats
     def draw_markers(
         self,
         gc,
@@ -267,18 +474,18 @@ class _TransformRenderer(RendererBase):
             return
 
         # Otherwise we transform just the marker offsets (not the marker patch), so they stay the same size.
-        path = path.deepcopy()
-        path.vertices = self._get_transfer_transform(trans).transform(path.vertices)
+        path = self._transform_path(path, trans)
         bbox = self._get_axes_display_box()
 
         # Change the clip to the sub-axes box
         gc.set_clip_rectangle(bbox)
         if (not isinstance(self.__bounding_axes.patch, Rectangle)):
-            gc.set_clip_path(TransformedPatchPath(self.__bounding_axes.patch))
+            gc.set_clip_path(self._get_axes_clip_path())
 
         rgbFace = tuple(rgbFace) if (rgbFace is not None) else None
         self.__renderer.draw_markers(gc, marker_path, marker_trans, path, IdentityTransform(), rgbFace)
 
+    @record_draw_stats
     def draw_path_collection(
         self,
         gc,
@@ -295,6 +502,35 @@ class _TransformRenderer(RendererBase):
         urls,
         offset_position,
     ):
+        # Drop the items of large collections (such as contour and polygon
+        # collections) which are entirely outside of the view...
+        n_items = _get_item_count(paths, all_transforms, offsets)
+        if (n_items >= MIN_CULLED_ITEMS):
+            # Strokes reach half their width outside of the paths...
+            widths = linewidths if (len(linewidths)) else [gc.get_linewidth()]
+            stroke_pad = 0.5 * self.points_to_pixels(np.max(widths))
+            if (self.__scale_widths):
+                stroke_pad *= self._get_width_scale() or 1
+            with np.errstate(all="ignore"):
+                visible = _get_visible_items(
+                    self._get_axes_display_box().padded(stroke_pad),
+                    self._get_transfer_transform(IdentityTransform()),
+                    master_transform, paths, all_transforms, offsets,
+                    offset_trans, self.__scale_widths
+                )
+            if (visible is not None and len(visible) < n_items):
+                if (self.__stats is not None):
+                    self.__stats.paths_culled += n_items - len(visible)
+                if (len(visible) == 0):
+                    return
+                (
+                    paths, all_transforms, offsets, facecolors, edgecolors,
+                    linewidths, linestyles, antialiaseds, urls
+                ) = _take_collection_items(
+                    visible, paths, all_transforms, offsets, facecolors,
+                    edgecolors, linewidths, linestyles, antialiaseds, urls
+                )
+
         # If we want accurate scaling for each marker (such as in log scale), just use superclass implementation...
         if (self.__scale_widths):
             super().draw_path_collection(
@@ -304,23 +540,96 @@ class _TransformRenderer(RendererBase):
             return
 
         # Otherwise we transform just the offsets, and pass them to the backend.
-        print(offsets)
-        if (np.any(np.isnan(offsets))):
-            raise ValueError("???")
         offsets = self._get_transfer_transform(offset_trans).transform(offsets)
-        print(offsets)
+        if (self.__stats is not None):
+            self.__stats.vertices_transformed += len(offsets)
         bbox = self._get_axes_display_box()
 
         # Change the clip to the sub-axes box
         gc.set_clip_rectangle(bbox)
         if (not isinstance(self.__bounding_axes.patch, Rectangle)):
-            gc.set_clip_path(TransformedPatchPath(self.__bounding_axes.patch))
+            gc.set_clip_path(self._get_axes_clip_path())
 
         self.__renderer.draw_path_collection(
             gc, master_transform, paths, all_transforms, offsets, IdentityTransform(), facecolors,
             edgecolors, linewidths, linestyles, antialiaseds, urls, None
         )
 
+    @record_draw_stats
+    def draw_quad_mesh(
+        self,
+        gc: GraphicsContextBase,
+        master_transform: Transform,
+        meshWidth: int,
+        meshHeight: int,
+        coordinates: np.ndarray,
+        offsets: np.ndarray,
+        offsetTrans: Transform,
+        facecolors: np.ndarray,
+        antialiased: bool,
+        edgecolors: np.ndarray
+    ):
+        # Offset meshes are rare, let the superclass convert them to a path
+        # collection...
+        if (np.any(offsets)):
+            super().draw_quad_mesh(
+                gc, master_transform, meshWidth, meshHeight, coordinates,
+                offsets, offsetTrans, facecolors, antialiased, edgecolors
+            )
+            return
+
+        # Transform the whole coordinate grid at once...
+        coordinates = self._get_transfer_transform(master_transform).transform(
+            coordinates.reshape(-1, 2)
+        ).reshape(coordinates.shape)
+        if (self.__stats is not None):
+            self.__stats.vertices_transformed += coordinates.shape[0] * coordinates.shape[1]
+        bbox = self._get_axes_display_box()
+
+        # Find the cells with bounding boxes intersecting the axes box, by
+        # reducing over neighbouring columns, then neighbouring rows.
+        def cell_bounds(values):
+            lo = np.minimum(values[:, :-1], values[:, 1:])
+            hi = np.maximum(values[:, :-1], values[:, 1:])
+            return np.minimum(lo[:-1], lo[1:]), np.maximum(hi[:-1], hi[1:])
+
+        x_lo, x_hi = cell_bounds(coordinates[..., 0])
+        y_lo, y_hi = cell_bounds(coordinates[..., 1])
+        visible = (
+            (x_hi >= bbox.x0) & (x_lo <= bbox.x1)
+            & (y_hi >= bbox.y0) & (y_lo <= bbox.y1)
+        )
+        rows = np.flatnonzero(visible.any(axis=1))
+        cols = np.flatnonzero(visible.any(axis=0))
+        if (len(rows) == 0):
+            return
+
+        # Only draw the smallest sub-grid containing all visible cells.
+        r0, r1 = int(rows[0]), int(rows[-1]) + 1
+        c0, c1 = int(cols[0]), int(cols[-1]) + 1
+        coordinates = coordinates[r0:r1 + 1, c0:c1 + 1]
+
+        def sub_colors(colors):
+            # Colors are either per cell, or a single color for all cells.
+            if (colors is None or len(colors) != meshWidth * meshHeight):
+                return colors
+            colors = np.asarray(colors).reshape(meshHeight, meshWidth, -1)
+            return colors[r0:r1, c0:c1].reshape(-1, colors.shape[-1])
+
+        if (self.__scale_widths):
+            gc = self._scale_gc(gc)
+
+        gc.set_clip_rectangle(bbox)
+        if (not isinstance(self.__bounding_axes.patch, Rectangle)):
+            gc.set_clip_path(self._get_axes_clip_path())
+
+        self.__renderer.draw_quad_mesh(
+            gc, IdentityTransform(), c1 - c0, r1 - r0, coordinates,
+            offsets, IdentityTransform(), sub_colors(facecolors),
+            antialiased, sub_colors(edgecolors)
+        )
+
+    @record_draw_stats
     def draw_gouraud_triangle(
         self,
         gc: GraphicsContextBase,
@@ -331,6 +640,8 @@ class _TransformRenderer(RendererBase):
         # Pretty much identical to draw_path, transform the points and adjust
         # clip to the child axes bounding box.
         points = self._get_transfer_transform(transform).transform(points)
+        if (self.__stats is not None):
+            self.__stats.vertices_transformed += len(points)
         path = Path(points, closed=True)
         bbox = self._get_axes_display_box()
 
@@ -342,12 +653,57 @@ class _TransformRenderer(RendererBase):
 
         gc.set_clip_rectangle(bbox)
         if (not isinstance(self.__bounding_axes.patch, Rectangle)):
-            gc.set_clip_path(TransformedPatchPath(self.__bounding_axes.patch))
+            gc.set_clip_path(self._get_axes_clip_path())
 
         self.__renderer.draw_gouraud_triangle(gc, path.vertices, colors,
                                               IdentityTransform())
 
+    @record_draw_stats
+    def draw_gouraud_triangles(
+        self,
+        gc: GraphicsContextBase,
+        triangles_array: np.ndarray,
+        colors_array: np.ndarray,
+        transform: Transform
+    ):
+        # Transform the points of all triangles at once...
+        triangles_array = np.asarray(triangles_array)
+        points = self._get_transfer_transform(transform).transform(
+            triangles_array.reshape(-1, 2)
+        ).reshape(triangles_array.shape)
+        if (self.__stats is not None):
+            self.__stats.vertices_transformed += len(points) * 3
+        bbox = self._get_axes_display_box()
+
+        # Skip triangles with bounding boxes outside the axes box, and don't
+        # call the backend at all if none are left. Bounds are computed per
+        # corner, as reducing over the short corner axis is much slower.
+        x, y = points[..., 0], points[..., 1]
+        visible = (
+            (np.maximum(np.maximum(x[:, 0], x[:, 1]), x[:, 2]) >= bbox.x0)
+            & (np.minimum(np.minimum(x[:, 0], x[:, 1]), x[:, 2]) <= bbox.x1)
+            & (np.maximum(np.maximum(y[:, 0], y[:, 1]), y[:, 2]) >= bbox.y0)
+            & (np.minimum(np.minimum(y[:, 0], y[:, 1]), y[:, 2]) <= bbox.y1)
+        )
+        if (not visible.any()):
+            return
+        colors_array = np.asarray(colors_array)
+        if (not visible.all()):
+            points = points[visible]
+            colors_array = colors_array[visible]
+
+        if (self.__scale_widths):
+            gc = self._scale_gc(gc)
+
+        gc.set_clip_rectangle(bbox)
+        if (not isinstance(self.__bounding_axes.patch, Rectangle)):
+            gc.set_clip_path(self._get_axes_clip_path())
+
+        self.__renderer.draw_gouraud_triangles(gc, points, colors_array,
+                                               IdentityTransform())
+
     # Images prove to be especially messy to deal with...
+    @record_draw_stats
     def draw_image(
         self,
         gc: GraphicsContextBase,
@@ -366,7 +722,10 @@ class _TransformRenderer(RendererBase):
         img_bbox_disp = Bbox.from_bounds(x, y, im.shape[1], im.shape[0])
         # Now compute the output location, clipping it with the final axes
         # patch.
-        out_box = img_bbox_disp.transformed(shift_data_transform)
+        if (shift_data_transform.is_affine):
+            out_box = img_bbox_disp.transformed(shift_data_transform)
+        else:
+            out_box = _get_warped_bbox(img_bbox_disp, shift_data_transform)
         clipped_out_box = Bbox.intersection(out_box, axes_bbox)
 
         if (clipped_out_box is None):
@@ -391,6 +750,15 @@ class _TransformRenderer(RendererBase):
             .scale(mag, mag)
         )
 
+        # For non-affine transforms, the resampler transforms every output
+        # pixel back into the image. Use a cached mesh interpolated from a
+        # coarse grid of transformed points instead.
+        if (not img_trans.is_affine):
+            img_trans = self.__transfer_trans._warp_cache.get_transform(
+                (img_bbox_disp.x0, img_bbox_disp.y0, im.shape[:2], mag),
+                img_trans, out_w, out_h
+            )
+
         # We resize and zoom the original image onto the out_arr.
         out_arr = np.zeros((out_h, out_w, im.shape[2]), dtype=im.dtype)
         trans_msk = np.zeros((out_h, out_w), dtype=im.dtype)
@@ -400,12 +768,16 @@ class _TransformRenderer(RendererBase):
                         alpha=1)
         out_arr[:, :, 3] = trans_msk
 
+        if (self.__stats is not None):
+            self.__stats.images_resampled += 1
+            self.__stats.pixels_produced += out_w * out_h
+
         if (self.__scale_widths):
             gc = self._scale_gc(gc)
 
         gc.set_clip_rectangle(clipped_out_box)
         if (not isinstance(self.__bounding_axes.patch, Rectangle)):
-            gc.set_clip_path(TransformedPatchPath(self.__bounding_axes.patch))
+            gc.set_clip_path(self._get_axes_clip_path())
 
         x, y = clipped_out_box.x0, clipped_out_box.y0
 
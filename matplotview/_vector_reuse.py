@@ -0,0 +1,396 @@
+import io
+import re
+import threading
+import weakref
+from typing import Callable, Hashable, List, Optional
+
+import matplotlib
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import RendererBase, GraphicsContextBase
+from matplotlib.image import _draw_list_compositing_images
+from matplotlib.patches import Rectangle
+from matplotlib.transforms import Affine2D, Bbox, TransformedPatchPath
+
+from matplotview._docs import _InternalArtist
+
+# Content caches for each vector renderer currently drawing...
+_content_caches = weakref.WeakKeyDictionary()
+# Guards the above, as figures may be saved from several threads at once.
+_content_caches_lock = threading.Lock()
+# If `_add_pdf_form` works with each type of PDF file, checked on first use.
+_pdf_form_support = weakref.WeakKeyDictionary()
+_pdf_form_support_lock = threading.Lock()
+
+
+def _get_vector_renderer(renderer: RendererBase) -> RendererBase:
+    """
+    PRIVATE: Get the renderer actually drawing, unwrapping the mixed mode
+    renderer vector backends use to support rasterization.
+    """
+    from matplotlib.backends.backend_mixed import MixedModeRenderer
+    if (isinstance(renderer, MixedModeRenderer)):
+        return renderer._renderer
+    return renderer
+
+
+class _VectorContentCache:
+    """
+    PRIVATE: Writes the content of viewed axes once to a vector output as a
+    reusable definition, which the viewed axes and its views then reference
+    with their own transform and clip. Subclasses implement this for a
+    specific backend.
+    """
+    def __init__(self, renderer: RendererBase):
+        self._renderer = renderer
+        self._definitions = {}
+
+    def draw_reused(
+        self,
+        key: Hashable,
+        draw_content: Callable[[], None],
+        transform: Affine2D,
+        gc: GraphicsContextBase
+    ):
+        """
+        Draw content, reusing a previously written definition of it if the
+        key was already drawn to this renderer.
+
+        Parameters
+        ----------
+        key: Hashable
+            A key identifying the content.
+
+        draw_content: Callable[[], None]
+            Draws the content (in display coordinates of the viewed axes)
+            to the renderer, called once per key.
+
+        transform: Affine2D
+            The transform from the display coordinates of the content to the
+            display coordinates of the view.
+
+        gc: GraphicsContextBase
+            Graphics context holding the clip rectangle and path to use, the
+            reference is unclipped if it has neither.
+        """
+        name = self._definitions.get(key, None)
+        if (name is None):
+            name = self._define(key, draw_content)
+            self._definitions[key] = name
+        self._reference(name, transform, gc)
+
+    def _define(self, key: Hashable, draw_content: Callable[[], None]):
+        raise NotImplementedError()
+
+    def _reference(self, name, transform: Affine2D, gc: GraphicsContextBase):
+        raise NotImplementedError()
+
+
+class _SVGContentCache(_VectorContentCache):
+    """
+    PRIVATE: Reuses content in SVG output, through <defs> and <use>.
+    """
+    def _define(self, key: Hashable, draw_content: Callable[[], None]) -> str:
+        renderer = self._renderer
+        oid = renderer._make_id("view", key)
+        renderer.writer.start("defs")
+        renderer.writer.start("g", id=oid)
+        draw_content()
+        renderer.writer.end("g")
+        renderer.writer.end("defs")
+        return oid
+
+    def _reference(self, name: str, transform: Affine2D, gc):
+        renderer = self._renderer
+        # SVG has a flipped y axis, flip before and after transforming...
+        flip = Affine2D().scale(1, -1).translate(0, renderer.height)
+        (a, c, e), (b, d, f), __ = (flip + transform + flip).get_matrix()
+        matrix = " ".join(str(float(v)) for v in (a, b, c, d, e, f))
+
+        # Clip paths apply after an element's transform, so clip a group
+        # containing the transformed reference.
+        renderer.writer.start("g", **renderer._get_clip_attrs(gc))
+        renderer.writer.element(
+            "use", attrib={"xlink:href": f"#{name}"},
+            transform=f"matrix({matrix})"
+        )
+        renderer.writer.end("g")
+
+
+class _CaptureStream:
+    """
+    PRIVATE: Stands in for the current PDF stream, capturing written data.
+    """
+    def __init__(self):
+        self.data = []
+
+    def write(self, data: bytes):
+        self.data.append(data)
+
+
+def _check_pdf_forms(file_type: type) -> bool:
+    """
+    PRIVATE: Check if `_add_pdf_form` works with a type of PDF file, by
+    adding a form to an empty file of the type, and checking the finished
+    file lists the form as an XObject and contains its content.
+    """
+    from matplotlib.backends.backend_pdf import Op
+
+    content = b"0 0 m 72 72 l S"
+    out = io.BytesIO()
+    try:
+        with matplotlib.rc_context({"pdf.compression": 0}):
+            pdf_file = file_type(out)
+            if not (
+                isinstance(
+                    getattr(pdf_file, "multi_byte_charprocs", None), dict
+                )
+                and callable(getattr(pdf_file, "writeMarkers", None))
+            ):
+                return False
+            pdf_file.newPage(1, 1)
+            name = _add_pdf_form(pdf_file, [0, 0, 72, 72], content)
+            pdf_file.output(name, Op.use_xobject)
+            pdf_file.finalize()
+            pdf_file.close()
+    except Exception:
+        return False
+
+    data = out.getvalue()
+    listed = re.search(rb"/MPV0 (\d+) 0 R", data)
+    return listed is not None and re.search(
+        rb"\n" + listed.group(1) + rb" 0 obj\s*<<[^>]*/Subtype /Form[^>]*>>"
+        rb"\s*stream\s*" + re.escape(content), data
+    ) is not None
+
+
+def _can_add_pdf_forms(pdf_file) -> bool:
+    """
+    PRIVATE: Check if `_add_pdf_form` can add forms to a PDF file. As it
+    relies on private file state, this is checked once for each type of
+    file (see `_check_pdf_forms`), instead of trusting matplotlib versions.
+    """
+    file_type = type(pdf_file)
+    with _pdf_form_support_lock:
+        supported = _pdf_form_support.get(file_type, None)
+        if (supported is None):
+            supported = _check_pdf_forms(file_type)
+            _pdf_form_support[file_type] = supported
+        return supported
+
+
+def _add_pdf_form(pdf_file, bbox: List[float], data: bytes):
+    """
+    PRIVATE: Add a Form XObject to a PDF file, returning its name. Matplotlib
+    has no public API for adding XObjects, so this uses private file state,
+    which is only ever accessed here: forms are listed with the XObjects of
+    multi-byte glyphs, and written out after the markers when finalizing,
+    as they can't be written while the page stream is open.
+    """
+    from matplotlib.backends.backend_pdf import Name
+
+    forms = getattr(pdf_file, "_matplotview_forms", None)
+    if (forms is None):
+        forms = []
+        pdf_file._matplotview_forms = forms
+        write_markers = pdf_file.writeMarkers
+
+        def write_markers_and_forms():
+            write_markers()
+            for ref, form_bbox, form_data in forms:
+                pdf_file.beginStream(ref.id, None, {
+                    "Type": Name("XObject"),
+                    "Subtype": Name("Form"),
+                    "BBox": form_bbox,
+                    "Resources": pdf_file.resourceObject
+                })
+                pdf_file.currentstream.write(form_data)
+                pdf_file.endStream()
+
+        pdf_file.writeMarkers = write_markers_and_forms
+
+    name = Name(f"MPV{len(forms)}")
+    ref = pdf_file.reserveObject("view content")
+    forms.append((ref, bbox, data))
+    pdf_file.multi_byte_charprocs[name] = ref
+    return name
+
+
+class _PDFContentCache(_VectorContentCache):
+    """
+    PRIVATE: Reuses content in PDF output, through Form XObjects.
+    """
+    def _define(self, key: Hashable, draw_content: Callable[[], None]):
+        renderer = self._renderer
+        pdf_file = renderer.file
+
+        # Capture the drawing commands, starting from a default graphics
+        # state as that is what is used when the form is referenced.
+        stream = _CaptureStream()
+        orig_stream, orig_gc = pdf_file.currentstream, renderer.gc
+        pdf_file.currentstream = stream
+        renderer.gc = renderer.new_gc()
+        try:
+            draw_content()
+            pdf_file.output(*renderer.gc.finalize())
+        finally:
+            pdf_file.currentstream = orig_stream
+            renderer.gc = orig_gc
+
+        bbox = [0, 0, pdf_file.width * 72, pdf_file.height * 72]
+        return _add_pdf_form(pdf_file, bbox, b"".join(stream.data))
+
+    def _reference(self, name, transform: Affine2D, gc):
+        from matplotlib.backends.backend_pdf import Op
+
+        renderer = self._renderer
+        pdf_file = renderer.file
+        # Return to the default graphics state the form was captured with.
+        renderer.check_gc(renderer.new_gc())
+
+        pdf_file.output(Op.gsave)
+        clip_path, clip_trans = gc.get_clip_path()
+        clip_rect = gc.get_clip_rectangle()
+        if (clip_path is not None):
+            pdf_file.writePath(clip_path, clip_trans)
+            pdf_file.output(Op.clip, Op.endpath)
+        elif (clip_rect is not None):
+            pdf_file.output(*clip_rect.bounds, Op.rectangle)
+            pdf_file.output(Op.clip, Op.endpath)
+        (a, c, e), (b, d, f), __ = transform.get_matrix()
+        pdf_file.output(a, b, c, d, e, f, Op.concat_matrix)
+        pdf_file.output(name, Op.use_xobject)
+        pdf_file.output(Op.grestore)
+
+
+def _get_content_cache(renderer: RendererBase) -> Optional[_VectorContentCache]:
+    """
+    PRIVATE: Get the content cache for a renderer, or None if the renderer
+    doesn't support reusing content.
+    """
+    from matplotlib.backends.backend_svg import RendererSVG
+    from matplotlib.backends.backend_pdf import RendererPdf
+
+    renderer = _get_vector_renderer(renderer)
+    with _content_caches_lock:
+        cache = _content_caches.get(renderer, None)
+        if (cache is not None):
+            return cache
+
+        if (isinstance(renderer, RendererSVG)):
+            cache = _SVGContentCache(renderer)
+        elif (
+            isinstance(renderer, RendererPdf)
+            and _can_add_pdf_forms(renderer.file)
+        ):
+            cache = _PDFContentCache(renderer)
+        else:
+            return None
+
+        _content_caches[renderer] = cache
+        return cache
+
+
+def _get_draw_runs(
+    artists: List[Artist],
+    grouped: List[Artist]
+) -> List[List[Artist]]:
+    """
+    PRIVATE: Split the grouped artists into runs, the grouped artists drawn
+    consecutively when an axes draws the passed artists in z-order.
+    """
+    grouped_ids = set(id(a) for a in grouped)
+    runs = []
+    run = []
+    for artist in sorted(artists, key=lambda a: a.get_zorder()):
+        if (id(artist) in grouped_ids):
+            run.append(artist)
+        elif (len(run) > 0):
+            runs.append(run)
+            run = []
+    if (len(run) > 0):
+        runs.append(run)
+    return runs
+
+
+def _can_reference_content(
+    renderer: RendererBase,
+    view_axes: Axes,
+    viewed_axes: Axes,
+    culling_box: Optional[Bbox]
+) -> bool:
+    """
+    PRIVATE: Check if a view can draw a viewed axes by referencing its vector
+    output: the viewed axes is drawn to the same output, the transform
+    between the axes is affine, and the viewed region is within the viewed
+    axes and the canvas (the definitions only hold what the viewed axes
+    shows, and content outside of the canvas is dropped by PDF).
+    """
+    if (
+        view_axes.name == "3d" or not view_axes.transData.is_affine
+        or viewed_axes.figure.figure is not view_axes.figure.figure
+        or culling_box is None
+    ):
+        return False
+
+    width, height = renderer.get_canvas_width_height()
+    x0, y0, x1, y1 = viewed_axes.bbox.extents
+    # Allows for rounding errors, views of the whole viewed axes can land
+    # a tiny fraction of a pixel outside of it.
+    eps = 1e-6
+    return (
+        culling_box.x0 >= max(x0, 0) - eps
+        and culling_box.y0 >= max(y0, 0) - eps
+        and culling_box.x1 <= min(x1, width) + eps
+        and culling_box.y1 <= min(y1, height) + eps
+    )
+
+
+class _ReusedContentArtist(_InternalArtist):
+    """
+    PRIVATE: Draws a run of artists of a viewed axes (see `_get_draw_runs`)
+    by referencing a definition of them shared between the viewed axes and
+    all of its views in the same vector output. The definition is the
+    artists drawn as the viewed axes draws them, written by whichever draws
+    first. Drawn where the artists are if no view axes is passed, otherwise
+    transformed and clipped to the view axes.
+    """
+    def __init__(
+        self,
+        viewed_axes: Axes,
+        artists: List[Artist],
+        view_axes: Optional[Axes] = None
+    ):
+        super().__init__()
+        self._viewed_axes = viewed_axes
+        self._artists = artists
+        self._view_axes = view_axes
+        self.set_zorder(artists[0].get_zorder())
+
+    def _draw_content(self, renderer: RendererBase):
+        # Images are composited as the viewed axes would composite them.
+        _draw_list_compositing_images(
+            renderer, self._viewed_axes, self._artists,
+            self._viewed_axes.figure.suppressComposite
+        )
+
+    def draw(self, renderer: RendererBase):
+        cache = _get_content_cache(renderer)
+        gc = renderer.new_gc()
+        transform = Affine2D()
+        if (self._view_axes is not None):
+            gc.set_clip_rectangle(self._view_axes.get_window_extent())
+            if (not isinstance(self._view_axes.patch, Rectangle)):
+                gc.set_clip_path(TransformedPatchPath(self._view_axes.patch))
+            # The transform from viewed axes display space to the view...
+            transform = Affine2D(
+                self._view_axes.transData.get_matrix() @
+                np.linalg.inv(self._viewed_axes.transData.get_matrix())
+            )
+
+        key = (id(self._viewed_axes), tuple(id(a) for a in self._artists))
+        cache.draw_reused(
+            key, lambda: self._draw_content(renderer), transform, gc
+        )
+        gc.restore()
@@ -1,15 +1,168 @@
+import copy
 import functools
-import itertools
-from typing import Type, List, Optional, Any, Set, Dict, Union
+import threading
+from typing import Type, List, Optional, Any, Set, Dict, Union, Sequence, \
+    Tuple, Callable
 from matplotlib.axes import Axes
-from matplotlib.transforms import Bbox
-from matplotview._transform_renderer import _TransformRenderer
-from matplotlib.artist import Artist
-from matplotlib.backend_bases import RendererBase
+from matplotlib.transforms import Bbox, IdentityTransform, Transform
+import numpy as np
+from matplotview._transform_renderer import (
+    _TransformRenderer,
+    _ViewTransferTransform
+)
+from matplotview._image_warp import _get_warped_bbox
+from matplotview._collection_culling import (
+    _get_item_count,
+    _get_visible_items
+)
+from matplotview._hit_index import _HitIndexCache
+from matplotview._line_slicing import (
+    _disable_subslice,
+    _get_visible_slice,
+    _slice_line
+)
+from matplotview._draw_state import (
+    _drawing_view,
+    _get_draw_renderer,
+    _get_render_depth
+)
+from matplotlib.artist import Artist, allow_rasterization
+from matplotlib.backend_bases import MouseEvent, RendererBase
+from matplotlib.collections import Collection
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
 from dataclasses import dataclass
-from matplotview._docs import dynamic_doc_string, get_interpolation_list_str
+from matplotview._docs import (
+    dynamic_doc_string,
+    get_interpolation_list_str,
+    _InternalArtist
+)
+from matplotview._render_stats import RenderStats
+from matplotview._tracing import get_active_tracer, _axes_name
+from matplotview._vector_reuse import (
+    _ReusedContentArtist,
+    _can_reference_content,
+    _get_content_cache,
+    _get_draw_runs,
+    _get_vector_renderer
+)
+from matplotview._throttle import _CachedViewOutput
+from matplotview._tile_cache import (
+    _TileCache,
+    _TiledViewArtist,
+    _TileRenderer,
+    _can_tile,
+    _get_zoom_key
+)
+from matplotview._shared_output import (
+    _RegionRenderer,
+    _SharedOutputArtist,
+    _can_share_output,
+    _get_content_version,
+    _get_frame_cache,
+    _get_output_key
+)
 
 DEFAULT_RENDER_DEPTH = 5
+# Number of points sampled along each edge of the view limits when computing
+# the culling region through a non-affine transform.
+CULLING_EDGE_SAMPLES = 64
+
+
+def _get_limit_edges(
+    x_lim: Sequence[float],
+    y_lim: Sequence[float],
+    t: np.ndarray
+) -> np.ndarray:
+    """
+    PRIVATE: Get points along the four edges of a set of data limits, at the
+    passed fractions (0 to 1) of each edge, as an array of shape (4, N, 2).
+    """
+    x1, x2 = x_lim
+    y1, y2 = y_lim
+    xs = x1 + (x2 - x1) * t
+    ys = y1 + (y2 - y1) * t
+    return np.stack([
+        np.column_stack([xs, np.full_like(xs, y1)]),
+        np.column_stack([np.full_like(ys, x2), ys]),
+        np.column_stack([xs, np.full_like(xs, y2)]),
+        np.column_stack([np.full_like(ys, x1), ys])
+    ])
+
+
+def _get_culling_box(
+    x_lim: Sequence[float],
+    y_lim: Sequence[float],
+    transform: Transform
+) -> Optional[Bbox]:
+    """
+    PRIVATE: Compute the display space region covered by a set of data limits
+    once passed through a transform, used to cull artists which fall outside
+    a view.
+
+    Parameters
+    ----------
+    x_lim: Sequence[float]
+        The x limits of the view, in data coordinates.
+
+    y_lim: Sequence[float]
+        The y limits of the view, in data coordinates.
+
+    transform: Transform
+        The transform from data to display coordinates of the viewed axes.
+
+    Returns
+    -------
+    Bbox or None
+        The bounding box of the limits in display coordinates (padded to
+        cover curved edges for non-affine transforms), or None if no finite
+        region could be computed (in which case no culling should be
+        performed).
+    """
+    x1, x2 = x_lim
+    y1, y2 = y_lim
+
+    pad = 0
+    if (transform.is_affine):
+        with np.errstate(all="ignore"):
+            points = transform.transform(
+                np.array([[x1, y1], [x2, y2]], dtype=float)
+            )
+    else:
+        # A non-affine transform (map projections, polar axes) can bend the
+        # edges of the limits, and even collapse the corners onto each
+        # other, so we transform a densified boundary of the limits instead.
+        t = np.linspace(0, 1, CULLING_EDGE_SAMPLES)
+        with np.errstate(all="ignore"):
+            edges = transform.transform(
+                _get_limit_edges(x_lim, y_lim, t).reshape(-1, 2)
+            ).reshape(4, -1, 2)
+            middles = transform.transform(
+                _get_limit_edges(x_lim, y_lim, (t[:-1] + t[1:]) / 2)
+                .reshape(-1, 2)
+            ).reshape(4, -1, 2)
+            # The chords between samples cut inside curved edges, so the
+            # box is padded by the largest gap between the middle of a chord
+            # and its curve, and a pixel more.
+            gaps = np.linalg.norm(
+                middles - (edges[:, :-1] + edges[:, 1:]) / 2, axis=-1
+            )
+        gaps = gaps[np.isfinite(gaps)]
+        pad = 1 + (np.max(gaps) if (len(gaps) > 0) else 0)
+        points = edges.reshape(-1, 2)
+
+    points = points[np.all(np.isfinite(points), axis=1)]
+
+    if (len(points) == 0):
+        return None
+
+    box = Bbox.null()
+    box.update_from_data_xy(points, ignore=True)
+
+    if (box.width == 0 or box.height == 0):
+        return None
+
+    return box.padded(pad)
 
 
 class _BoundRendererArtist:
@@ -17,17 +170,20 @@ class _BoundRendererArtist:
     Provides a temporary wrapper around a given artist, inheriting its
     attributes and values, while overriding the draw method to use a fixed
     TransformRenderer. This is used to render an artist to a view without
-    having to implement a new draw method for every Axes type.
+    having to implement a new draw method for every Axes type. If x limits
+    are passed, lines with sorted x data only draw the points within them.
     """
     def __init__(
         self,
         artist: Artist,
         renderer: _TransformRenderer,
-        clip_box: Bbox
+        clip_box: Optional[Bbox],
+        x_lim: Optional[Sequence[float]] = None
     ):
         self._artist = artist
         self._renderer = renderer
         self._clip_box = clip_box
+        self._x_lim = x_lim
 
     def __getattribute__(self, item: str) -> Any:
         try:
@@ -41,50 +197,550 @@ class _BoundRendererArtist:
         except AttributeError:
             self._artist.__setattr__(key, value)
 
-    def draw(self, renderer: RendererBase):
-        # Disable the artist defined clip box, as the artist might be visible
-        # under the new renderer even if not on screen...
-        clip_box_orig = self._artist.get_clip_box()
-        clip_path_orig = self._artist.get_clip_path()
-
-        full_extents = self._artist.get_window_extent(self._renderer)
-        self._artist.set_clip_box(None)
-        self._artist.set_clip_path(None)
+    def _get_draw_artist(self) -> Artist:
+        # Draw a shallow copy of the artist when it has to be changed to be
+        # drawn in the view, so the original is never modified while drawing
+        # (it may be drawn by other figures or threads at the same time).
+        # Made once, so a 3D projection is drawn by the copy it was made on.
+        draw_artist = self.__dict__.get("_draw_artist", None)
+        if (draw_artist is None):
+            draw_artist = self._artist
+            if (
+                draw_artist.get_clip_box() is not None
+                or draw_artist.get_clip_path() is not None
+                or hasattr(draw_artist, "do_3d_projection")
+            ):
+                draw_artist = copy.copy(draw_artist)
+                # Disable the artist defined clip box and path, as the artist
+                # might be visible under the new renderer even if not on
+                # screen... Set directly, as the setters mark it as stale.
+                draw_artist.clipbox = None
+                draw_artist._clippath = None
+            # Lines with sorted x data are cut down to the visible points...
+            visible = (
+                None if (self._x_lim is None)
+                else _get_visible_slice(self._artist, self._x_lim)
+            )
+            if (visible is not None):
+                if (draw_artist is self._artist):
+                    draw_artist = copy.copy(draw_artist)
+                _slice_line(draw_artist, visible)
+                stats = self._renderer.stats
+                if (stats is not None):
+                    stats.vertices_sliced += (
+                        len(self._artist.get_xydata())
+                        - len(draw_artist.get_xydata())
+                    )
+            if (
+                isinstance(draw_artist, Line2D)
+                and draw_artist is not self._artist
+            ):
+                _disable_subslice(draw_artist)
+            self._draw_artist = draw_artist
+        return draw_artist
 
-        # If we are working with a 3D object, swap out it's axes with
-        # this zoom axes (swapping out the 3d transform) and reproject it.
+    def draw(self, renderer: RendererBase):
+        # If we are working with a 3D object, reproject it in the view.
         if (hasattr(self._artist, "do_3d_projection")):
             self.do_3d_projection()
 
-        # Check and see if the passed limiting box and extents of the
-        # artist intersect, if not don't bother drawing this artist.
-        # First 2 checks are a special case where we received a bad clip box.
-        # (those can happen when we try to get the bounds of a map projection)
+        # If the artist is culled, don't bother drawing it (or copying and
+        # slicing it to be drawn).
+        stats = self._renderer.stats
+        if (not self.is_culled()):
+            draw_artist = self._get_draw_artist()
+            tracer = get_active_tracer()
+            if (tracer is not None):
+                view_axes = self._renderer.bounding_axes
+                trace_name = type(self._artist).__name__
+                trace_args = dict(
+                    view=_axes_name(view_axes),
+                    viewed_axes=_axes_name(self._artist.axes),
+                    artist_type=trace_name,
+                    depth=_get_render_depth(view_axes.figure)
+                )
+                tracer.begin(trace_name, "artist", **trace_args)
+
+            draw_artist.draw(self._renderer)
+
+            if (tracer is not None):
+                tracer.end(trace_name, "artist", **trace_args)
+            if (stats is not None):
+                stats.artists_drawn += 1
+        elif (stats is not None):
+            stats.artists_culled += 1
+
+    def is_culled(self) -> bool:
+        """
+        Check if the passed limiting box and extents of the artist don't
+        intersect, so the artist isn't drawn. A missing clip box means no
+        culling region could be computed.
+        """
+        return self._clip_box is not None and Bbox.intersection(
+            self._artist.get_window_extent(self._renderer), self._clip_box
+        ) is None
+
+    def do_3d_projection(self) -> float:
+        # Intentionally give the copy of the artist the view axes, as the
+        # do_3d_projection pulls the 3D transform (M) from the axes. Set
+        # directly, as the axes of an artist can't be changed otherwise.
+        draw_artist = self._get_draw_artist()
+        draw_artist._axes = self._renderer.bounding_axes
+        return draw_artist.do_3d_projection()  # Returns a z-order value...
+
+
+class _ArtistFilter:
+    """
+    PRIVATE: A compiled filter set, with its artists, artist types and
+    predicates split apart so each artist is checked with a set lookup, a
+    single isinstance call, and the predicates.
+    """
+    def __init__(self, filter_set: Optional[Set[Any]]):
+        self.filter_set = (
+            None if (filter_set is None) else frozenset(filter_set)
+        )
+        artists = set()
+        types = []
+        predicates = []
+
+        for item in (self.filter_set or ()):
+            if (isinstance(item, type)):
+                types.append(item)
+            elif (isinstance(item, Artist)):
+                artists.add(item)
+            elif (callable(item)):
+                predicates.append(item)
+            else:
+                raise TypeError(
+                    f"Invalid filter set item: {item!r}, must be an artist, "
+                    f"artist type, or predicate."
+                )
+
+        self._artists = artists
+        self._types = tuple(types)
+        self._predicates = tuple(predicates)
+
+    def matches(self, filter_set: Optional[Set[Any]]) -> bool:
+        if (filter_set is None or self.filter_set is None):
+            return filter_set is self.filter_set
+        return self.filter_set == filter_set
+
+    def __call__(self, artist: Artist) -> bool:
+        """
+        Returns True if the artist passes the filter, and should be drawn.
+        """
+        return not (
+            artist in self._artists
+            or isinstance(artist, self._types)
+            or any(p(artist) for p in self._predicates)
+        )
+
+
+class _FilteredChildren:
+    """
+    PRIVATE: The artists of a viewed axes which pass a view's filter set,
+    only refiltered when the children of the axes or the filter set change.
+    Locked, as views may be drawn from several threads at once.
+    """
+    def __init__(self):
+        self._filter = _ArtistFilter(None)
+        self._children = None
+        self._child_axes = None
+        self._lock = threading.Lock()
+        self.artists = []
+        self.child_axes = []
+
+    def update(
+        self, axes: Axes, filter_set: Optional[Set[Any]]
+    ) -> Tuple[List[Artist], List[Axes]]:
+        """
+        Refilter the children of an axes if needed, returning the artists
+        and child axes which pass the filter set.
+        """
+        with self._lock:
+            # Lists compare by identity first, so this is a quick check
+            # when the children are unchanged.
+            filter_changed = not self._filter.matches(filter_set)
+            if (filter_changed):
+                self._filter = _ArtistFilter(filter_set)
+
+            if (filter_changed or self._children != axes._children):
+                self._children = list(axes._children)
+                self.artists = [
+                    a for a in self._children if (self._filter(a))
+                ]
+            if (filter_changed or self._child_axes != axes.child_axes):
+                self._child_axes = list(axes.child_axes)
+                self.child_axes = [
+                    a for a in self._child_axes if (self._filter(a))
+                ]
+
+            return self.artists, self.child_axes
+
+
+class _CullingGroup:
+    """
+    PRIVATE: Views of the same axes created together (see
+    `matplotview.view_many`), which share a single culling pass over the
+    artists of the viewed axes each draw. The extent of every artist is
+    computed once, and tested against the limits of all the views at once.
+    """
+    def __init__(self, viewed_axes: Axes):
+        self._viewed_axes = viewed_axes
+        self._views = []
+
+    @property
+    def views(self) -> List[Axes]:
+        return list(self._views)
+
+    def add(self, view_axes: Axes):
+        if (view_axes not in self._views):
+            self._views.append(view_axes)
+
+    def get_visible(
+        self,
+        view_axes: Axes,
+        renderer: RendererBase
+    ) -> Optional[Set[Artist]]:
+        """
+        Get the artists of the viewed axes within the limits of a view, or
+        None if the view isn't part of the group. The culling pass is done
+        by the first view of the group drawn each time the figure is drawn,
+        and again if the limits or placement of any of the axes, or the
+        content of the viewed axes change (even if only a view is redrawn,
+        such as when blitting).
+        """
+        cache = _get_frame_cache(view_axes.figure)
+        key = (
+            "culling", id(self), id(renderer),
+            _get_content_version(self._viewed_axes), self._get_layout_key()
+        )
+        visible = cache.get(key, None)
+        if (visible is None):
+            visible = self._cull(renderer)
+            cache[key] = visible
+        return visible.get(view_axes, None)
+
+    def _get_layout_key(self) -> tuple:
+        # The limits and transforms of the viewed axes and the views, which
+        # determine the culling result...
+        return tuple(
+            (
+                tuple(a.get_xlim()), tuple(a.get_ylim()),
+                a.transData.get_affine().get_matrix().tobytes()
+            )
+            for a in [self._viewed_axes] + self._views
+        )
+
+    def _cull(self, renderer: RendererBase) -> Dict[Axes, Set[Artist]]:
+        ax = self._viewed_axes
+        views = [v for v in self._views if (ax in v.view_specifications)]
+        artists = list(ax._children) + list(ax.child_axes)
+        extents = np.array(
+            [a.get_window_extent(renderer).extents for a in artists],
+            dtype=float
+        ).reshape(-1, 4)
+
+        # The culling box of each view, missing boxes (which couldn't be
+        # computed) cover everything...
+        boxes = np.empty((len(views), 4))
+        for i, v in enumerate(views):
+            box = _get_culling_box(v.get_xlim(), v.get_ylim(), ax.transData)
+            boxes[i] = (
+                (-np.inf, -np.inf, np.inf, np.inf) if (box is None)
+                else box.extents
+            )
+
+        # Matching Bbox.intersection, which uses the min and max of each
+        # box (so null extents are infinite), and touching boxes intersect.
+        lo = np.minimum(extents[:, :2], extents[:, 2:])[:, None]
+        hi = np.maximum(extents[:, :2], extents[:, 2:])[:, None]
+        with np.errstate(invalid="ignore"):
+            hits = np.all(
+                (lo <= boxes[None, :, 2:]) & (hi >= boxes[None, :, :2]),
+                axis=-1
+            )
+        return {
+            v: {artists[i] for i in np.flatnonzero(hits[:, j])}
+            for j, v in enumerate(views)
+        }
+
+
+def _estimate_complexity(
+    artists: List[_BoundRendererArtist],
+    culling_box: Optional[Bbox]
+) -> Tuple[int, int]:
+    """
+    PRIVATE: Estimate the number of primitives and vertices the passed bound
+    artists will draw in a view, used to decide if view content should be
+    rasterized. Culled artists are skipped, lines count the points they
+    draw, and collections the items within the culling box (in display
+    coordinates of the viewed axes, None if it couldn't be computed).
+    """
+    primitives = 0
+    vertices = 0
+
+    for artist in artists:
+        if (artist.is_culled()):
+            continue
+        if (isinstance(artist._artist, Line2D)):
+            n = len(artist._get_draw_artist().get_xydata())
+            vertices += n
+            primitives += 1
+            if (artist.get_marker() not in (None, "None", "", " ")):
+                primitives += n
+        elif (isinstance(artist._artist, Collection)):
+            paths = artist.get_paths()
+            if (len(paths) == 0):
+                continue
+            transforms = artist.get_transforms()
+            offsets = artist.get_offsets()
+            items = None
+            if (culling_box is not None):
+                with np.errstate(all="ignore"):
+                    items = _get_visible_items(
+                        culling_box, IdentityTransform(),
+                        artist.get_transform(), paths, transforms, offsets,
+                        artist.get_offset_transform()
+                    )
+            if (items is None):
+                items = np.arange(
+                    _get_item_count(paths, transforms, offsets)
+                )
+            path_ids = items % max(len(paths), len(transforms)) % len(paths)
+            lengths = np.array([len(p.vertices) for p in paths])
+            primitives += len(items)
+            vertices += int(np.sum(lengths[path_ids]))
+        elif (isinstance(artist._artist, Patch)):
+            primitives += 1
+            vertices += len(artist.get_path().vertices)
+        else:
+            primitives += 1
+
+    return primitives, vertices
+
+
+def _should_rasterize(
+    spec: "ViewSpecification",
+    artists: List[_BoundRendererArtist],
+    culling_box: Optional[Bbox]
+) -> bool:
+    """
+    PRIVATE: Check if the view content of the passed bound artists should be
+    rasterized based on the view specification, estimating what they draw
+    within the culling box (see `_estimate_complexity`).
+    """
+    if (spec.rasterize == "never"):
+        return False
+    if (spec.rasterize == "always"):
+        return True
+
+    primitives, vertices = _estimate_complexity(artists, culling_box)
+    return (
+        (
+            spec.rasterize_primitive_threshold is not None
+            and primitives > spec.rasterize_primitive_threshold
+        ) or (
+            spec.rasterize_vertex_threshold is not None
+            and vertices > spec.rasterize_vertex_threshold
+        )
+    )
+
+
+def _is_reuse_source(axes: Axes) -> bool:
+    """
+    PRIVATE: Check if an axes can draw its artists as definitions reused by
+    its views, which views of nothing do (viewed axes reusing vector output
+    are converted into these, see `View.apply_aspect`).
+    """
+    return isinstance(axes, __ViewType) and len(axes.view_specifications) == 0
+
+
+def _has_reusing_views(viewed_axes: Axes) -> bool:
+    """
+    PRIVATE: Check if any visible view in the figure of a viewed axes reuses
+    its vector output. Looks through all axes of the figure, including those
+    of subfigures and child axes.
+    """
+    pending = [viewed_axes.figure.figure]
+    while (len(pending) > 0):
+        item = pending.pop()
+        if (not isinstance(item, Axes)):
+            pending.extend(item.axes)
+            pending.extend(item.subfigs)
+            continue
+        pending.extend(item.child_axes)
+
+        view_spec = getattr(item, "view_specifications", {}).get(
+            viewed_axes, None
+        )
         if (
-            self._clip_box.width == 0 or self._clip_box.height == 0 or
-            Bbox.intersection(full_extents, self._clip_box) is not None
+            view_spec is not None and item.get_visible()
+            and view_spec.reuse_vector_content and view_spec.scale_lines
+            and view_spec.filter_set is None
         ):
-            self._artist.draw(self._renderer)
+            return True
 
-        # Re-enable the clip box... and clip path...
-        self._artist.set_clip_box(clip_box_orig)
-        self._artist.set_clip_path(clip_path_orig)
+    return False
 
-    def do_3d_projection(self) -> float:
-        # Get the 3D projection function...
-        do_3d_projection = getattr(self._artist, "do_3d_projection")
 
-        # Intentionally replace the axes of the artist with the view axes,
-        # as the do_3d_projection pulls the 3D transform (M) from the axes.
-        # Then reproject, and restore the original axes.
-        ax = self._artist.axes
-        self._artist.axes = None  # Set to None first to avoid exception...
-        self._artist.axes = self._renderer.bounding_axes
-        res = do_3d_projection()  # Returns a z-order value...
-        self._artist.axes = None
-        self._artist.axes = ax
+def _get_reused_runs(
+    renderer: RendererBase,
+    viewed_axes: Axes
+) -> Optional[List[List[Artist]]]:
+    """
+    PRIVATE: Get the runs of artists (see `_get_draw_runs`) a viewed axes
+    draws as definitions of vector output, which it and its views reuse, or
+    None if it draws its artists as usual. Decided once per draw of the
+    figure, so the viewed axes and its views agree.
+    """
+    cache = _get_frame_cache(viewed_axes.figure)
+    key = ("reuse", id(_get_vector_renderer(renderer)), id(viewed_axes))
+    if (key in cache):
+        return cache[key]
+
+    runs = None
+    if (
+        _is_reuse_source(viewed_axes)
+        and _get_content_cache(renderer) is not None
+        and viewed_axes.get_visible() and viewed_axes.name != "3d"
+        and viewed_axes.transData.is_affine
+        and viewed_axes.get_rasterization_zorder() is None
+        and not any(a.get_rasterized() for a in viewed_axes._children)
+        and len(viewed_axes._children) > 0
+        and _has_reusing_views(viewed_axes)
+    ):
+        # The artists of the axes type, as the axes draws them...
+        artists = super(type(viewed_axes), viewed_axes).get_children()
+        artists.remove(viewed_axes.patch)
+        runs = _get_draw_runs(artists, viewed_axes._children)
+
+    cache[key] = runs
+    return runs
+
+
+def _draw_rasterized_at_dpi(
+    renderer: RendererBase,
+    dpi: float,
+    draw: Callable[[RendererBase], None]
+):
+    """
+    PRIVATE: Draw rasterized content at a custom dpi with a mixed mode
+    renderer. Matplotlib has no public API for the resolution of rasterized
+    content, so this switches private renderer state, which is only ever
+    accessed here. If the renderer doesn't have it, content is drawn as
+    vectors instead.
+    """
+    vector_renderer = getattr(renderer, "_vector_renderer", None)
+    if (
+        not hasattr(renderer, "_raster_depth")
+        or not hasattr(renderer, "_rasterizing")
+        or not hasattr(vector_renderer, "image_dpi")
+    ):
+        draw(renderer)
+        return
+    # Already drawing within rasterized content, which sets the dpi...
+    if (renderer._raster_depth > 0):
+        draw(renderer)
+        return
+    # Stop rasterization left running by previously drawn artists.
+    if (renderer._rasterizing):
+        renderer.stop_rasterizing()
+        renderer._rasterizing = False
+
+    orig_dpi = renderer.dpi
+    orig_image_dpi = vector_renderer.image_dpi
+    # The vector renderer sizes images using its image dpi...
+    renderer.dpi = dpi
+    renderer.start_rasterizing()
+    try:
+        draw(renderer)
+    finally:
+        vector_renderer.image_dpi = renderer.dpi
+        renderer.stop_rasterizing()
+        renderer.dpi = orig_dpi
+        vector_renderer.image_dpi = orig_image_dpi
+
+
+class _RasterizedViewArtist(_InternalArtist):
+    """
+    PRIVATE: Draws the artists a view borrows from a viewed axes rasterized
+    into a single image, when drawing to a vector backend. Rasterized like
+    any other artist, unless drawn at a custom dpi.
+    """
+    def __init__(
+        self,
+        view_axes: Axes,
+        viewed_axes: Axes,
+        bound_artists: List[_BoundRendererArtist],
+        dpi: Optional[float] = None
+    ):
+        super().__init__()
+        self._view_axes = view_axes
+        self._viewed_axes = viewed_axes
+        self._bound_artists = sorted(
+            bound_artists, key=lambda a: a.get_zorder()
+        )
+        self._dpi = dpi
+        self.set_rasterized(dpi is None)
+        self.set_zorder(min(a.get_zorder() for a in bound_artists))
+
+    def _draw_bound_artists(self, renderer: RendererBase):
+        # Display coordinates change with the dpi, so recompute culling...
+        culling_box = _get_culling_box(
+            self._view_axes.get_xlim(),
+            self._view_axes.get_ylim(),
+            self._viewed_axes.transData
+        )
+        for artist in self._bound_artists:
+            artist._clip_box = culling_box
+            artist.draw(renderer)
+
+    @allow_rasterization
+    def draw(self, renderer: RendererBase):
+        if (self._dpi is None):
+            self._draw_bound_artists(renderer)
+        else:
+            _draw_rasterized_at_dpi(
+                renderer, self._dpi, self._draw_bound_artists
+            )
+
 
-        return res
+def _get_spec_key(spec: "ViewSpecification") -> tuple:
+    """
+    PRIVATE: Get a hashable key of the options of a view specification
+    which change what is drawn with a raster renderer.
+    """
+    return (
+        spec.image_interpolation,
+        None if (spec.filter_set is None) else frozenset(spec.filter_set),
+        spec.scale_lines,
+        spec.use_data_providers
+    )
+
+
+def _is_below_render_size(
+    view_axes: Axes,
+    renderer: RendererBase,
+    size: float
+) -> bool:
+    """
+    PRIVATE: Check if an axes is smaller than a number of pixels in both
+    width and height in the final output, following it through the views
+    it's being drawn within (each wrapping the renderer of the view it's
+    drawn in).
+    """
+    bbox = view_axes.get_window_extent()
+    while (isinstance(renderer, _TransformRenderer)):
+        with np.errstate(all="ignore"):
+            bbox = _get_warped_bbox(
+                bbox, renderer._get_transfer_transform(IdentityTransform())
+            )
+        # Nothing of the axes lands anywhere in the view drawing it...
+        if (not np.all(np.isfinite(bbox.get_points()))):
+            return True
+        renderer = renderer.base_renderer
+    return bbox.width < size and bbox.height < size
 
 
 def _view_from_pickle(builder, args):
@@ -113,24 +769,126 @@ class ViewSpecification:
         '{image_interpolation}'. This determines the interpolation
         used when attempting to render a zoomed version of an image.
 
-    filter_set: Iterable[Union[Type[Artist], Artist]] or {filter_set}
+    filter_set: Iterable[Union[Type[Artist], Artist, Callable]] or {filter_set}
         An optional filter set, which can be used to select what artists
-        are drawn by the view. Any artists or artist types in the set are not
-        drawn.
+        are drawn by the view. Any artists in the set, instances of artist
+        types in the set (including subclasses), and artists for which a
+        predicate (a callable accepting an artist) in the set returns True
+        are not drawn. The filtered artists are cached, and only refiltered
+        when the children of the viewed axes or the filter set change.
 
     scale_lines: bool, defaults to {scale_lines}
         Specifies if lines should be drawn thicker based on scaling in the
         view.
+
+    reuse_vector_content: bool, defaults to {reuse_vector_content}
+        If True, when saving to SVG or PDF the artists of the viewed axes
+        are written once as reusable definitions (SVG <defs>/<use>, PDF Form
+        XObjects), which the viewed axes itself and all views of it with
+        this option reference, the views with their own transform and clip,
+        instead of each writing the full content again. To do this, the
+        viewed axes is converted into a view (of nothing) when the figure
+        is drawn. Only used when scale_lines is True, there is no
+        filter_set, both axes have affine data transforms, and the view
+        shows a region within the viewed axes in the same figure, otherwise
+        content is drawn as usual. Images are scaled by the viewer instead
+        of using the image_interpolation, and artists backed by data
+        providers draw the data requested for the viewed axes.
+
+    rasterize: string or bool, defaults to '{rasterize}'
+        Specifies if the content of the viewed axes should be rasterized into
+        a single image when drawn by vector backends (PDF, SVG, PS), while
+        the view's own artists stay vector. Supported options are 'always',
+        'never', or 'auto', which rasterizes once the viewed content
+        exceeds the primitive or vertex thresholds. True and False are
+        aliases for 'always' and 'never'. Rasterized content is drawn at the
+        lowest z-order of its artists.
+
+    rasterize_primitive_threshold: optional int, defaults to {rasterize_primitive_threshold}
+        In 'auto' mode, rasterize if the viewed content has more primitives
+        (lines, patches, markers, collection elements) than this. None
+        disables this threshold.
+
+    rasterize_vertex_threshold: optional int, defaults to {rasterize_vertex_threshold}
+        In 'auto' mode, rasterize if the viewed content has more vertices
+        than this. None disables this threshold.
+
+    rasterize_dpi: optional float, defaults to {rasterize_dpi}
+        The resolution to rasterize at. If None, uses the dpi the figure is
+        being saved at.
+
+    use_data_providers: bool, defaults to {use_data_providers}
+        If True, artists of the viewed axes backed by a data provider (such
+        as DataProviderLine2D) request data for the limits and size of the
+        view. If False, they draw the data requested for the viewed axes.
+
+    share_output: bool, defaults to {share_output}
+        If True, views of the viewed axes which have this option set and
+        show the same thing (same view type, limits, scales, pixel size and
+        view specification) share their output within a figure draw, or
+        between blits while the viewed content is unchanged: the first view
+        draws the viewed content offscreen, and the others copy its pixels
+        instead of drawing the viewed axes again. Only used when
+        drawing with Agg, to views fully inside the canvas. The copied
+        content is drawn at the lowest z-order of its artists.
+
+    tile_size: optional int, defaults to {tile_size}
+        If set, the view is assembled from square tiles of this many pixels,
+        rendered on demand and cached, so panning the view at the same zoom
+        level only renders tiles which weren't visible before. Tiles are
+        rendered again when artists are added to or removed from the viewed
+        axes, or it is zoomed or panned. Other changes to the viewed
+        artists (such as new data) require calling `clear_tile_cache` on the
+        view. Only
+        used when drawing with Agg, to rectangular views with affine data
+        transforms. Tiles are placed on whole pixels, and drawn at the
+        lowest z-order of their artists. Takes priority over share_output.
+
+    tile_cache_size: int, defaults to {tile_cache_size}
+        The maximum number of bytes of tiles to cache, the least recently
+        used tiles are dropped first.
     """
     image_interpolation: str = "nearest"
-    filter_set: Optional[Set[Union[Type[Artist], Artist]]] = None
+    filter_set: Optional[
+        Set[Union[Type[Artist], Artist, Callable[[Artist], bool]]]
+    ] = None
     scale_lines: bool = True
+    reuse_vector_content: bool = False
+    rasterize: Union[str, bool] = "never"
+    rasterize_primitive_threshold: Optional[int] = 10000
+    rasterize_vertex_threshold: Optional[int] = 500000
+    rasterize_dpi: Optional[float] = None
+    use_data_providers: bool = True
+    share_output: bool = False
+    tile_size: Optional[int] = None
+    tile_cache_size: int = 64 * 2 ** 20
 
     def __post_init__(self):
         self.image_interpolation = str(self.image_interpolation)
         if (self.filter_set is not None):
             self.filter_set = set(self.filter_set)
+            # Validates the filter set...
+            _ArtistFilter(self.filter_set)
         self.scale_lines = bool(self.scale_lines)
+        self.reuse_vector_content = bool(self.reuse_vector_content)
+        self.use_data_providers = bool(self.use_data_providers)
+        self.share_output = bool(self.share_output)
+        if (self.tile_size is not None):
+            self.tile_size = int(self.tile_size)
+            if (self.tile_size <= 0):
+                raise ValueError(
+                    f"Tile size must be positive, not {self.tile_size}."
+                )
+        self.tile_cache_size = int(self.tile_cache_size)
+
+        if (isinstance(self.rasterize, bool)):
+            self.rasterize = "always" if (self.rasterize) else "never"
+        self.rasterize = str(self.rasterize).lower()
+        if (self.rasterize not in ("always", "never", "auto")):
+            raise ValueError(
+                f"Invalid rasterization mode: {self.rasterize}, must be "
+                f"'always', 'never', or 'auto'."
+            )
 
 
 class __ViewType:
@@ -207,17 +965,27 @@ def view_wrapper(axes_class: Type[Axes]) -> Type[Axes]:
         def _init_vars(self, render_depth: int = DEFAULT_RENDER_DEPTH):
             # Initialize the view specs dict...
             self.__view_specs = getattr(self, "__view_specs", {})
-            self.__renderer = None
+            # Transfer transforms are kept between draws, so cached non-affine
+            # results survive pans and zooms...
+            self.__transfer_transforms = {}
+            self.__filtered_children = {}
+            self.__tile_caches = {}
+            self.__hit_caches = {}
+            self.__culling_groups = {}
+            # Minimum seconds between updates of viewed content, and the last
+            # output shown in between. None means always update.
+            self.__update_interval = None
+            self.__cached_output = _CachedViewOutput()
+            # Render statistics per viewed axes, None when not recording.
+            self.__render_stats = getattr(self, "__render_stats", None)
             self.__max_render_depth = getattr(
                 self, "__max_render_depth", DEFAULT_RENDER_DEPTH
             )
             self.set_max_render_depth(render_depth)
-            # The current render depth is stored in the figure, so the number
-            # of recursive draws is even in the case of multiple axes drawing
-            # each other in the same figure.
-            self.figure._current_render_depth = getattr(
-                self.figure, "_current_render_depth", 0
-            )
+            # Views smaller than this many pixels in the output don't draw
+            # viewed content, None means only the render depth limits
+            # recursion.
+            self.__min_render_size = None
 
         def get_children(self) -> List[Artist]:
             # We overload get_children to return artists from the view axes
@@ -225,54 +993,293 @@ def view_wrapper(axes_class: Type[Axes]) -> Type[Axes]:
             # in a BoundRendererArtist, so they are drawn with an alternate
             # renderer, and therefore to the correct location.
             child_list = super().get_children()
+            # The renderer is only set while this view is drawing, in the
+            # current context...
+            renderer = _get_draw_renderer(self)
+
+            if (renderer is not None and _is_reuse_source(self)):
+                child_list = self.__reference_reused_runs(renderer, child_list)
+            elif (renderer is not None):
+                # Imported here, as most uses never draw to vector backends.
+                from matplotlib.backends.backend_mixed import MixedModeRenderer
+
+                self.__transfer_transforms = {
+                    ax: self.__transfer_transforms.get(ax, None)
+                    or _ViewTransferTransform(ax.transData, self.transData)
+                    for ax in self.view_specifications
+                }
+                self.__filtered_children = {
+                    ax: self.__filtered_children.get(ax, None)
+                    or _FilteredChildren()
+                    for ax in self.view_specifications
+                }
+                self.__tile_caches = {
+                    ax: self.__tile_caches.get(ax, None) or _TileCache()
+                    for ax in self.view_specifications
+                }
 
-            def filter_check(artist, filter_set):
-                if (filter_set is None):
-                    return True
-                return (
-                    (artist not in filter_set)
-                    and (type(artist) not in filter_set)
-                )
-
-            if (self.__renderer is not None):
                 for ax, spec in self.view_specifications.items():
-                    mock_renderer = _TransformRenderer(
-                        self.__renderer, ax.transData, self.transData,
-                        self, spec.image_interpolation, spec.scale_lines
+                    stats = None
+                    if (self.__render_stats is not None):
+                        stats = self.__render_stats.setdefault(
+                            ax, RenderStats()
+                        )
+                        stats.view_draws += 1
+
+                    axes_box = _get_culling_box(
+                        self.get_xlim(), self.get_ylim(), ax.transData
+                    )
+
+                    artists, child_axes = self.__filtered_children[
+                        ax
+                    ].update(ax, spec.filter_set)
+
+                    # Views created together are culled together, only
+                    # binding the artists within this view...
+                    bound = artists + child_axes
+                    considered = len(bound)
+                    clip_box = axes_box
+                    group = self.__culling_groups.get(ax, None)
+                    visible = (
+                        None if (group is None)
+                        else group.get_visible(self, renderer)
                     )
+                    if (visible is not None):
+                        bound = [a for a in bound if (a in visible)]
+                        clip_box = None
+                        if (stats is not None):
+                            stats.artists_culled += considered - len(bound)
+
+                    bind_artists = functools.partial(
+                        self.__bind_artists, ax, spec, stats, bound, clip_box
+                    )
+                    view_children = bind_artists(renderer)
+                    if (stats is not None):
+                        stats.artists_considered += considered
 
-                    x1, x2 = self.get_xlim()
-                    y1, y2 = self.get_ylim()
-                    axes_box = Bbox.from_extents(x1, y1, x2, y2).transformed(
-                        ax.transData
+                    rasterize = (
+                        isinstance(renderer, MixedModeRenderer)
+                        and _should_rasterize(spec, view_children, axes_box)
                     )
 
-                    child_list.extend([
-                        _BoundRendererArtist(a, mock_renderer, axes_box)
-                        for a in itertools.chain(
-                            ax._children,
-                            ax.child_axes
-                        ) if (filter_check(a, spec.filter_set))
-                    ])
+                    reused_runs = None
+                    if (
+                        spec.reuse_vector_content and spec.scale_lines
+                        and spec.filter_set is None and not rasterize
+                        and _is_reuse_source(ax)
+                        and _can_reference_content(
+                            renderer, self, ax, axes_box
+                        )
+                    ):
+                        reused_runs = _get_reused_runs(renderer, ax)
+                    if (reused_runs is not None):
+                        child_list.extend(
+                            _ReusedContentArtist(ax, run, self)
+                            for run in reused_runs
+                        )
+                        artists = []
+                        # Only the child axes are still drawn by the view.
+                        bound = [a for a in bound if (isinstance(a, Axes))]
+                        bind_artists = functools.partial(
+                            self.__bind_artists, ax, spec, stats, bound,
+                            clip_box
+                        )
+                        view_children = bind_artists(renderer)
+
+                    if (len(view_children) == 0):
+                        continue
+                    if (rasterize):
+                        child_list.append(_RasterizedViewArtist(
+                            self, ax, view_children, spec.rasterize_dpi
+                        ))
+                    elif (
+                        spec.tile_size is not None
+                        and _can_tile(renderer, self)
+                    ):
+                        tile_cache = self.__tile_caches[ax]
+                        tile_cache.validate((artists, child_axes))
+                        child_list.append(_TiledViewArtist(
+                            self, ax, tile_cache,
+                            (_get_spec_key(spec), _get_zoom_key(self, ax)),
+                            spec.tile_size, spec.tile_cache_size,
+                            functools.partial(
+                                self.__bind_tile_artists, ax, spec, stats,
+                                artists + child_axes
+                            ),
+                            min(a.get_zorder() for a in view_children),
+                            stats
+                        ))
+                    elif (
+                        spec.share_output
+                        and _can_share_output(renderer, self)
+                    ):
+                        child_list.append(_SharedOutputArtist(
+                            self,
+                            _get_output_key(
+                                self, ax, _get_spec_key(spec), renderer
+                            ),
+                            bind_artists,
+                            min(a.get_zorder() for a in view_children)
+                        ))
+                    else:
+                        child_list.extend(view_children)
 
             return child_list
 
+        def __bind_artists(
+            self,
+            ax: Axes,
+            spec: ViewSpecification,
+            stats: Optional[RenderStats],
+            artists: List[Artist],
+            axes_box: Optional[Bbox],
+            base_renderer: RendererBase,
+            output_origin: Optional[Tuple[int, int]] = None
+        ) -> List[_BoundRendererArtist]:
+            # Bind the artists of a viewed axes to a renderer drawing them
+            # into this view, which in turn draws to the base renderer (or
+            # a buffer of a region of it, starting at the output origin).
+            if (output_origin is None):
+                mock_renderer = _TransformRenderer(
+                    base_renderer, ax.transData, self.transData,
+                    self, spec.image_interpolation, spec.scale_lines,
+                    self.__transfer_transforms[ax], stats,
+                    spec.use_data_providers
+                )
+            else:
+                mock_renderer = _RegionRenderer(
+                    output_origin, base_renderer, ax.transData,
+                    self.transData, self, spec.image_interpolation,
+                    spec.scale_lines, None, stats, spec.use_data_providers
+                )
+            # The x limits only bound the visible x data if x and y are
+            # placed independently (not in polar views)...
+            x_lim = self.get_xlim() if (self.transData.is_separable) else None
+            return [
+                _BoundRendererArtist(a, mock_renderer, axes_box, x_lim)
+                for a in artists
+            ]
+
+        def __reference_reused_runs(
+            self,
+            renderer: RendererBase,
+            child_list: List[Artist]
+        ) -> List[Artist]:
+            # Replace the runs of artists of this axes reused by its views
+            # with references to their definitions, placed where the first
+            # artist of each run is, so they keep their place in z-order.
+            runs = _get_reused_runs(renderer, self)
+            if (runs is None):
+                return child_list
+
+            run_starts = {id(run[0]): run for run in runs}
+            reused = set(id(a) for run in runs for a in run)
+            return [
+                _ReusedContentArtist(self, run_starts[id(a)])
+                if (id(a) in run_starts) else a
+                for a in child_list
+                if (id(a) in run_starts or id(a) not in reused)
+            ]
+
+        def __bind_tile_artists(
+            self,
+            ax: Axes,
+            spec: ViewSpecification,
+            stats: Optional[RenderStats],
+            artists: List[Artist],
+            base_renderer: RendererBase,
+            tile_transform: Transform,
+            x_lim: Sequence[float],
+            y_lim: Sequence[float]
+        ) -> List[_BoundRendererArtist]:
+            # Bind the artists of a viewed axes to a renderer drawing them
+            # into a tile, which covers the passed data limits.
+            mock_renderer = _TileRenderer(
+                spec.tile_size, base_renderer, ax.transData, tile_transform,
+                self, spec.image_interpolation, spec.scale_lines, None,
+                stats, spec.use_data_providers
+            )
+            culling_box = _get_culling_box(x_lim, y_lim, ax.transData)
+            if (not self.transData.is_separable):
+                x_lim = None
+            return [
+                _BoundRendererArtist(a, mock_renderer, culling_box, x_lim)
+                for a in artists
+            ]
+
+        def apply_aspect(self, position=None):
+            # Figures apply the aspect of all of their axes before drawing
+            # any of them, so viewed axes reusing vector output are converted
+            # into views (of nothing) here, before they draw. This lets them
+            # draw their artists as the definitions their views reference.
+            for ax, spec in self.view_specifications.items():
+                if (spec.reuse_vector_content and ax.name != "3d"):
+                    view_wrapper(type(ax)).from_axes(ax)
+            super().apply_aspect(position)
+
         def draw(self, renderer: RendererBase = None):
+            # Views of nothing draw as their axes type would, without
+            # counting as a recursive draw...
+            if (len(self.view_specifications) == 0):
+                with _drawing_view(self, renderer, nested=False):
+                    super().draw(renderer)
+                return
+
             # It is possible to have two axes which are views of each other
             # therefore we track the number of recursions and stop drawing
-            # at a certain depth
-            if (self.figure._current_render_depth >= self.__max_render_depth):
+            # at a certain depth. The depth is tracked per figure, in the
+            # current context, so figures can be drawn from several threads.
+            depth = _get_render_depth(self.figure)
+            if (depth >= self.__max_render_depth):
                 return
-            self.figure._current_render_depth += 1
-            # Set the renderer, causing get_children to return the view's
-            # children also...
-            self.__renderer = renderer
 
-            super().draw(renderer)
+            # Nested views too small to see in the output stop recursing...
+            too_small = (
+                self.__min_render_size is not None
+                and _is_below_render_size(
+                    self, renderer, self.__min_render_size
+                )
+            )
+
+            cache_key = None
+            if (self.__update_interval is not None and not too_small):
+                cache_key = _CachedViewOutput.get_key(self, renderer)
+            use_cached = cache_key is not None and (
+                self.__cached_output.is_current(
+                    cache_key, self.__update_interval
+                )
+            )
 
-            # Get rid of the renderer...
-            self.__renderer = None
-            self.figure._current_render_depth -= 1
+            tracer = get_active_tracer()
+            if (tracer is not None):
+                trace_name = f"View {_axes_name(self)}"
+                trace_args = dict(
+                    view=_axes_name(self),
+                    viewed_axes=[
+                        _axes_name(ax) for ax in self.view_specifications
+                    ],
+                    depth=depth + 1,
+                    cached=use_cached,
+                    too_small=too_small
+                )
+                tracer.begin(trace_name, "view", **trace_args)
+
+            # Set the renderer, causing get_children to return the view's
+            # children also, unless showing the cached output...
+            with _drawing_view(
+                self, None if (use_cached or too_small) else renderer
+            ):
+                super().draw(renderer)
+
+            if (use_cached):
+                self.__cached_output.restore(
+                    self, renderer, self.__update_interval
+                )
+            elif (cache_key is not None):
+                self.__cached_output.store(cache_key, self, renderer)
+
+            if (tracer is not None):
+                tracer.end(trace_name, "view", **trace_args)
 
         def __reduce__(self):
             builder, args = super().__reduce__()[:2]
@@ -291,9 +1298,20 @@ def view_wrapper(axes_class: Type[Axes]) -> Type[Axes]:
 
         def __getstate__(self):
             state = super().__getstate__()
-            state["__renderer"] = None
+            # Caches are rebuilt when drawing, and may hold weak references
+            # which can't be pickled...
+            state["_View__transfer_transforms"] = {}
+            state["_View__filtered_children"] = {}
+            state["_View__cached_output"] = _CachedViewOutput()
+            state["_View__tile_caches"] = {}
+            state["_View__hit_caches"] = {}
             return state
 
+        def _set_culling_group(self, axes: Axes, group: _CullingGroup):
+            # Set the group this view is culled with, when viewing an axes.
+            group.add(self)
+            self.__culling_groups[axes] = group
+
         def get_max_render_depth(self) -> int:
             """
             Get the max recursive rendering depth for this view axes.
@@ -321,6 +1339,240 @@ def view_wrapper(axes_class: Type[Axes]) -> Type[Axes]:
                 raise ValueError(f"Render depth must be positive, not {val}.")
             self.__max_render_depth = val
 
+        def get_min_render_size(self) -> Optional[float]:
+            """
+            Get the output size below which this view stops drawing viewed
+            content, see `set_min_render_size`.
+
+            Returns
+            -------
+            optional float
+                The size in pixels, or None if only the max render depth
+                limits recursive drawing.
+            """
+            return self.__min_render_size
+
+        def set_min_render_size(self, size: Optional[float]):
+            """
+            Stop recursive drawing adaptively, by not drawing viewed content
+            once this view is smaller than a number of pixels in both width
+            and height in the final output. When the view is drawn within
+            another view (such as a view of itself, or two views looking at
+            each other), its size follows the scale of each view the drawing
+            passes through, so fractal and mutual views do just enough work
+            for the output resolution. The view's own artists are
+            still drawn, and the max render depth still applies, so it should
+            be raised for deep recursion.
+
+            Parameters
+            ----------
+            size: optional float
+                The minimum output size in pixels, or None to only limit
+                recursion by the max render depth (the default). Must be
+                positive.
+            """
+            if (size is not None):
+                size = float(size)
+                if (not size > 0):
+                    raise ValueError(
+                        f"Min render size must be positive, not {size}."
+                    )
+            self.__min_render_size = size
+
+        def get_update_interval(self) -> Optional[float]:
+            """
+            Get the minimum time between updates of the viewed content of
+            this view, see `set_update_interval`.
+
+            Returns
+            -------
+            optional float
+                The interval in seconds, or None if the view always updates.
+            """
+            return self.__update_interval
+
+        def set_update_interval(self, interval: Optional[float]):
+            """
+            Limit how often this view redraws the axes it views. After a full
+            update, redraws within the interval show the view's last output
+            instead of drawing the viewed axes again, and a redraw of the
+            figure is scheduled (via draw_idle) for when the interval is up.
+            This keeps interactive panning and zooming of a viewed axes
+            responsive when views are expensive to draw. The view still
+            updates immediately if its own limits or size change, and when
+            saving the figure.
+
+            Only supported by renderers which can copy regions of their
+            output (such as Agg), other renderers always update. Views
+            without an opaque rectangular background also always update, as
+            their last output would cover content drawn beneath them.
+
+            Parameters
+            ----------
+            interval: optional float
+                The minimum time between updates in seconds, or None to
+                update the view on every draw (the default).
+            """
+            if (interval is not None):
+                interval = float(interval)
+                if (interval < 0):
+                    raise ValueError(
+                        f"Update interval must be non-negative, not "
+                        f"{interval}."
+                    )
+            self.__update_interval = interval
+            self.__cached_output.clear()
+
+        def clear_tile_cache(self):
+            """
+            Drop the cached tiles of all axes this view looks at, which must
+            be done after changing viewed artists when the view is assembled
+            from tiles (see `ViewSpecification.tile_size`).
+            """
+            for cache in self.__tile_caches.values():
+                cache.clear()
+
+        def hit_test(
+            self,
+            event: MouseEvent,
+            tolerance: float = 5
+        ) -> Optional[Tuple[Artist, int]]:
+            """
+            Find the point of a viewed artist under the mouse, for picking
+            and hovering over viewed content. Points are the vertices of
+            lines and the offsets of collections (such as scatter plots),
+            placed in data coordinates. The points of each artist are
+            indexed in a grid, kept until the artist's points are replaced,
+            so each test only looks at the points near the mouse.
+
+            Parameters
+            ----------
+            event: `~matplotlib.backend_bases.MouseEvent`
+                The mouse event, only its display coordinates are used.
+
+            tolerance: float, defaults to 5
+                The largest distance to a point in pixels, within this view.
+
+            Returns
+            -------
+            optional tuple of `~matplotlib.artist.Artist` and int
+                The source artist of the nearest point and the index of the
+                point in the artist's data (or offsets), or None if no
+                point is within the tolerance.
+            """
+            x, y = event.x, event.y
+            if (
+                x is None or y is None
+                or not self.patch.contains_point((x, y))
+            ):
+                return None
+
+            pixel_box = Bbox.from_extents(
+                x - tolerance, y - tolerance, x + tolerance, y + tolerance
+            )
+            with np.errstate(all="ignore"):
+                data_box = _get_warped_bbox(
+                    pixel_box, self.transData.inverted()
+                )
+
+            hit = None
+            hit_dist = tolerance
+            for ax, spec in self.view_specifications.items():
+                artists, __ = self.__filtered_children.setdefault(
+                    ax, _FilteredChildren()
+                ).update(ax, spec.filter_set)
+                cache = self.__hit_caches.setdefault(ax, _HitIndexCache())
+                cache.prune(artists)
+
+                for artist in artists:
+                    grid = cache.get(artist, ax)
+                    if (grid is None or not artist.get_visible()):
+                        continue
+                    indices, points = grid.query(data_box)
+                    if (len(indices) == 0):
+                        continue
+
+                    with np.errstate(all="ignore"):
+                        dist = np.hypot(
+                            *(self.transData.transform(points) - (x, y)).T
+                        )
+                    dist[~np.isfinite(dist)] = np.inf
+                    i = np.argmin(dist)
+                    # Ties go to the artist added last, drawn on top...
+                    if (dist[i] <= hit_dist):
+                        hit = (artist, int(indices[i]))
+                        hit_dist = dist[i]
+
+            # Drop the grids of axes which are no longer viewed...
+            self.__hit_caches = {
+                ax: c for ax, c in self.__hit_caches.items()
+                if (ax in self.view_specifications)
+            }
+            return hit
+
+        def get_record_render_stats(self) -> bool:
+            """
+            Get if this view is recording rendering statistics.
+
+            Returns
+            -------
+            bool
+                True if rendering statistics are being recorded.
+            """
+            return self.__render_stats is not None
+
+        def set_record_render_stats(self, val: bool):
+            """
+            Enable or disable recording of rendering statistics for this view.
+            Disabling recording discards all recorded statistics.
+
+            Parameters
+            ----------
+            val: bool
+                If True, record rendering statistics for each axes this view
+                looks at, accessible via `get_render_stats`.
+            """
+            if (not val):
+                self.__render_stats = None
+            elif (self.__render_stats is None):
+                self.__render_stats = {}
+
+        def get_render_stats(
+            self,
+            reset: bool = False
+        ) -> Dict[Axes, RenderStats]:
+            """
+            Get the rendering statistics recorded by this view since
+            recording was enabled or statistics were last reset.
+
+            Parameters
+            ----------
+            reset: bool, defaults to False
+                If True, reset the statistics after returning them, allowing
+                statistics to be collected per frame.
+
+            Returns
+            -------
+            Dict[Axes, RenderStats]
+                A dictionary of viewed axes to the statistics recorded
+                when drawing them. Empty if recording is disabled.
+            """
+            if (self.__render_stats is None):
+                return {}
+
+            stats = self.__render_stats
+            if (reset):
+                self.reset_render_stats()
+            return stats
+
+        def reset_render_stats(self):
+            """
+            Reset the rendering statistics of this view. Does nothing if
+            recording is disabled.
+            """
+            if (self.__render_stats is not None):
+                self.__render_stats = {}
+
         @property
         def view_specifications(self) -> Dict[Axes, ViewSpecification]:
             """
@@ -0,0 +1,132 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import pytest
+from matplotlib.collections import PolyCollection
+from matplotview import view, inset_zoom_axes
+from matplotview.tests.utils import record_view_counts
+
+# Regression tests of the work views do, the number of primitives drawn,
+# vertices transformed and artists culled is deterministic (unlike
+# timings), so culling and fast paths can't silently regress. Bounds are
+# the counts when the tests were written, with some slack where ticks and
+# text (which differ between matplotlib versions) are drawn in a view.
+
+
+def build_inset_zoom(fig):
+    np.random.seed(1)
+    ax = fig.gca()
+    ax.plot(np.arange(1000) / 100, np.sin(np.arange(1000) / 100), "r")
+    ax.add_patch(plt.Circle((3, 0), 1, ec="black", fc="blue"))
+    ax.add_patch(plt.Circle((9, 0), 0.2, ec="black", fc="blue"))
+    ax.imshow(
+        np.random.rand(30, 30), origin="lower", extent=(0, 10, -1, 1),
+        aspect="auto", interpolation="nearest"
+    )
+    axins = inset_zoom_axes(ax, [0.5, 0.5, 0.48, 0.48], scale_lines=False)
+    axins.set_xlim(1, 5)
+    axins.set_ylim(-0.5, 0.5)
+
+
+def build_log_scatter(fig):
+    data = np.logspace(0, 3, 1000)
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.set(xscale="log", yscale="log")
+    ax1.scatter(data, data)
+    ax1.plot(data, data[::-1])
+    view(ax2, ax1, scale_lines=False)
+    ax2.set(xscale="log", yscale="log")
+    ax2.set_xlim(10, 20)
+    ax2.set_ylim(10, 20)
+
+
+def build_3d(fig):
+    x, y = np.meshgrid(np.arange(-5, 5, 0.25), np.arange(-5, 5, 0.25))
+    z = np.sin(np.sqrt(x ** 2 + y ** 2))
+    ax1, ax2 = fig.subplots(1, 2, subplot_kw=dict(projection="3d"))
+    ax1.plot_surface(x, y, z, cmap="plasma")
+    view(ax2, ax1)
+    ax2.view_init(elev=80)
+    ax2.set_zlim(-2, 2)
+
+
+def build_polar(fig):
+    r = np.arange(0, 2, 0.01)
+    ax1, ax2 = fig.subplots(1, 2, subplot_kw=dict(projection="polar"))
+    ax1.plot(2 * np.pi * r, r)
+    ax1.set_rmax(2)
+    view(ax2, ax1, scale_lines=False)
+    ax2.set_rmax(1)
+
+
+def build_recursive(fig):
+    ax = fig.gca()
+    ax.plot([0, 1], [0, 1])
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    inset = view(ax.inset_axes([0.5, 0.05, 0.45, 0.45]), ax, render_depth=20)
+    inset.set_xlim(0, 1)
+    inset.set_ylim(0, 1)
+    inset.set_min_render_size(4)
+
+
+def build_polygons(fig):
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 100, size=(5000, 1, 2))
+    polys = centers + rng.uniform(-0.5, 0.5, size=(5000, 6, 2))
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.add_collection(PolyCollection(polys, array=rng.random(5000)))
+    ax1.set_xlim(0, 100)
+    ax1.set_ylim(0, 100)
+    view(ax2, ax1)
+    ax2.set_xlim(10, 15)
+    ax2.set_ylim(10, 15)
+
+
+def build_mesh(fig):
+    x, y = np.meshgrid(np.linspace(0, 10, 100), np.linspace(0, 10, 100))
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.pcolormesh(np.sin(x) * np.cos(y))
+    ax1.tripcolor(
+        x.ravel() + 200, y.ravel(), (x * y).ravel(), shading="gouraud"
+    )
+    view(ax2, ax1)
+    ax2.set_xlim(40, 50)
+    ax2.set_ylim(40, 50)
+
+
+@pytest.mark.parametrize("builder, bounds", [
+    (build_inset_zoom, dict(
+        max_view_draws=5, max_primitives=235, max_vertices_transformed=7_700,
+        min_vertices_sliced=2_900, min_artists_culled=5,
+        max_pixels_produced=243_000
+    )),
+    (build_log_scatter, dict(
+        max_primitives=2, max_vertices_transformed=1_103,
+        min_vertices_sliced=897
+    )),
+    (build_3d, dict(
+        max_primitives=70, max_vertices_transformed=330,
+        min_paths_culled=1_400
+    )),
+    (build_polar, dict(max_primitives=1, max_vertices_transformed=200)),
+    (build_recursive, dict(
+        max_view_draws=6, max_primitives=720, max_vertices_transformed=24_500
+    )),
+    (build_polygons, dict(
+        max_primitives=18, max_vertices_transformed=120,
+        min_paths_culled=4_950
+    )),
+    (build_mesh, dict(max_primitives=2, max_vertices_transformed=76_000)),
+])
+def test_render_counts(builder, bounds):
+    fig = plt.figure(figsize=(8, 4))
+    builder(fig)
+    counts = record_view_counts(fig)
+    plt.close(fig)
+
+    for name, bound in bounds.items():
+        kind, stat = name.split("_", 1)
+        if (kind == "max"):
+            assert counts[stat] <= bound, f"{stat} regressed: {counts[stat]}"
+        else:
+            assert counts[stat] >= bound, f"{stat} regressed: {counts[stat]}"
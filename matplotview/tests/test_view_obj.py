@@ -1,3 +1,4 @@
+import pytest
 import matplotlib.pyplot as plt
 from matplotlib.testing.decorators import check_figures_equal
 from matplotview.tests.utils import plotting_test, matches_post_pickle
@@ -158,3 +159,1263 @@ def test_multiplot_pickle(fig_test):
     ax_test2.set_ylim(-0.5, 2.5)
 
     assert matches_post_pickle(fig_test)
+
+
+def test_culling_box_non_affine():
+    from matplotview._view_axes import _get_culling_box
+
+    fig = plt.figure()
+    ax_geo = fig.add_subplot(1, 2, 1, projection="hammer")
+    ax_polar = fig.add_subplot(1, 2, 2, projection="polar")
+
+    for ax in (ax_geo, ax_polar):
+        box = _get_culling_box(ax.get_xlim(), ax.get_ylim(), ax.transData)
+        # The culling region should cover the entire axes, even though the
+        # corners of the limits collapse onto each other in display space.
+        assert box is not None
+        assert box.width > 0 and box.height > 0
+        # It's padded by a pixel, and the gap between curves and samples.
+        ax_box = ax.get_window_extent()
+        assert np.all(box.min <= ax_box.min - 1)
+        assert np.all(box.max >= ax_box.max + 1)
+        assert np.allclose(box.extents, ax_box.extents, atol=2)
+
+    # Sub-regions should produce smaller culling regions...
+    box = _get_culling_box((0, 1), (0, 0.5), ax_geo.transData)
+    assert box.width < ax_geo.get_window_extent().width / 2
+
+    plt.close(fig)
+
+    # An artist on the boundary of a polar view, where the arc of the
+    # boundary bulges out the most between two of its samples, is drawn.
+    fig = plt.figure(figsize=(8, 4))
+    src = fig.add_subplot(1, 2, 1, projection="polar")
+    src.plot([np.pi - 0.01, np.pi + 0.01], [1, 1])
+    src.set_rlim(0, 1)
+    ax = view(fig.add_subplot(1, 2, 2, projection="polar"), src)
+    ax.set_xlim(0.1, 2 * np.pi - 0.1)
+    ax.set_rlim(0, 1)
+    ax.set_record_render_stats(True)
+    fig.canvas.draw()
+    stats = ax.get_render_stats()[src]
+    assert stats.artists_drawn == 1 and stats.artists_culled == 0
+    plt.close(fig)
+
+
+def test_transfer_transform_cache():
+    from matplotlib.path import Path
+    from matplotview._transform_renderer import _ViewTransferTransform
+
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    ax1.set_xscale("log")
+    ax2.set_xscale("log")
+    transfer = _ViewTransferTransform(ax1.transData, ax2.transData)
+
+    data = np.array([[1.0, 1.0], [10.0, 0.5], [100.0, 0.2]])
+    path = Path(ax1.transData.transform_non_affine(data))
+    expected = ax2.transData.transform(data)
+
+    assert np.allclose(transfer.transform_path_vertices(path), expected)
+    assert path in transfer._path_cache
+
+    # Panning only changes the affine part, so the cache should persist.
+    ax2.set_xlim(2, 50)
+    expected = ax2.transData.transform(data)
+    assert path in transfer._path_cache
+    assert np.allclose(transfer.transform_path_vertices(path), expected)
+
+    # Changing the scale invalidates the non-affine part...
+    ax2.set_xscale("linear")
+    assert path not in transfer._path_cache
+    expected = ax2.transData.transform(data)
+    assert np.allclose(transfer.transform_path_vertices(path), expected)
+
+    plt.close(fig)
+
+
+def test_render_stats():
+    from matplotview import RenderStats
+
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    ax1.plot(np.arange(10), "-o")
+    ax1.plot(np.arange(10) + 100)
+    ax1.imshow(np.random.rand(10, 10), origin="lower")
+    view(ax2, ax1, scale_lines=False)
+    ax2.set_xlim(0, 10)
+    ax2.set_ylim(0, 10)
+
+    # Disabled by default...
+    assert ax2.get_record_render_stats() is False
+    fig.canvas.draw()
+    assert ax2.get_render_stats() == {}
+
+    ax2.set_record_render_stats(True)
+    assert ax2.get_record_render_stats() is True
+    fig.canvas.draw()
+    stats = ax2.get_render_stats(reset=True)
+
+    assert list(stats) == [ax1]
+    s = stats[ax1]
+    assert isinstance(s, RenderStats)
+    assert s.view_draws == 1
+    assert s.artists_considered == 3
+    # Second line is way outside the view...
+    assert s.artists_culled == 1
+    assert s.artists_drawn == 2
+    assert s.primitives["draw_path"] >= 1
+    assert s.primitives["draw_markers"] == 1
+    assert s.vertices_transformed >= 20
+    assert s.images_resampled == 1
+    assert s.pixels_produced > 0
+    assert s.total_draw_time > 0
+    assert ax2.get_render_stats() == {}
+
+    fig.canvas.draw()
+    assert ax2.get_render_stats()[ax1].view_draws == 1
+
+    ax2.set_record_render_stats(False)
+    assert ax2.get_render_stats() == {}
+
+    plt.close(fig)
+
+
+def test_trace_views(tmp_path):
+    import json
+    from matplotview import trace_views
+
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    ax1.plot(np.arange(10))
+    ax1.set_label("source")
+    ax2 = view(ax2, ax1)
+    ax2.set_label("zoom")
+    ax2.set_xlim(2, 4)
+
+    trace_file = tmp_path / "trace.json"
+    with trace_views(trace_file) as tracer:
+        fig.canvas.draw()
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    assert events == json.loads(json.dumps(tracer.events))
+
+    # Events should be balanced, and nested within the view draw...
+    phases = [e["ph"] for e in events]
+    assert phases.count("B") == phases.count("E") > 1
+    assert events[0]["name"] == "View zoom" and events[0]["ph"] == "B"
+    assert events[-1]["name"] == "View zoom" and events[-1]["ph"] == "E"
+    assert events[0]["args"]["viewed_axes"] == ["source"]
+
+    artist_events = [e for e in events if e["cat"] == "artist"]
+    assert {"Line2D"} <= {e["args"]["artist_type"] for e in artist_events}
+    assert all(e["args"]["view"] == "zoom" for e in artist_events)
+    assert all(e["args"]["depth"] == 1 for e in artist_events)
+
+    # Not tracing outside the context...
+    n_events = len(tracer.events)
+    fig.canvas.draw()
+    assert len(tracer.events) == n_events
+
+    plt.close(fig)
+
+    # or in other threads tracing at the same time.
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    barrier = threading.Barrier(2)
+
+    def traced_draw(label):
+        fig, (ax1, ax2) = plt.subplots(1, 2)
+        ax1.plot(np.arange(10))
+        view(ax2, ax1).set_label(label)
+        with trace_views() as tracer:
+            barrier.wait()
+            fig.canvas.draw()
+            barrier.wait()
+        plt.close(fig)
+        return tracer.events
+
+    with ThreadPoolExecutor(2) as pool:
+        labels = ["zoom 1", "zoom 2"]
+        for label, events in zip(labels, pool.map(traced_draw, labels)):
+            assert len(events) > 0
+            assert {e["args"]["view"] for e in events} == {label}
+            assert len({e["tid"] for e in events}) == 1
+
+
+def test_reuse_vector_content():
+    import io
+
+    def build(reuse):
+        fig, ax = plt.subplots()
+        ax.plot(np.sin(np.linspace(0, 10, 1000)), "r")
+        ax.add_patch(plt.Circle((500, 0), 100, fc="blue"))
+        for i, loc in enumerate([[0.05, 0.05, 0.3, 0.3], [0.6, 0.6, 0.3, 0.3]]):
+            inset = inset_zoom_axes(ax, loc)
+            inset.view_specifications[ax].reuse_vector_content = reuse
+            inset.set_xlim(200 * i + 100, 200 * i + 400)
+            inset.set_ylim(-1, 1)
+        return fig
+
+    sizes = {}
+    for reuse in (False, True):
+        svg = io.StringIO()
+        fig = build(reuse)
+        fig.savefig(svg, format="svg")
+        svg = svg.getvalue()
+        sizes[reuse] = len(svg)
+        if (reuse):
+            # The circle and line are split by the axis in z-order, giving
+            # two definitions, each referenced by the axes and both views...
+            assert svg.count('<g id="view') == 2
+            assert svg.count('<use xlink:href="#view') == 6
+        else:
+            assert '<use xlink:href="#view' not in svg
+
+        pdf = io.BytesIO()
+        with plt.rc_context({"pdf.compression": 0}):
+            fig.savefig(pdf, format="pdf")
+        if (reuse):
+            assert pdf.getvalue().count(b"/MPV0 Do") == 3
+            assert pdf.getvalue().count(b"/MPV1 Do") == 3
+            assert b"/MPV2" not in pdf.getvalue()
+        plt.close(fig)
+
+    assert sizes[True] < sizes[False]
+
+    # The output of a scatter and a line is reused by four insets, whether
+    # they overlap or not, as the axes draws them as the definition.
+    def build_insets(reuse, step):
+        fig, ax = plt.subplots(figsize=(8, 8))
+        np.random.seed(0)
+        ax.scatter(*np.random.rand(2, 2000) * 100, s=4)
+        x = np.linspace(0, 100, 5000)
+        ax.plot(x, 50 + 40 * np.sin(x))
+        for i in range(4):
+            inset = view(fig.add_axes([0.15 + 0.19 * i, 0.7, 0.15, 0.15]), ax)
+            inset.view_specifications[ax].reuse_vector_content = reuse
+            inset.set_xlim(i * step, i * step + 20)
+            inset.set_ylim(20, 80)
+        return fig, ax
+
+    def save(fig, fmt):
+        out = io.BytesIO()
+        fig.savefig(out, format=fmt)
+        return out.getvalue()
+
+    for step in (2, 25):
+        for fmt in ("svg", "pdf"):
+            fig, ax = build_insets(False, step)
+            plain = save(fig, fmt)
+            plt.close(fig)
+            fig, ax = build_insets(True, step)
+            reused = save(fig, fmt)
+            assert not ax.stale
+            plt.close(fig)
+
+            assert len(reused) < len(plain) / 2
+            if (fmt == "svg"):
+                # Scatter and line definitions, used by the axes and insets.
+                assert reused.count(b'<use xlink:href="#view') == 10
+
+
+def test_reuse_pdf_forms(monkeypatch):
+    import io
+    from matplotlib.backends import backend_pdf
+    from matplotview._vector_reuse import _can_add_pdf_forms
+
+    # Forms are added through private state of the PDF file, which works
+    # with this matplotlib, but isn't trusted where it doesn't work...
+    assert _can_add_pdf_forms(backend_pdf.PdfFile(io.BytesIO()))
+
+    class NoMarkersFile(backend_pdf.PdfFile):
+        writeMarkers = None
+
+    class UnlistedFile(backend_pdf.PdfFile):
+        def finalize(self):
+            self.multi_byte_charprocs = {}
+            super().finalize()
+
+    for file_type in (NoMarkersFile, UnlistedFile):
+        assert not _can_add_pdf_forms(file_type(io.BytesIO()))
+
+    def save(reuse):
+        fig, ax = plt.subplots()
+        ax.plot(np.sin(np.linspace(0, 10, 1000)))
+        inset = inset_zoom_axes(ax, [0.1, 0.1, 0.3, 0.3])
+        inset.view_specifications[ax].reuse_vector_content = reuse
+        inset.set_xlim(100, 400)
+        inset.set_ylim(-1, 1)
+        out = io.BytesIO()
+        with plt.rc_context({"pdf.compression": 0}):
+            fig.savefig(out, format="pdf", metadata={"CreationDate": None})
+        plt.close(fig)
+        return out.getvalue()
+
+    plain = save(False)
+    assert save(True).count(b"/MPV0 Do") == 2
+
+    # Otherwise, content is drawn as usual.
+    monkeypatch.setattr(backend_pdf, "PdfFile", UnlistedFile)
+    assert save(True) == plain
+
+
+def test_rasterize_view_content():
+    import io
+    import pytest
+
+    assert ViewSpecification(rasterize=True).rasterize == "always"
+    assert ViewSpecification(rasterize=False).rasterize == "never"
+    assert ViewSpecification(rasterize="AUTO").rasterize == "auto"
+    with pytest.raises(ValueError):
+        ViewSpecification(rasterize="sometimes")
+
+    def build(rasterize, **kwargs):
+        np.random.seed(1)
+        fig, (ax1, ax2) = plt.subplots(1, 2)
+        ax1.scatter(*np.random.rand(2, 2000), s=2)
+        view(ax2, ax1)
+        spec = ax2.view_specifications[ax1]
+        spec.rasterize = rasterize
+        for k, v in kwargs.items():
+            setattr(spec, k, v)
+        return fig
+
+    def save_svg(fig):
+        svg = io.StringIO()
+        fig.savefig(svg, format="svg")
+        plt.close(fig)
+        return svg.getvalue()
+
+    vector = save_svg(build("never"))
+    assert "<image" not in vector
+
+    rasterized = save_svg(build("always", rasterize_dpi=50))
+    assert rasterized.count("<image") == 1
+    assert len(rasterized) < len(vector)
+    assert save_svg(build("always")).count("<image") == 1
+
+    # Automatic rasterization only kicks in above the thresholds.
+    assert "<image" in save_svg(build("auto", rasterize_primitive_threshold=1000))
+    assert "<image" not in save_svg(build("auto", rasterize_primitive_threshold=5000))
+
+    # Only what the view draws counts, a view zoomed in on a few points
+    # of the scatter, or a slice of a long line, stays vector.
+    fig = build("auto", rasterize_primitive_threshold=1000)
+    fig.axes[1].set_xlim(0.1, 0.2)
+    fig.axes[1].set_ylim(0.1, 0.2)
+    assert "<image" not in save_svg(fig)
+
+    def build_line(x_lim):
+        fig = build("auto", rasterize_vertex_threshold=5000)
+        fig.axes[0].collections[0].remove()
+        fig.axes[0].plot(np.linspace(0, 1, 20000), np.linspace(0, 1, 20000))
+        fig.axes[1].set_xlim(*x_lim)
+        return fig
+
+    assert "<image" in save_svg(build_line((0, 1)))
+    assert "<image" not in save_svg(build_line((0.1, 0.2)))
+
+    # Rasterizing to pdf works too, and raster backends are unaffected.
+    pdf = io.BytesIO()
+    fig = build("always")
+    fig.savefig(pdf, format="pdf")
+    fig.canvas.draw()
+
+    # Renderers without the (private) state needed to rasterize at a
+    # custom dpi draw vectors instead.
+    from matplotview._view_axes import _draw_rasterized_at_dpi
+    renderer = fig.canvas.get_renderer()
+    drawn = []
+    _draw_rasterized_at_dpi(renderer, 50, drawn.append)
+    assert drawn == [renderer]
+    plt.close(fig)
+
+
+def test_filter_set_types_and_predicates():
+    import pytest
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+    from matplotview._draw_state import _drawing_view
+
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    line, = ax1.plot([0, 1], [0, 1], label="keep")
+    hidden, = ax1.plot([0, 1], [1, 0], label="hide")
+    circle = ax1.add_patch(plt.Circle((0.5, 0.5), 0.1))
+    rect = ax1.add_patch(plt.Rectangle((0, 0), 0.1, 0.1))
+    view(ax2, ax1, filter_set=[Patch, lambda a: a.get_label() == "hide"])
+
+    def viewed_artists():
+        fig.canvas.draw()
+        with _drawing_view(ax2, fig.canvas.get_renderer()):
+            return [
+                a._artist for a in ax2.get_children()
+                if (type(a).__name__ == "_BoundRendererArtist")
+            ]
+
+    # Base classes filter out subclasses, predicates filter on a property.
+    assert viewed_artists() == [line]
+
+    # The filtered artists are cached until the children change...
+    cached = ax2._View__filtered_children[ax1]
+    artists = cached.artists
+    viewed_artists()
+    assert cached.artists is artists
+
+    new_line, = ax1.plot([0, 1], [0.5, 0.5])
+    assert viewed_artists() == [line, new_line]
+    new_line.remove()
+    assert viewed_artists() == [line]
+
+    # or the filter set is changed, in place or by replacement.
+    ax2.view_specifications[ax1].filter_set.add(Line2D)
+    assert viewed_artists() == []
+    ax2.view_specifications[ax1].filter_set = {hidden, circle}
+    assert viewed_artists() == [line, rect]
+
+    with pytest.raises(TypeError):
+        ViewSpecification(filter_set=[1])
+
+
+def test_streaming_line_incremental_transform():
+    from matplotview import StreamingLine2D
+    from matplotview._streaming import _RingBuffer
+
+    buffer = _RingBuffer(4)
+    buffer.append(np.arange(6).reshape(3, 2))
+    buffer.append(np.arange(6, 12).reshape(3, 2))
+    assert buffer.total == 6
+    np.testing.assert_array_equal(buffer.view()[:, 0], [4, 6, 8, 10])
+
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    ax1.set_yscale("log")
+    line = ax1.add_line(StreamingLine2D(1000))
+    view(ax2, ax1)
+    line.append(np.arange(100), np.arange(1, 101))
+    fig.canvas.draw()
+
+    transformed = []
+    transfer = ax2._View__transfer_transforms[ax1]
+    orig_transform = transfer.transform_non_affine
+
+    def counting_transform(values):
+        transformed.append(len(values))
+        return orig_transform(values)
+
+    transfer.transform_non_affine = counting_transform
+    line.append(np.arange(100, 110), np.arange(101, 111))
+    fig.canvas.draw()
+    assert transformed == [10]
+
+    # Changing the scale recomputes everything.
+    transformed.clear()
+    ax1.set_xscale("log")
+    fig.canvas.draw()
+    assert transformed == [110]
+    plt.close(fig)
+
+
+def test_data_provider_line():
+    from matplotview import MultiResolutionLineProvider, DataProviderLine2D
+
+    x = np.arange(1_000_000, dtype=float)
+    y = np.sin(x / 1000)
+    provider = MultiResolutionLineProvider.from_data(x, y)
+    assert len(provider.levels[1][0]) == 250_000
+    assert len(provider.levels[-1][0]) < 2048
+    np.testing.assert_allclose(provider.get_data_bounds(), [[0, 999_999], [-1, 1]])
+
+    requests = []
+
+    class LoggingProvider(MultiResolutionLineProvider):
+        def get_data(self, x_lim, y_lim, pixel_size):
+            data = super().get_data(x_lim, y_lim, pixel_size)
+            requests.append((tuple(x_lim), len(data[0])))
+            return data
+
+    fig, (ax1, ax2, ax3) = plt.subplots(1, 3)
+    ax1.add_line(DataProviderLine2D(LoggingProvider(provider.levels)))
+    ax1.autoscale_view()
+    assert ax1.get_xlim()[1] > 999_000
+
+    view(ax2, ax1)
+    ax2.set_xlim(5000, 5100)
+    view(ax3, ax1)
+    ax3.set_xlim(5000, 5100)
+    ax3.view_specifications[ax1].use_data_providers = False
+    requests.clear()
+    fig.canvas.draw()
+
+    # The overview uses an aggregated level, the view only loads the samples
+    # in its range, the view not using providers draws the overview data.
+    (overview_lim, overview_n), (detail_lim, detail_n) = requests
+    assert overview_lim == ax1.get_xlim() and overview_n < 10_000
+    assert detail_lim == (5000, 5100) and detail_n == 103
+
+    # Requests are cached...
+    requests.clear()
+    fig.canvas.draw()
+    assert requests == []
+    plt.close(fig)
+
+
+def test_data_provider_image(tmp_path):
+    from matplotview import MultiResolutionImageProvider, DataProviderImage
+
+    image = np.memmap(
+        tmp_path / "image.dat", dtype=np.uint8, mode="w+", shape=(3000, 2000)
+    )
+    image[:] = np.arange(2000) % 256
+    provider = MultiResolutionImageProvider.from_data(
+        image, extent=(0, 20, 0, 30), chunk_size=100_000
+    )
+    assert [level.shape for level in provider.levels] == [
+        (3000, 2000), (1500, 1000), (750, 500)
+    ]
+    # Pixels are averaged over blocks...
+    assert provider.levels[1][0, :3].tolist() == [0, 2, 4]
+    assert provider.get_data_bounds() == ((0, 20), (0, 30))
+
+    requests = []
+
+    class LoggingProvider(MultiResolutionImageProvider):
+        def get_data(self, x_lim, y_lim, pixel_size):
+            data = super().get_data(x_lim, y_lim, pixel_size)
+            requests.append((tuple(x_lim), data[0].shape))
+            return data
+
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    logging_provider = LoggingProvider(provider.levels, provider.extent)
+    ax1.add_image(DataProviderImage(ax1, logging_provider))
+    assert ax1.get_xlim() == (0, 20)
+
+    view(ax2, ax1)
+    ax2.set_xlim(10, 10.5)
+    ax2.set_ylim(10, 10.5)
+    requests.clear()
+    fig.canvas.draw()
+
+    # The overview uses the coarsest level, the view only reads the full
+    # resolution pixels in its limits.
+    (overview_lim, overview_shape), (detail_lim, detail_shape) = requests
+    assert overview_lim == (0, 20) and overview_shape == (750, 500)
+    assert detail_lim == (10, 10.5) and detail_shape == (52, 52)
+
+    # Requests are cached, and drawing in the view doesn't mark it stale.
+    requests.clear()
+    fig.canvas.draw()
+    assert requests == [] and not fig.stale
+
+    # Views outside of the image cull it, without requesting any data.
+    ax2.set_xlim(100, 101)
+    fig.canvas.draw()
+    assert requests == []
+    plt.close(fig)
+
+
+def test_update_interval():
+    import io
+    import pytest
+
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    line, = ax1.plot([0, 1], [0, 1], "r")
+    view(ax2, ax1)
+    assert ax2.get_update_interval() is None
+    with pytest.raises(ValueError):
+        ax2.set_update_interval(-1)
+
+    ax2.set_update_interval(60)
+    ax2.set_record_render_stats(True)
+
+    def view_pixels():
+        fig.canvas.draw()
+        (x0, y0), (x1, y1) = ax2.get_window_extent().get_points().astype(int)
+        height = fig.canvas.get_width_height()[1]
+        return np.asarray(fig.canvas.buffer_rgba())[
+            height - y1:height - y0, x0:x1
+        ].copy()
+
+    first = view_pixels()
+    # Changes to the viewed axes are not shown within the interval...
+    line.set_color("b")
+    assert np.array_equal(view_pixels(), first)
+    assert ax2.get_render_stats()[ax1].view_draws == 1
+
+    # but are when saving, or when the view's own limits change.
+    fig.savefig(io.BytesIO(), format="png")
+    assert ax2.get_render_stats()[ax1].view_draws == 2
+    ax2.set_xlim(-1, 2)
+    assert not np.array_equal(view_pixels(), first)
+    assert ax2.get_render_stats()[ax1].view_draws == 3
+
+    # Turning throttling off updates the view on every draw.
+    ax2.set_update_interval(None)
+    view_pixels()
+    view_pixels()
+    assert ax2.get_render_stats()[ax1].view_draws == 5
+
+    # Views with a transparent background aren't throttled, as their last
+    # output would cover changes beneath them.
+    ax2.set_update_interval(60)
+    ax2.patch.set_alpha(0.5)
+    view_pixels()
+    view_pixels()
+    assert ax2.get_render_stats()[ax1].view_draws == 7
+    plt.close(fig)
+
+
+def test_share_output(monkeypatch):
+    from matplotview._shared_output import _SharedOutputArtist
+    rendered = []
+    render = _SharedOutputArtist._render
+
+    def record_render(self, renderer):
+        pixels = render(self, renderer)
+        rendered.append(pixels.shape)
+        return pixels
+
+    monkeypatch.setattr(_SharedOutputArtist, "_render", record_render)
+
+    def build(share):
+        np.random.seed(1)
+        fig = plt.figure(figsize=(8, 4), dpi=100)
+        src = fig.add_axes([0.05, 0.1, 0.4, 0.8])
+        src.scatter(*np.random.rand(2, 500), c=np.random.rand(500))
+        src.imshow(np.random.rand(10, 10), extent=(0, 1, 0, 1), alpha=0.5)
+        views = []
+        for i in range(3):
+            ax = fig.add_axes([0.5 + 0.15 * i, 0.4, 0.1, 0.2])
+            view(ax, src)
+            ax.set_xlim(0.2, 0.4)
+            ax.set_ylim(0.2, 0.4)
+            ax.view_specifications[src].share_output = share
+            ax.set_record_render_stats(True)
+            views.append(ax)
+        # Different limits, so not shared.
+        views[2].set_xlim(0.5, 0.7)
+        fig.canvas.draw()
+        return fig, src, views
+
+    fig_ref, __, __ = build(False)
+    fig_test, src, views = build(True)
+
+    # Only the first of the identical views draws the viewed artists...
+    def drawn(ax):
+        return sum(ax.get_render_stats()[src].primitives.values())
+
+    assert drawn(views[0]) > 0
+    assert drawn(views[1]) == 0
+    assert drawn(views[2]) > 0
+    # into buffers only covering the views (80 x 80 pixels)...
+    assert len(rendered) == 2
+    assert all(h <= 81 and w <= 81 for h, w, __ in rendered)
+
+    # The result matches drawing every view.
+    ref = np.asarray(fig_ref.canvas.buffer_rgba()).astype(int)
+    test = np.asarray(fig_test.canvas.buffer_rgba()).astype(int)
+    assert np.abs(ref - test).max() <= 2
+
+    # The shared output is not reused in the next draw.
+    views[1].get_render_stats(reset=True)
+    views[0].get_render_stats(reset=True)
+    fig_test.canvas.draw()
+    assert drawn(views[0]) > 0
+    assert drawn(views[1]) == 0
+
+    # Views blitted after the viewed content changes don't show the output
+    # of a previous blit, but still share output with each other.
+    for fig in (fig_ref, fig_test):
+        fig.axes[0].collections[0].set_color("red")
+        for ax in fig.axes[1:3]:
+            fig.draw_artist(ax)
+    views[0].get_render_stats(reset=True)
+    views[1].get_render_stats(reset=True)
+    for fig in (fig_ref, fig_test):
+        fig.axes[0].collections[0].set_color("blue")
+        for ax in fig.axes[1:3]:
+            fig.draw_artist(ax)
+    assert drawn(views[0]) > 0
+    assert drawn(views[1]) == 0
+    ref = np.asarray(fig_ref.canvas.buffer_rgba()).astype(int)
+    test = np.asarray(fig_test.canvas.buffer_rgba()).astype(int)
+    assert np.abs(ref - test).max() <= 2
+    plt.close(fig_ref)
+    plt.close(fig_test)
+
+    # Polar views only differing in their theta offset don't share output.
+    from matplotview._shared_output import _get_output_key
+    fig = plt.figure(figsize=(6, 3), dpi=100)
+    src = fig.add_axes([0.05, 0.1, 0.4, 0.8])
+    polar = [
+        view(fig.add_axes([0.5 + 0.25 * i, 0.1, 0.2, 0.4], projection="polar"), src)
+        for i in range(2)
+    ]
+    fig.canvas.draw()
+    renderer = fig.canvas.get_renderer()
+    keys = [_get_output_key(ax, src, None, renderer) for ax in polar]
+    assert keys[0] == keys[1]
+    polar[1].set_theta_offset(np.pi / 2)
+    assert keys[0] != _get_output_key(polar[1], src, None, renderer)
+    plt.close(fig)
+
+
+def test_tile_cache():
+    def build(tile_size, scale_lines=False, src_lim=None):
+        np.random.seed(1)
+        fig = plt.figure(figsize=(6, 3), dpi=100)
+        src = fig.add_axes([0.05, 0.1, 0.4, 0.8])
+        src.scatter(*np.random.rand(2, 500), c=np.random.rand(500))
+        src.plot(np.linspace(0, 1, 50), np.random.rand(50), "k")
+        if (src_lim is not None):
+            src.set_xlim(src_lim)
+            src.set_ylim(src_lim)
+        ax = fig.add_axes([0.5, 0.1, 0.4, 0.8])
+        view(ax, src, scale_lines=scale_lines)
+        ax.view_specifications[src].tile_size = tile_size
+        ax.set_record_render_stats(True)
+        # Limits keeping the content on whole pixels...
+        ax.set_xlim(0, 0.48)
+        ax.set_ylim(0, 0.48)
+        fig.canvas.draw()
+        return fig, src, ax
+
+    def pan(fig, ax, dx):
+        x0, x1 = ax.get_xlim()
+        ax.set_xlim(x0 + dx, x1 + dx)
+        fig.canvas.draw()
+        return np.asarray(fig.canvas.buffer_rgba()).astype(int)
+
+    fig_ref, __, ax_ref = build(None)
+    fig_test, src, ax_test = build(64)
+    stats = ax_test.get_render_stats(reset=True)[src]
+    # 240 x 240 pixels, plus partial tiles...
+    assert stats.tiles_rendered == 16 and stats.tiles_reused == 0
+
+    # Panning reuses the visible tiles, and matches drawing directly (up to
+    # anti-aliasing of lines crossing tile edges).
+    ref = pan(fig_ref, ax_ref, 0.1)
+    test = pan(fig_test, ax_test, 0.1)
+    assert (np.abs(ref - test).max(axis=-1) > 2).mean() < 1e-3
+    stats = ax_test.get_render_stats(reset=True)[src]
+    assert stats.tiles_rendered == 4 and stats.tiles_reused == 16
+
+    # Changing the viewed artists drops the cache.
+    src.plot([0, 1], [1, 0])
+    fig_test.canvas.draw()
+    assert ax_test.get_render_stats(reset=True)[src].tiles_reused == 0
+    ax_test.clear_tile_cache()
+    fig_test.canvas.draw()
+    assert ax_test.get_render_stats(reset=True)[src].tiles_reused == 0
+    plt.close(fig_ref)
+    plt.close(fig_test)
+
+    # Zooming the viewed axes renders the tiles again, as scaled line
+    # widths and markers change...
+    fig_test, src, ax_test = build(64, True)
+    fig_ref, __, __ = build(64, True, (0, 0.5))
+    ax_test.get_render_stats(reset=True)
+    src.set_xlim(0, 0.5)
+    src.set_ylim(0, 0.5)
+    fig_test.canvas.draw()
+    assert ax_test.get_render_stats(reset=True)[src].tiles_reused == 0
+    np.testing.assert_array_equal(
+        np.asarray(fig_test.canvas.buffer_rgba()),
+        np.asarray(fig_ref.canvas.buffer_rgba())
+    )
+    plt.close(fig_ref)
+    plt.close(fig_test)
+
+
+def test_import_is_lazy():
+    import os
+    import subprocess
+    import sys
+    import matplotview
+
+    # Import in a fresh interpreter, with docstrings stripped, which
+    # docstring formatting must also handle...
+    code = "import sys, matplotview; print('\\n'.join(sys.modules))"
+    root = os.path.dirname(os.path.dirname(matplotview.__file__))
+    result = subprocess.run(
+        [sys.executable, "-OO", "-c", code],
+        cwd=root, capture_output=True, text=True, check=True
+    )
+    modules = set(result.stdout.split())
+
+    assert "matplotview" in modules
+    # Backends are only imported once something is drawn with them.
+    assert "matplotlib.backends.backend_agg" not in modules
+    assert "matplotlib.backends.backend_mixed" not in modules
+    assert "matplotlib.pyplot" not in modules
+
+
+def test_image_warp_mesh():
+    from matplotlib.transforms import Affine2D
+    from matplotlib.projections.polar import PolarAxes
+    from matplotview._image_warp import _WarpMeshCache
+
+    # From image pixels to a polar output image, wrapping around once...
+    transform = (
+        Affine2D().scale(2 * np.pi / 60, 1 / 40)
+        + PolarAxes.PolarTransform(apply_theta_transforms=False)
+        + Affine2D().scale(50).translate(50, 50)
+    )
+    cache = _WarpMeshCache()
+    warp = cache.get_transform("im", transform, 100, 100)
+
+    # Interpolated cells which aren't accurate enough are transformed
+    # exactly, including the cells the angle wraps around in.
+    pixels = np.stack(np.meshgrid(np.arange(100), np.arange(100)), axis=-1)
+    pixels = pixels.reshape(-1, 2).astype(float)
+    exact = transform.inverted().transform(pixels)
+    np.testing.assert_allclose(
+        warp.inverted().transform(pixels), exact, rtol=0, atol=0.15
+    )
+
+    # The mesh is reused until the transform changes.
+    assert cache.get_transform("im", transform, 100, 100)._mesh is warp._mesh
+    transform += Affine2D().translate(1, 0)
+    assert cache.get_transform("im", transform, 100, 100)._mesh is not warp._mesh
+    assert len(cache) == 1
+
+    # Cells with a singularity at their center, but not at their corners,
+    # are transformed exactly, while cells invalid as a whole are skipped.
+    from matplotlib.transforms import Transform
+    from matplotview._image_warp import (
+        _get_mesh_nodes, _interpolate_mesh, _refine_mesh
+    )
+
+    class HoleTransform(Transform):
+        input_dims = output_dims = 2
+
+        def __init__(self):
+            super().__init__()
+            self.transformed = 0
+
+        def transform_non_affine(self, values):
+            values = np.array(values, dtype=float)
+            self.transformed += len(values)
+            values[np.all(np.abs(values - 4) < 1, axis=-1)] = np.nan
+            values[np.all(values > 24, axis=-1)] = np.nan
+            return values
+
+    inverse = HoleTransform()
+    nodes = _get_mesh_nodes(33, 8)
+    points = np.stack(np.meshgrid(nodes, nodes), axis=-1).astype(float)
+    grid = inverse.transform(points.reshape(-1, 2)).reshape(points.shape)
+    mesh = _interpolate_mesh(grid, nodes, nodes, 33, 33)
+    assert np.all(np.isfinite(mesh[4, 4]))
+
+    inverse.transformed = 0
+    _refine_mesh(mesh, grid, nodes, nodes, inverse)
+    assert np.all(np.isnan(mesh[4, 4]))
+    # The 16 cell centers, and the 9 by 9 pixels of the cell with the hole,
+    # the last cell (with a NaN corner and center) is left alone.
+    assert inverse.transformed == 16 + 81
+
+
+def test_polar_view_of_image():
+    fig = plt.figure(figsize=(4, 2))
+    ax1 = fig.add_subplot(121)
+    ax2 = fig.add_subplot(122, projection="polar")
+    ax1.imshow(
+        np.zeros((10, 10)), extent=(0, 2 * np.pi, 0, 1),
+        cmap="gray", vmin=0, vmax=1
+    )
+    view(ax2, ax1)
+    ax2.set_ylim(0, 1)
+    ax2.grid(False)
+    ax2.set_axis_off()
+    fig.canvas.draw()
+
+    # The image covers the whole disk of the polar view...
+    buf = np.asarray(fig.canvas.buffer_rgba())
+    cx, cy = ax2.transAxes.transform((0.5, 0.75))
+    assert tuple(buf[buf.shape[0] - int(cy), int(cx), :3]) == (0, 0, 0)
+    plt.close(fig)
+
+
+def test_min_render_size():
+    fig, ax = plt.subplots(figsize=(4, 4), dpi=100)
+    ax.plot([0, 1], [0, 1])
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    # A view of the axes it's inset in, shrinking each level by ~0.45...
+    ax2 = view(ax.inset_axes([0.5, 0.05, 0.45, 0.45]), ax, render_depth=50)
+    ax2.set_xlim(0, 1)
+    ax2.set_ylim(0, 1)
+    ax2.set_record_render_stats(True)
+
+    assert ax2.get_min_render_size() is None
+    fig.canvas.draw()
+    assert ax2.get_render_stats(reset=True)[ax].view_draws == 50
+
+    # Levels are ~139, 63, 28, 13, 6, 3, 1.2 and 0.5 pixels wide.
+    ax2.set_min_render_size(1)
+    fig.canvas.draw()
+    assert ax2.get_render_stats(reset=True)[ax].view_draws == 7
+    ax2.set_min_render_size(8)
+    assert ax2.get_min_render_size() == 8
+    fig.canvas.draw()
+    assert ax2.get_render_stats(reset=True)[ax].view_draws == 4
+
+    with pytest.raises(ValueError):
+        ax2.set_min_render_size(0)
+    plt.close(fig)
+
+
+def test_concurrent_view_draws():
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Figures of a web service, with views of the same source axes...
+    src_fig, src = plt.subplots()
+    np.random.seed(0)
+    src.imshow(np.random.rand(20, 20), origin="lower", extent=(0, 10, 0, 10))
+    x = np.linspace(0, 10, 500)
+    src.plot(x, 5 + 4 * np.sin(3 * x), "-o")
+    src.scatter(*np.random.rand(2, 50) * 10)
+    src_fig.canvas.draw()
+    clips = [(a.get_clip_box(), a.get_clip_path()) for a in src.get_children()]
+
+    figs = []
+    for i in range(8):
+        fig, ax = plt.subplots(figsize=(2, 2))
+        view(ax, src)
+        ax.set_xlim(i * 0.5, 5 + i * 0.5)
+        ax.set_ylim(0, 10)
+        figs.append(fig)
+
+    def render(fig):
+        fig.canvas.draw()
+        return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    expected = [render(fig) for fig in figs]
+    with ThreadPoolExecutor(8) as pool:
+        for __ in range(5):
+            for ref, result in zip(expected, pool.map(render, figs)):
+                np.testing.assert_array_equal(ref, result)
+
+    # Drawing views never modifies the source artists.
+    assert clips == [
+        (a.get_clip_box(), a.get_clip_path()) for a in src.get_children()
+    ]
+    assert not src_fig.stale
+
+    plt.close(src_fig)
+    for fig in figs:
+        plt.close(fig)
+
+    # One figure saved to several vector outputs at once, with insets
+    # reusing the vector output of the source axes. The canvases are made
+    # up front, as making one replaces the canvas of the figure, which is
+    # at the 72 dpi both backends set while saving.
+    import io
+    from matplotlib.backends.backend_pdf import FigureCanvasPdf
+    from matplotlib.backends.backend_svg import FigureCanvasSVG
+
+    fig, src = plt.subplots(figsize=(6, 6), dpi=72)
+    src.plot(x, 5 + 4 * np.sin(3 * x), "-o")
+    src.scatter(*np.random.rand(2, 50) * 10)
+    for i in range(4):
+        ax = view(fig.add_axes([0.05 + 0.23 * i, 0.7, 0.2, 0.2]), src)
+        ax.view_specifications[src].reuse_vector_content = True
+        ax.set_xlim(i * 0.5, i * 0.5 + 3)
+        ax.set_ylim(0, 10)
+    fig.canvas.draw()
+    clips = [(a.get_clip_box(), a.get_clip_path()) for a in src.get_children()]
+
+    svg_canvas = FigureCanvasSVG(fig)
+    pdf_canvas = FigureCanvasPdf(fig)
+
+    def save(canvas):
+        out = io.BytesIO()
+        if (canvas is svg_canvas):
+            canvas.print_svg(out, metadata={"Date": None})
+        else:
+            canvas.print_pdf(out, metadata={"CreationDate": None})
+        return out.getvalue()
+
+    with plt.rc_context({"svg.hashsalt": "test", "pdf.compression": 0}):
+        expected = [save(svg_canvas), save(pdf_canvas)]
+        # Referenced by the source axes and the four insets...
+        assert expected[1].count(b"/MPV0 Do") == 5
+        with ThreadPoolExecutor(2) as pool:
+            for __ in range(5):
+                assert list(pool.map(save, [svg_canvas, pdf_canvas])) == expected
+
+    assert clips == [
+        (a.get_clip_box(), a.get_clip_path()) for a in src.get_children()
+    ]
+    assert not src.stale
+    plt.close(fig)
+
+
+def test_hit_test():
+    from matplotlib.backend_bases import MouseEvent
+
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    np.random.seed(0)
+    points = np.random.rand(10000, 2) * 100
+    scatter = ax1.scatter(*points.T)
+    line, = ax1.plot([0, 50, 100], [100, 50, 0])
+    view(ax2, ax1)
+    ax2.set_xlim(points[10, 0] - 1, points[10, 0] + 1)
+    ax2.set_ylim(points[10, 1] - 1, points[10, 1] + 1)
+
+    def event(x, y):
+        x, y = ax2.transData.transform((x, y))
+        return MouseEvent("motion_notify_event", fig.canvas, x, y)
+
+    assert ax2.hit_test(event(*points[10])) == (scatter, 10)
+    # The grid of each artist is kept between tests...
+    grid = ax2._View__hit_caches[ax1]._grids[scatter][2]
+    offset = ax2.transData.inverted().transform(
+        ax2.transData.transform(points[10]) + 3
+    )
+    assert ax2.hit_test(event(*offset)) == (scatter, 10)
+    assert ax2._View__hit_caches[ax1]._grids[scatter][2] is grid
+    assert ax2.hit_test(event(*offset), tolerance=2) is None
+
+    # until the points are replaced.
+    scatter.set_offsets(points[::-1])
+    assert ax2.hit_test(event(*points[10])) == (scatter, 9989)
+
+    # Line vertices can be hit, artists filtered out of the view can't.
+    ax2.set_xlim(49, 51)
+    ax2.set_ylim(49, 51)
+    assert ax2.hit_test(event(50, 50)) == (line, 1)
+    ax2.view_specifications[ax1].filter_set = {line}
+    assert ax2.hit_test(event(50, 50)) is None
+
+    # Events outside of the view don't hit anything.
+    outside = MouseEvent("motion_notify_event", fig.canvas, 1, 1)
+    assert ax2.hit_test(outside) is None
+    plt.close(fig)
+
+
+def test_view_many():
+    from matplotview import view_many
+
+    def build(bulk):
+        fig = plt.figure(figsize=(4, 4))
+        src = fig.add_subplot(111)
+        src.set_visible(False)
+        for i in range(16):
+            src.plot([i, i + 0.5], [i, i + 0.5])
+        # Collections have no extent, so are never culled.
+        src.scatter([3.5], [3.5])
+        axs = [
+            fig.add_axes([0.25 * (i % 4), 0.25 * (i // 4), 0.25, 0.25])
+            for i in range(16)
+        ]
+        views = view_many(axs, src) if (bulk) else [view(a, src) for a in axs]
+        for i, ax in enumerate(views):
+            ax.set_xlim(i, i + 1)
+            ax.set_ylim(i, i + 1)
+            ax.set_record_render_stats(True)
+        return fig, src, views
+
+    fig_ref, __, __ = build(False)
+    fig, src, views = build(True)
+    assert views == fig.axes[1:]
+
+    # Every artist's extent is computed once per draw, for all views...
+    calls = []
+    for line in src.lines:
+        orig = line.get_window_extent
+        line.get_window_extent = (
+            lambda *args, orig=orig: calls.append(1) or orig(*args)
+        )
+    fig.canvas.draw()
+    fig_ref.canvas.draw()
+    assert len(calls) == 16
+    np.testing.assert_array_equal(
+        np.asarray(fig.canvas.buffer_rgba()),
+        np.asarray(fig_ref.canvas.buffer_rgba())
+    )
+
+    # and each view only binds the artists within it.
+    stats = views[3].get_render_stats()[src]
+    assert stats.artists_considered == 17
+    assert stats.artists_drawn == 3
+    assert stats.artists_culled == 14
+
+    # Views which stop viewing leave the group's culling pass.
+    del views[0].view_specifications[src]
+    fig.canvas.draw()
+    assert len(calls) == 32
+
+    # Changing the limits of a view culls again, even when only the view is
+    # redrawn (blitting)...
+    fig.draw_artist(views[3])
+    views[3].set_xlim(5, 6)
+    views[3].set_ylim(5, 6)
+    views[3].reset_render_stats()
+    fig.draw_artist(views[3])
+    assert len(calls) == 64
+    stats = views[3].get_render_stats()[src]
+    assert stats.artists_drawn == 3
+    assert stats.artists_culled == 14
+
+    # and so does changing the data of an artist.
+    src.lines[0].set_data([5.2, 5.4], [5.2, 5.4])
+    views[3].reset_render_stats()
+    fig.draw_artist(views[3])
+    assert len(calls) == 80
+    stats = views[3].get_render_stats()[src]
+    assert stats.artists_drawn == 4
+    assert stats.artists_culled == 13
+
+    plt.close(fig)
+    plt.close(fig_ref)
+
+
+def test_collection_culling(monkeypatch):
+    from matplotlib.backend_bases import RendererBase
+    from matplotlib.collections import PolyCollection
+    from matplotlib.path import Path
+    from matplotlib.transforms import Affine2D
+    import matplotview._transform_renderer as transform_renderer
+    from matplotview._collection_culling import _take_collection_items
+
+    def build():
+        fig, (ax1, ax2) = plt.subplots(1, 2)
+        x, y = np.meshgrid(np.arange(20), np.arange(20))
+        square = np.array([[0, 0], [0.8, 0], [0.8, 0.8], [0, 0.8]])
+        polys = np.stack([x.ravel(), y.ravel()], -1)[:, None] + square
+        ax1.add_collection(PolyCollection(polys, array=np.arange(400)))
+        ax1.set_xlim(0, 20)
+        ax1.set_ylim(0, 20)
+        view(ax2, ax1)
+        ax2.set_xlim(5.5, 7.5)
+        ax2.set_ylim(5.5, 7.5)
+        ax2.set_record_render_stats(True)
+        fig.canvas.draw()
+        return fig, ax1, ax2
+
+    # Only the 9 polygons within the view are drawn...
+    fig, ax1, ax2 = build()
+    assert ax2.get_render_stats()[ax1].paths_culled == 391
+    culled = np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    # with the same result as drawing all of them.
+    monkeypatch.setattr(transform_renderer, "MIN_CULLED_ITEMS", 10 ** 9)
+    fig_ref, __, __ = build()
+    np.testing.assert_array_equal(
+        culled, np.asarray(fig_ref.canvas.buffer_rgba())
+    )
+    plt.close(fig)
+    plt.close(fig_ref)
+
+    # Items just outside of the view whose thick edges reach into it are
+    # kept...
+    def build_edges():
+        fig, (ax1, ax2) = plt.subplots(1, 2)
+        square = np.array([[0, 0], [0.3, 0], [0.3, 0.3], [0, 0.3]])
+        polys = [square + (7.6, y) for y in np.linspace(5.5, 7.5, 10)]
+        ax1.add_collection(PolyCollection(polys, ec="red", lw=5))
+        ax1.set_xlim(0, 20)
+        ax1.set_ylim(0, 20)
+        view(ax2, ax1)
+        ax2.set_xlim(5.5, 7.5)
+        ax2.set_ylim(5.5, 7.5)
+        fig.canvas.draw()
+        return fig, np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    fig_ref, edges_ref = build_edges()
+    monkeypatch.undo()
+    fig, edges = build_edges()
+    in_view = edges[60:420, 355:570].astype(int)
+    assert np.sum(in_view[..., 0] > in_view[..., 1] + 128) > 100
+    np.testing.assert_array_equal(edges, edges_ref)
+    plt.close(fig)
+    plt.close(fig_ref)
+
+    # Items are taken like RendererBase cycles paths, transforms, offsets
+    # and properties.
+    paths = [Path([[i, i]]) for i in range(3)]
+    transforms = np.array([
+        Affine2D().translate(i, 0).get_matrix() for i in range(4)
+    ])
+    offsets = np.arange(16).reshape(8, 2)
+    colors = np.arange(5)
+    items = np.arange(8)
+    taken = _take_collection_items(items, paths, transforms, offsets, colors)
+    path_ids = [
+        (path, tuple(trans.get_matrix()[0]))
+        for path, trans in RendererBase()._iter_collection_raw_paths(
+            Affine2D(), paths, transforms
+        )
+    ]
+    assert [
+        (p, tuple(t[0])) for p, t in zip(taken[0], taken[1])
+    ] == [path_ids[i % 4] for i in items]
+    np.testing.assert_array_equal(taken[2], offsets)
+    np.testing.assert_array_equal(taken[3], colors[items % 5])
+
+
+def test_line_slicing(monkeypatch):
+    from matplotlib.testing.compare import calculate_rms
+    import matplotview._line_slicing as line_slicing
+
+    # Simplification of the whole line differs slightly from the slice...
+    @plt.rc_context({"path.simplify": False})
+    def build():
+        fig, (ax1, ax2) = plt.subplots(1, 2)
+        x = np.linspace(0, 100, 5000)
+        line, = ax1.plot(x, np.sin(x), "r", lw=3)
+        ax1.set_xlim(0, 10)
+        view(ax2, ax1)
+        ax2.set_xlim(50, 52)
+        ax2.set_ylim(-1, 1)
+        ax2.set_record_render_stats(True)
+        fig.canvas.draw()
+        return fig, ax1, ax2, line
+
+    # Only the points within the x limits of the view (and a neighbor on
+    # each side) are drawn...
+    fig, ax1, ax2, line = build()
+    stats = ax2.get_render_stats()[ax1]
+    assert stats.vertices_sliced == 4898
+    assert stats.vertices_transformed == 102
+    assert len(line.get_xydata()) == 5000 and not line.stale
+    sliced = np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    # with the same result as drawing the whole line, which is not cut
+    # down to the x limits of the viewed axes.
+    monkeypatch.setattr(line_slicing, "MIN_SLICED_POINTS", 10 ** 9)
+    fig_ref, __, __, __ = build()
+    whole = np.asarray(fig_ref.canvas.buffer_rgba())
+    in_view = whole[:, 330:].astype(int)
+    assert np.sum(in_view[..., 0] > in_view[..., 1] + 128) > 2000
+    assert calculate_rms(sliced, whole) < 1
+    plt.close(fig)
+    plt.close(fig_ref)
+
+    # Unsorted lines aren't sliced.
+    monkeypatch.undo()
+    fig, ax = plt.subplots()
+    line, = ax.plot(np.random.rand(2000), np.random.rand(2000))
+    assert line_slicing._get_visible_slice(line, (0.2, 0.3)) is None
+    line.set_xdata(np.sort(line.get_xdata()))
+    visible = line_slicing._get_visible_slice(line, (0.3, 0.2))
+    x = line.get_xdata()
+    assert x[visible.start] < 0.2 <= x[visible.start + 1]
+    assert x[visible.stop - 2] <= 0.3 < x[visible.stop - 1]
+    plt.close(fig)
+
+    # Lines outside of the view are culled before being copied and sliced.
+    import matplotview._view_axes as view_axes
+    slices = []
+    monkeypatch.setattr(
+        view_axes, "_get_visible_slice",
+        lambda *args: slices.append(args) or line_slicing._get_visible_slice(
+            *args
+        )
+    )
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    ax1.plot(np.linspace(0, 100, 5000), np.zeros(5000))
+    view(ax2, ax1)
+    ax2.set_xlim(200, 210)
+    ax2.set_record_render_stats(True)
+    fig.canvas.draw()
+    assert ax2.get_render_stats()[ax1].artists_culled == 1
+    assert slices == []
+    plt.close(fig)
@@ -316,3 +316,161 @@ def test_log_scatter_with_colors(fig_test, fig_ref):
     ax2_ref.scatter(data, data, color=colors)
     ax2_ref.set_xlim(-5, 15)
     ax2_ref.set_ylim(-5, 15)
+
+
+@check_figures_equal()
+def test_log_line_view_pan(fig_test, fig_ref):
+    data = [i for i in range(1, 10)]
+
+    # Test case... Draw once to populate cached transforms, then pan.
+    ax1_test, ax2_test = fig_test.subplots(1, 2)
+
+    ax1_test.set(xscale="log", yscale="log")
+    ax1_test.plot(data, "-o")
+
+    view(ax2_test, ax1_test, scale_lines=False)
+    ax2_test.set(xscale="log", yscale="log")
+    ax2_test.set_xlim(1, 10)
+    ax2_test.set_ylim(1, 10)
+    fig_test.canvas.draw()
+    ax2_test.set_xlim(2, 5)
+    ax2_test.set_ylim(2, 5)
+
+    # Reference...
+    ax1_ref, ax2_ref = fig_ref.subplots(1, 2)
+
+    ax1_ref.set(xscale="log", yscale="log")
+    ax1_ref.plot(data, "-o")
+    ax2_ref.set(xscale="log", yscale="log")
+    ax2_ref.plot(data, "-o")
+    ax2_ref.set_xlim(2, 5)
+    ax2_ref.set_ylim(2, 5)
+
+
+@check_figures_equal()
+def test_streaming_line_view(fig_test, fig_ref):
+    from matplotview import StreamingLine2D
+
+    x = np.arange(1, 1001)
+    y = 2 + np.sin(x / 20)
+
+    # Test case... Append in chunks with draws in between, wrapping around
+    # the buffer, so the view reuses transformed samples.
+    ax1_test, ax2_test = fig_test.subplots(1, 2)
+    ax1_test.set(xscale="log", yscale="log", xlim=(300, 1000), ylim=(1, 3))
+    line = ax1_test.add_line(StreamingLine2D(500, lw=3, color="r"))
+    ax2_test = view(ax2_test, ax1_test, scale_lines=False)
+    ax2_test.set(yscale="log", xlim=(700, 900), ylim=(1, 3))
+    for i in range(0, 1000, 150):
+        line.append(x[i:i + 150], y[i:i + 150])
+        fig_test.canvas.draw()
+
+    assert line.get_sample_count() == 1000
+    assert len(line.get_xdata()) == line.get_capacity() == 500
+
+    # Reference...
+    ax1_ref, ax2_ref = fig_ref.subplots(1, 2)
+    ax1_ref.set(xscale="log", yscale="log", xlim=(300, 1000), ylim=(1, 3))
+    ax1_ref.plot(x[500:], y[500:], lw=3, color="r")
+    ax2_ref.set(yscale="log", xlim=(700, 900), ylim=(1, 3))
+    ax2_ref.plot(x[500:], y[500:], lw=3, color="r")
+
+
+@check_figures_equal()
+def test_data_provider_line_view(fig_test, fig_ref):
+    from matplotview import MultiResolutionLineProvider, DataProviderLine2D
+
+    x = np.arange(200_000, dtype=float)
+    y = np.sin(x / 50)
+    provider = MultiResolutionLineProvider.from_data(x, y)
+
+    # Test case... The view requests full resolution data for its range.
+    ax1_test, ax2_test = fig_test.subplots(1, 2)
+    ax1_test.add_line(DataProviderLine2D(provider, color="r"))
+    ax1_test.set_xlim(0, 1000)
+    ax1_test.set_ylim(-1, 1)
+    view(ax2_test, ax1_test, scale_lines=False)
+    ax2_test.set_xlim(150_000, 150_300)
+    ax2_test.set_ylim(-1, 1)
+
+    # Reference...
+    ax1_ref, ax2_ref = fig_ref.subplots(1, 2)
+    ax1_ref.plot(x[:1002], y[:1002], color="r")
+    ax1_ref.set_xlim(0, 1000)
+    ax1_ref.set_ylim(-1, 1)
+    ax2_ref.plot(x[149_999:150_302], y[149_999:150_302], color="r")
+    ax2_ref.set_xlim(150_000, 150_300)
+    ax2_ref.set_ylim(-1, 1)
+
+
+# Triangle points are rounded slightly differently through the view...
+@check_figures_equal(tol=0.02)
+def test_gouraud_triangles(fig_test, fig_ref):
+    x, y = np.meshgrid(np.linspace(0, 4, 30), np.linspace(0, 4, 30))
+    x, y = x.ravel(), y.ravel()
+    z = np.sin(x) * np.cos(y)
+
+    # Test case... Most triangles are outside the view, and culled.
+    ax1_test, ax2_test = fig_test.subplots(1, 2)
+    ax1_test.tripcolor(x, y, z, shading="gouraud")
+    view(ax2_test, ax1_test)
+    ax2_test.set_xlim(1, 2)
+    ax2_test.set_ylim(1.5, 2.5)
+
+    # Reference...
+    ax1_ref, ax2_ref = fig_ref.subplots(1, 2)
+    ax1_ref.tripcolor(x, y, z, shading="gouraud")
+    ax2_ref.tripcolor(x, y, z, shading="gouraud")
+    ax2_ref.set_xlim(1, 2)
+    ax2_ref.set_ylim(1.5, 2.5)
+
+
+@check_figures_equal(tol=0.02)
+def test_quad_mesh_sub_grid(fig_test, fig_ref):
+    x, y = np.meshgrid(np.linspace(0, 5, 41), np.linspace(0, 5, 31))
+    # A curvilinear grid, with per cell colors and edges...
+    y = y + 0.1 * np.sin(x)
+    z = np.cos(x[:-1, :-1]) * np.sin(y[:-1, :-1])
+
+    # Test case... The view only draws the cells near its limits.
+    ax1_test, ax2_test = fig_test.subplots(1, 2)
+    ax1_test.pcolormesh(x, y, z, edgecolors="k", linewidth=0.5)
+    view(ax2_test, ax1_test, scale_lines=False)
+    ax2_test.set_xlim(1.1, 2.3)
+    ax2_test.set_ylim(2.2, 3.1)
+
+    # Reference...
+    ax1_ref, ax2_ref = fig_ref.subplots(1, 2)
+    ax1_ref.pcolormesh(x, y, z, edgecolors="k", linewidth=0.5)
+    ax2_ref.pcolormesh(x, y, z, edgecolors="k", linewidth=0.5)
+    ax2_ref.set_xlim(1.1, 2.3)
+    ax2_ref.set_ylim(2.2, 3.1)
+
+
+@check_figures_equal(tol=0.02)
+def test_data_provider_image_view(fig_test, fig_ref):
+    from matplotview import MultiResolutionImageProvider, DataProviderImage
+
+    data = np.random.default_rng(0).random((60, 80))
+    provider = MultiResolutionImageProvider([data], extent=(0, 80, 0, 60))
+
+    # Test case... The view renders the part of the image it shows.
+    ax1_test, ax2_test = fig_test.subplots(1, 2)
+    ax1_test.add_image(
+        DataProviderImage(ax1_test, provider, interpolation="nearest")
+    )
+    ax1_test.invert_yaxis()
+    view(ax2_test, ax1_test)
+    ax2_test.set_xlim(20.5, 35.2)
+    ax2_test.set_ylim(40.3, 30)
+
+    # Reference...
+    ax1_ref, ax2_ref = fig_ref.subplots(1, 2)
+    for ax in (ax1_ref, ax2_ref):
+        ax.imshow(
+            data, extent=(0, 80, 0, 60), origin="lower",
+            interpolation="nearest", aspect="auto"
+        )
+    ax1_ref.invert_yaxis()
+    ax2_ref.set_xlim(20.5, 35.2)
+    ax2_ref.set_ylim(40.3, 30)
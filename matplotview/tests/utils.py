@@ -34,3 +34,41 @@ def plotting_test(num_figs=1, *args, **kwargs):
         return test_plotting
 
     return plotting_decorator
+
+
+def _get_all_axes(axes_list):
+    for ax in axes_list:
+        yield ax
+        yield from _get_all_axes(ax.child_axes)
+
+
+def record_view_counts(figure):
+    """
+    Draw a figure, recording the rendering statistics of all of its views
+    (including inset views), and return the deterministic counts summed
+    over all views and viewed axes. Timings are left out, so the counts can
+    be compared against fixed bounds.
+    """
+    from collections import Counter
+
+    views = [
+        ax for ax in _get_all_axes(figure.axes)
+        if (hasattr(ax, "set_record_render_stats"))
+    ]
+    for ax in views:
+        ax.set_record_render_stats(True)
+    figure.canvas.draw()
+
+    counts = Counter()
+    for ax in views:
+        for stats in ax.get_render_stats(reset=True).values():
+            counts["primitives"] += sum(stats.primitives.values())
+            counts.update({
+                name: getattr(stats, name) for name in (
+                    "view_draws", "artists_drawn", "artists_culled",
+                    "vertices_transformed", "vertices_sliced", "paths_culled",
+                    "pixels_produced"
+                )
+            })
+        ax.set_record_render_stats(False)
+    return counts